@@ -0,0 +1,68 @@
+"""
+Benchmark: term-wide measurement totals from Action objects vs. an ActionFrame.
+
+Both paths start from the same action rows (as streamed from the actions
+table). The object path deserializes every row, filters with
+get_actions_in_term() and sums the measurement dicts; the frame path builds
+an ActionFrame and calls get_term_measurement_totals(). Load and query times
+are reported separately, since a frame is typically loaded once and queried
+for many terms.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_action_frame
+    python -m benchmarks.bench_action_frame --rows 200000 --repeat 5
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from benchmarks.bench_deserialize import _action_rows
+from categoriae.actions import Action
+from categoriae.terms import GoalTerm
+from ethica.term_lifecycle import get_actions_in_term, get_term_measurement_totals
+from rhetorica.action_frame import ActionFrame
+from rhetorica.serializers import deserialize_many
+
+
+def _best_of(repeat: int, fn) -> tuple[float, object]:
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _object_totals(term: GoalTerm, actions: list) -> dict:
+    totals = {}
+    for action in get_actions_in_term(term, actions):
+        for unit, value in (action.measurement_units_by_amount or {}).items():
+            totals[unit] = totals.get(unit, 0.0) + value
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = _action_rows(args.rows)
+    term = GoalTerm(term_number=1, start_date=datetime(2025, 1, 15), target_date=datetime(2025, 3, 26))
+
+    load_objects_s, actions = _best_of(args.repeat, lambda: deserialize_many(rows, Action, json_decode=True))
+    load_frame_s, frame = _best_of(args.repeat, lambda: ActionFrame.from_records(rows))
+    query_objects_s, expected = _best_of(args.repeat, lambda: _object_totals(term, actions))
+    query_frame_s, totals = _best_of(args.repeat, lambda: get_term_measurement_totals(term, frame))
+
+    assert totals.keys() == expected.keys()
+    assert all(abs(totals[unit] - expected[unit]) < 1e-6 * max(1.0, expected[unit]) for unit in totals)
+
+    print(f"{'path':10} {'load s':>10} {'term totals s':>14}")
+    print(f"{'objects':10} {load_objects_s:10.3f} {query_objects_s:14.4f}")
+    print(f"{'frame':10} {load_frame_s:10.3f} {query_frame_s:14.4f}")
+
+
+if __name__ == '__main__':
+    main()
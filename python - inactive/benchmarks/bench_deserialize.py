@@ -0,0 +1,81 @@
+"""
+Benchmark: per-row deserialize() vs. column-wise deserialize_many().
+
+Decodes the same action rows (as returned by Database.query) both ways and
+reports time and the number of distinct measurement-unit key strings kept alive.
+start_time repeats across rows (one value per day of a 70-day term), so the
+batch path's memoized datetime decoding shows up; the uuid_as_str row skips
+UUID objects entirely, as the list endpoints do.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_deserialize
+    python -m benchmarks.bench_deserialize --rows 50000 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from categoriae.actions import Action
+from rhetorica.serializers import deserialize, deserialize_many
+
+UNITS = ['km', 'minutes', 'pages', 'reps', 'hours']
+
+
+def _action_rows(count: int) -> list[dict]:
+    """Rows shaped like SELECT * FROM actions."""
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    return [
+        {
+            'uuid_id': str(uuid4()),
+            'title': f'Benchmark action {n}',
+            'description': None,
+            'notes': None,
+            'log_time': (start + timedelta(minutes=17 * n)).isoformat(),
+            'measurement_units_by_amount': json.dumps({rng.choice(UNITS): rng.uniform(1, 50)}),
+            'start_time': (start + timedelta(days=n % 70, hours=7)).isoformat(),
+            'duration_minutes': rng.choice([None, 30.0, 45.0]),
+        }
+        for n in range(count)
+    ]
+
+
+def _distinct_unit_keys(actions: list) -> int:
+    return len({id(key) for a in actions for key in (a.measurement_units_by_amount or {})})
+
+
+def _best_of(repeat: int, fn) -> tuple[float, list]:
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = _action_rows(args.rows)
+
+    per_row_s, per_row = _best_of(args.repeat, lambda: [deserialize(r, Action, json_decode=True) for r in rows])
+    batch_s, batch = _best_of(args.repeat, lambda: deserialize_many(rows, Action, json_decode=True))
+    text_s, text = _best_of(args.repeat, lambda: deserialize_many(rows, Action, json_decode=True,
+                                                                  uuid_as_str=True))
+
+    print(f"{'path':20} {'seconds':>10} {'rows/s':>12} {'unit key objects':>18}")
+    for name, seconds, actions in [('deserialize', per_row_s, per_row),
+                                   ('deserialize_many', batch_s, batch),
+                                   ('  uuid_as_str', text_s, text)]:
+        print(f"{name:20} {seconds:10.3f} {args.rows / seconds:12.0f} {_distinct_unit_keys(actions):18}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: memory held by 100k loaded actions, slotted vs. per-instance __dict__.
+
+Categoriae entities are slotted dataclasses. For the "before" figure the same
+fields are rebuilt as a plain dataclass (one __dict__ per instance). Both are
+loaded from identical rows with deserialize_many, as ActionStorageService
+does, and tracemalloc reports what the resulting list keeps alive. The
+last column is the entity object itself (plus its __dict__), without the
+field values it references.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_entity_memory
+    python -m benchmarks.bench_entity_memory --rows 100000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+
+from benchmarks.bench_deserialize import _action_rows
+from categoriae.actions import Action
+from rhetorica.serializers import deserialize_many
+
+
+def _unslotted(cls: type) -> type:
+    """Same fields and defaults as cls, as a plain dataclass with __dict__."""
+    return make_dataclass(f'Dict{cls.__name__}', [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory, kw_only=f.kw_only))
+        for f in fields(cls)
+    ])
+
+
+def _retained_bytes(rows: list, entity_class: type) -> tuple[int, list]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = deserialize_many(rows, entity_class, json_decode=True)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, entities
+
+
+def _object_bytes(entity) -> int:
+    size = sys.getsizeof(entity)
+    if hasattr(entity, '__dict__'):
+        size += sys.getsizeof(entity.__dict__)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    rows = _action_rows(args.rows)
+
+    print(f"{'class':12} {'has __dict__':>12} {'MB retained':>12} {'bytes/action':>13} {'object bytes':>13}")
+    for entity_class in (_unslotted(Action), Action):
+        retained, entities = _retained_bytes(rows, entity_class)
+        has_dict = hasattr(entities[0], '__dict__')
+        print(f"{entity_class.__name__:12} {str(has_dict):>12} {retained / 1e6:12.1f} "
+              f"{retained / args.rows:13.0f} {_object_bytes(entities[0]):13}")
+        del entities
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: JSON encode/decode throughput per codec backend.
+
+Uses payloads shaped like the ones the app actually stores and serves:
+- measurement_units_by_amount (small dict per action row)
+- term_goals_by_id (term → goal summaries)
+- archive record_data (a whole row, with default=str for datetimes)
+- an API list response (GET /api/actions)
+
+Each backend in rhetorica.codec.AVAILABLE_BACKENDS is timed; 'json' is the
+stdlib baseline.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_json_codec
+    python -m benchmarks.bench_json_codec --count 20000 --repeat 5
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from rhetorica import codec
+
+UNITS = ['km', 'minutes', 'pages', 'reps', 'hours']
+
+
+def _payloads(count: int) -> dict:
+    """name → list of objects to encode."""
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+
+    measurements = [{rng.choice(UNITS): rng.uniform(1, 50)} for _ in range(count)]
+    term_goals = [
+        {str(uuid4()): {'title': f'Goal {g}', 'measurement_unit': rng.choice(UNITS),
+                        'measurement_target': 120.0, 'progress': rng.random()}
+         for g in range(10)}
+        for _ in range(count // 10)
+    ]
+    archive_rows = [
+        {'id': n, 'uuid_id': str(uuid4()), 'title': f'Action {n}', 'description': None,
+         'log_time': start + timedelta(minutes=17 * n), 'duration_minutes': 30.0,
+         'measurement_units_by_amount': '{"km":5.0}'}
+        for n in range(count)
+    ]
+    api_lists = [
+        {'actions': [{'id': str(uuid4()), 'title': f'Action {n}',
+                      'log_time': (start + timedelta(minutes=n)).isoformat(),
+                      'measurement_units_by_amount': measurements[n % count]}
+                     for n in range(100)],
+         'count': 100}
+        for _ in range(max(count // 100, 1))
+    ]
+    return {
+        'measurements': measurements,
+        'term_goals_by_id': term_goals,
+        'archive record_data': archive_rows,
+        'api action list': api_lists,
+    }
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.count)
+    previous = codec.backend
+
+    print(f"{'payload':22} {'backend':8} {'encode MB/s':>12} {'decode MB/s':>12}")
+    try:
+        for name, objects in payloads.items():
+            codec.set_backend('json')
+            texts = [codec.dumps(obj, default=str) for obj in objects]
+            megabytes = sum(len(t) for t in texts) / 1e6
+
+            for backend in codec.AVAILABLE_BACKENDS:
+                codec.set_backend(backend)
+                encode_s = _best_of(args.repeat, lambda: [codec.dumps(o, default=str) for o in objects])
+                decode_s = _best_of(args.repeat, lambda: [codec.loads(t) for t in texts])
+                print(f"{name:22} {backend:8} {megabytes / encode_s:12.1f} {megabytes / decode_s:12.1f}")
+    finally:
+        codec.set_backend(previous)
+
+
+if __name__ == '__main__':
+    main()
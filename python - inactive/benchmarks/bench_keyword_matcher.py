@@ -0,0 +1,47 @@
+"""
+Benchmark: per-keyword substring scans vs. the Aho–Corasick KeywordAutomaton.
+
+Matches random action titles against growing keyword sets and reports
+seconds per matcher. The crossover point is what AUTOMATON_MIN_KEYWORDS
+in ethica.matching_engine encodes.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_keyword_matcher
+    python -m benchmarks.bench_keyword_matcher --titles 20000 --keywords 16 64 256
+"""
+
+import argparse
+import random
+import string
+import time
+
+from ethica.keyword_automaton import KeywordAutomaton
+from ethica.matching_engine import SubstringKeywordMatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--titles', type=int, default=5000)
+    parser.add_argument('--keywords', type=int, nargs='+', default=[16, 64, 256, 1024, 4096])
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    words = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+             for _ in range(max(args.keywords))]
+    titles = [' '.join(rng.choice(words) for _ in range(5)) for _ in range(args.titles)]
+
+    print(f"{'keywords':>8} {'substring s':>12} {'automaton s':>12}")
+    for count in args.keywords:
+        patterns = {word: {n} for n, word in enumerate(words[:count])}
+        timings = []
+        for matcher_class in (SubstringKeywordMatcher, KeywordAutomaton):
+            matcher = matcher_class(patterns)
+            start = time.perf_counter()
+            for title in titles:
+                matcher.matches(title)
+            timings.append(time.perf_counter() - start)
+        print(f"{count:8} {timings[0]:12.4f} {timings[1]:12.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: pairwise infer_matches vs. the indexed MatchingEngine as goals grow.
+
+Goals are SmartGoals spread over two years (10-week periods, a handful of
+units and keywords each), actions are spread over the same two years. The
+pairwise loop costs O(actions x goals); the engine only visits goals whose
+period, unit and keywords can match. Both results are checked to be equal.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_matching_engine
+    python -m benchmarks.bench_matching_engine --actions 20000 --goals 10 40 160
+"""
+
+import argparse
+import json
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+
+from categoriae.actions import Action
+from categoriae.goals import SmartGoal
+from ethica.progress_matching import infer_matches, infer_matches_pairwise
+
+START = datetime(2024, 1, 1)
+ACTIVITIES = [('run', 'km'), ('yoga', 'minutes'), ('write', 'words'), ('read', 'pages'),
+              ('swim', 'meters'), ('lift', 'reps'), ('walk', 'steps'), ('piano', 'minutes')]
+
+
+def _goals(count: int, rng: random.Random) -> list:
+    goals = []
+    for n in range(count):
+        activity, unit = rng.choice(ACTIVITIES)
+        start = START + timedelta(days=rng.randint(0, 660))
+        goals.append(SmartGoal(
+            title=f'{activity} goal {n}', measurement_unit=unit, measurement_target=100.0,
+            start_date=start, target_date=start + timedelta(days=70),
+            how_goal_is_relevant='Benchmark',
+            how_goal_is_actionable=json.dumps({'units': [unit], 'keywords': [activity, f'{activity}ning']}),
+        ))
+    return goals
+
+
+def _actions(count: int, rng: random.Random) -> list:
+    actions = []
+    for n in range(count):
+        activity, unit = rng.choice(ACTIVITIES)
+        actions.append(Action(
+            f'Morning {activity} #{n}',
+            log_time=START + timedelta(minutes=rng.randint(0, 730 * 24 * 60)),
+            measurement_units_by_amount={unit: rng.uniform(1, 30)},
+        ))
+    return actions
+
+
+def _timed(fn) -> tuple[float, list]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--actions', type=int, default=5000)
+    parser.add_argument('--goals', type=int, nargs='+', default=[10, 40, 160, 640])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(7)
+    actions = _actions(args.actions, rng)
+
+    print(f"{'goals':>6} {'matches':>8} {'pairwise s':>11} {'indexed s':>10} {'speedup':>8}")
+    for goal_count in args.goals:
+        goals = _goals(goal_count, rng)
+        pairwise_s, expected = _timed(lambda: infer_matches_pairwise(actions, goals))
+        indexed_s, matches = _timed(lambda: infer_matches(actions, goals))
+        assert [(id(m.action), id(m.goal), m.contribution) for m in matches] == \
+               [(id(m.action), id(m.goal), m.contribution) for m in expected]
+        print(f"{goal_count:6} {len(matches):8} {pairwise_s:11.3f} {indexed_s:10.3f} {pairwise_s / indexed_s:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
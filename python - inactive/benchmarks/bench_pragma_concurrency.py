@@ -0,0 +1,110 @@
+"""
+Benchmark: read/write concurrency under different PRAGMA profiles.
+
+One writer thread saves actions one transaction at a time (like the UI saving
+an action) while reader threads list actions (like the API listing goals).
+Under the rollback journal ('default') readers stall behind the writer;
+under WAL ('server') they read a consistent snapshot without waiting.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_pragma_concurrency
+    python -m benchmarks.bench_pragma_concurrency --seconds 5 --readers 4
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from config import SCHEMA_PATH
+from politica.database import Database
+
+
+def _action_record(n: int) -> dict:
+    return {
+        'uuid_id': str(uuid4()),
+        'title': f'Benchmark action {n}',
+        'log_time': '2025-10-01T08:00:00',
+        'measurement_units_by_amount': '{"km": 5.0}',
+    }
+
+
+def run_profile(profile: str, workdir: Path, seconds: float, readers: int, seed_rows: int) -> dict:
+    """Run writer + readers against a fresh database using the given profile."""
+    db = Database(db_path=workdir / f'{profile}.db', schema_dir=SCHEMA_PATH,
+                  pool_size=readers + 1, pragma_profile=profile)
+    db.insert('actions', [_action_record(n) for n in range(seed_rows)])
+
+    stop = threading.Event()
+    counts = {'writes': 0, 'reads': 0, 'lock_errors': 0}
+    read_latencies = []
+    lock = threading.Lock()
+
+    def writer():
+        n = seed_rows
+        while not stop.is_set():
+            try:
+                db.insert('actions', [_action_record(n)])
+                n += 1
+                with lock:
+                    counts['writes'] += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts['lock_errors'] += 1
+
+    def reader():
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                db.query('actions', filters={'title': 'Benchmark action 1'})
+            except sqlite3.OperationalError:
+                with lock:
+                    counts['lock_errors'] += 1
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                counts['reads'] += 1
+                read_latencies.append(elapsed)
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    db.close()
+
+    read_latencies.sort()
+    p99 = read_latencies[int(len(read_latencies) * 0.99)] if read_latencies else 0.0
+    return {
+        'profile': profile,
+        'writes_per_s': counts['writes'] / seconds,
+        'reads_per_s': counts['reads'] / seconds,
+        'read_p99_ms': p99 * 1000,
+        'lock_errors': counts['lock_errors'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seed-rows', type=int, default=2000)
+    parser.add_argument('--profiles', nargs='+', default=['default', 'server'])
+    args = parser.parse_args()
+
+    print(f"{'profile':12} {'writes/s':>10} {'reads/s':>10} {'read p99 ms':>12} {'lock errors':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            r = run_profile(profile, Path(tmp), args.seconds, args.readers, args.seed_rows)
+            print(f"{r['profile']:12} {r['writes_per_s']:10.0f} {r['reads_per_s']:10.0f} "
+                  f"{r['read_p99_ms']:12.2f} {r['lock_errors']:12}")
+
+
+if __name__ == '__main__':
+    main()
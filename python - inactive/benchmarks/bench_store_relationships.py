@@ -0,0 +1,91 @@
+"""
+Benchmark: persisting an inference session row by row vs. one bulk upsert.
+
+The per-row path replays what store_relationships() used to do for each
+relationship: look up the action and the goal, check for an existing pair,
+then insert - four round trips and a commit per relationship. The bulk path
+is upsert_relationships(): IN (...) lookups, then executemany() with
+ON CONFLICT DO NOTHING in a single transaction. Both write into fresh
+databases with the 'server' profile; the row counts are checked to match.
+
+Usage (from the python directory):
+    python -m benchmarks.bench_store_relationships
+    python -m benchmarks.bench_store_relationships --relationships 500 5000
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from categoriae.actions import Action
+from categoriae.goals import Goal
+from categoriae.relationships import ActionGoalRelationship
+from config import SCHEMA_PATH
+from politica.database import Database
+from rhetorica.progress_storage import ActionGoalProgressStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+
+GOALS = 8
+
+
+def _session(db: Database, count: int) -> list:
+    """Store count actions and GOALS goals; match each action to one goal."""
+    goals = [Goal(title=f'Goal {n}', measurement_target=100.0) for n in range(GOALS)]
+    actions = [Action(f'Action {n}', log_time=datetime(2025, 1, 1) + timedelta(minutes=n),
+                      measurement_units_by_amount={'km': 1.0}) for n in range(count)]
+    GoalStorageService(database=db).store_many_instances(goals)
+    ActionStorageService(database=db).store_many_instances(actions)
+    return [ActionGoalRelationship(action=action, goal=goals[n % GOALS], contribution=1.0,
+                                   assignment_method='auto_inferred', confidence=0.9)
+            for n, action in enumerate(actions)]
+
+
+def _per_row(db: Database, relationships: list) -> None:
+    for rel in relationships:
+        action_id, goal_id = str(rel.action.uuid_id), str(rel.goal.uuid_id)
+        db.query('actions', filters={'uuid_id': action_id}, columns=['uuid_id'])
+        db.query('goals', filters={'uuid_id': goal_id}, columns=['uuid_id'])
+        if db.query('action_goal_progress', filters={'action_id': action_id, 'goal_id': goal_id}):
+            continue
+        db.insert('action_goal_progress', [{
+            'uuid_id': str(uuid4()), 'action_id': action_id, 'goal_id': goal_id,
+            'contribution': rel.contribution, 'match_method': rel.assignment_method,
+            'confidence': rel.confidence,
+        }])
+
+
+def _timed(db: Database, relationships: list, store) -> float:
+    start = time.perf_counter()
+    store(db, relationships)
+    elapsed = time.perf_counter() - start
+    assert len(db.query('action_goal_progress', columns=['uuid_id'])) == len(relationships)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--relationships', type=int, nargs='+', default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    bulk = lambda db, rels: ActionGoalProgressStorageService(database=db).upsert_relationships(rels)
+
+    print(f"{'rows':>6} {'per-row ms':>11} {'bulk ms':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.relationships:
+            timings = []
+            for name, store in (('per_row', _per_row), ('bulk', bulk)):
+                db = Database(db_path=Path(tmp) / f'{name}-{count}.db', schema_dir=SCHEMA_PATH,
+                              pragma_profile='server')
+                timings.append(_timed(db, _session(db, count), store))
+                db.close()
+            per_row_s, bulk_s = timings
+            print(f"{count:6} {per_row_s * 1000:11.1f} {bulk_s * 1000:8.1f} {per_row_s / bulk_s:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,7 @@ from typing import Optional, Dict
 from categoriae.ontology import PersistableEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class Action(PersistableEntity):
     """
     An action taken at a point in time.
@@ -16,7 +16,7 @@ from typing import Optional
 from categoriae.ontology import PersistableEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class ThingIWant(PersistableEntity):
     """
     Parent class: Broadest concept - things that have a description.
@@ -26,7 +26,7 @@ class ThingIWant(PersistableEntity):
     pass
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(slots=True)
 class Goal(ThingIWant):
     """
     A general objective that may or may not be time-bound.
@@ -39,8 +39,10 @@ class Goal(ThingIWant):
     - Persistence: id, created_at (like PersistableEntity pattern)
     - Optional: All measurement and time-bound fields
 
-    Note: unsafe_hash=True allows Goal objects to be used as dictionary keys
-    (required by progress_aggregation.py) while remaining mutable.
+    Note: Goals hash by identity (uuid_id), not by field values, so a goal
+    stays findable as a dict/set key after its title or target is edited, and
+    hashing never walks long text fields. Equality still compares all fields;
+    equal goals share a uuid_id and therefore a hash.
     """
     # Persistence infrastructure (with defaults, like PersistableEntity)
     goal_type: str = 'Goal'  # Class identifier for polymorphic storage
@@ -56,6 +58,10 @@ class Goal(ThingIWant):
 
 
 
+    def __hash__(self) -> int:
+        """Identity hash: the goal's uuid_id"""
+        return hash(self.uuid_id)
+
     def is_time_bound(self) -> bool:
         """Check if this goal has defined start and target dates"""
         return self.start_date is not None and self.target_date is not None
@@ -65,7 +71,7 @@ class Goal(ThingIWant):
         return self.measurement_unit is not None and self.measurement_target is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class Milestone(Goal):
     """
     A significant checkpoint within a larger goal or term.
@@ -81,6 +87,9 @@ class Milestone(Goal):
     """
     goal_type: str = 'Milestone'  # Override parent's goal_type
 
+    # @dataclass (eq=True) would otherwise set __hash__ = None on the subclass
+    __hash__ = Goal.__hash__
+
     def __post_init__(self):
         """
         Post-initialization to ensure milestones don't have date ranges.
@@ -94,7 +103,7 @@ class Milestone(Goal):
             raise ValueError("Milestone requires a target_date")
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartGoal(Goal):
     """
     SMART goal with strict validation and required fields.
@@ -120,6 +129,9 @@ class SmartGoal(Goal):
     """
     goal_type: str = 'SmartGoal'  # Override parent's goal_type
 
+    # @dataclass (eq=True) would otherwise set __hash__ = None on the subclass
+    __hash__ = Goal.__hash__
+
     def __post_init__(self):
         """Validate SMART criteria after initialization"""
         # Validate Measurable
@@ -4,6 +4,10 @@ Base entity classes for domain model.
 Provides shared infrastructure (id, timestamps) that all entities inherit.
 Children differentiate by adding required fields that define their essence.
 
+Entities are slotted dataclasses (slots=True): no per-instance __dict__, so
+tens of thousands of loaded actions stay compact and only declared fields can
+be assigned. Subclasses must use slots=True as well, or they regain a __dict__.
+
 Written by Claude Code on 2025-10-16
 Updated by Claude Code on 2025-10-21 to add UUID support
 """
@@ -14,7 +18,7 @@ from typing import Optional
 from datetime import datetime
 from uuid import UUID, uuid4
 
-@dataclass
+@dataclass(slots=True)
 class IndependentEntity(ABC):
     title: str
     # UUID and database fields use kw_only to maintain backward compatibility
@@ -26,7 +30,7 @@ class IndependentEntity(ABC):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistableEntity(IndependentEntity):
     """
     Base infrastructure for entities that can be stored in database.
@@ -39,7 +43,7 @@ class PersistableEntity(IndependentEntity):
     log_time: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class DerivedEntity(ABC):
     """
     Base class for relationships computed from existing entities.
@@ -14,7 +14,7 @@ from categoriae.goals import Goal
 from categoriae.ontology import DerivedEntity
 from categoriae.values import MajorValues
 
-@dataclass
+@dataclass(slots=True)
 class ActionGoalRelationship(DerivedEntity):
     """
     Represents a discovered or assigned relationship between an action and a goal.
@@ -41,7 +41,7 @@ class ActionGoalRelationship(DerivedEntity):
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MajorValueAlignment(DerivedEntity):
     """
     Represents alignment between a goal and a personal value.
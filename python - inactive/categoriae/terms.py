@@ -25,7 +25,7 @@ from categoriae.ontology import DerivedEntity, IndependentEntity
 MN_LIFE_EXPECTANCY_YEARS = 79  # CDC Minnesota life expectancy
 DAYS_PER_YEAR = 365.25 
 
-@dataclass
+@dataclass(slots=True)
 class TimeFrame(IndependentEntity):
     """
     Abstract base for all time-bounded planning horizons.
@@ -36,7 +36,7 @@ class TimeFrame(IndependentEntity):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalTerm(TimeFrame):
     """
     Goal term -- a fundamental unit of structured planning. The idea of a "term" is inspired by academic terms but adapted for personal productivity. It should be long enough to make meaningful progress on goals, but short enough to maintain focus and urgency.
@@ -96,7 +96,7 @@ class GoalTerm(TimeFrame):
             return elapsed_days / total_days
 
 
-@dataclass
+@dataclass(slots=True)
 class YearlyPlan(TimeFrame):
     """
     Annual planning horizon - typically 5 terms.
@@ -123,7 +123,7 @@ class YearlyPlan(TimeFrame):
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class LifeTime(DerivedEntity):
     """
     Memento Mori
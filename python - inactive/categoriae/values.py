@@ -24,7 +24,7 @@ class PriorityLevel(int):
         return int.__new__(cls, value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Incentives(PersistableEntity):
     """
     Base class for Values, LifeAreas, and HighestOrderValues.
@@ -39,7 +39,7 @@ class Incentives(PersistableEntity):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Values(Incentives):
     """
     Personal incentives that align with beliefs about what is worthwhile.
@@ -53,7 +53,7 @@ class Values(Incentives):
     priority: PriorityLevel = PriorityLevel(40)  # Values default to priority 40
 
 
-@dataclass
+@dataclass(slots=True)
 class LifeAreas(Incentives):
     """
     Domains of life that provide meaning, structure, and motivation.
@@ -69,7 +69,7 @@ class LifeAreas(Incentives):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class MajorValues(Values):
     """
     This is a middle place between Values and HighestOrderValues. HighestOrderValues are meant to be very abstract and not actionable, whereas Values are meant to be more general and diffuse. MajorValues are meant to represent a small selection of actionable values. Actions and Goals should reflect MajorValues, and it should be a concern if MajorValues are set and not reflected in Actions or Goals. This is a way of noticing misalignment, distraction, drift, etc. That need not be the cause for Values, more generally, where one might value all sorts of things and even affirm those values, without necesserily incorporating them regularly into one's tracked actions and goals.
@@ -84,7 +84,7 @@ class MajorValues(Values):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class HighestOrderValues(Values):
     """
     I mean for this to be a high-level, abstract concept. I might not use the class, but in my thinking about how to set goals, it was helpful to start with a sense of my highest-order values. These largely aren't actionable in a daily or even monthly sense. They might show up if I develop dashboard features as a cute or gentle way of personalizing the application. They might be helpful if I develop features for setting more goals or identifying values. For now, it's here to flesh out the inheritance structure and cue me to think about how good design allows for extension.
@@ -5,6 +5,12 @@ from .settings import (
     STORAGE_DIR,
     DB_PATH,
     SCHEMA_PATH,
+    DB_POOL_SIZE,
+    DB_PRAGMA_PROFILE,
+    DB_PRAGMA_OVERRIDES,
+    DB_BULK_CHUNK_SIZE,
+    DB_FETCH_BATCH_SIZE,
+    JSON_BACKEND,
     LOG_DIR,
     LOG_LEVEL,
 )
@@ -14,6 +20,12 @@ __all__ = [
     'STORAGE_DIR',
     'DB_PATH',
     'SCHEMA_PATH',
+    'DB_POOL_SIZE',
+    'DB_PRAGMA_PROFILE',
+    'DB_PRAGMA_OVERRIDES',
+    'DB_BULK_CHUNK_SIZE',
+    'DB_FETCH_BATCH_SIZE',
+    'JSON_BACKEND',
     'LOG_DIR',
     'LOG_LEVEL',
 ]
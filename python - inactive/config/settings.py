@@ -19,6 +19,16 @@ STORAGE_DIR = PROJECT_ROOT / config["storage"]["data_dir"]
 DB_PATH = STORAGE_DIR / config["storage"]["db_name"]
 SCHEMA_PATH = PROJECT_ROOT / config["storage"]["schema_dir"]
 
+# Database connection settings
+DB_POOL_SIZE = config["database"]["pool_size"]
+DB_PRAGMA_PROFILE = config["database"]["pragma_profile"]
+DB_PRAGMA_OVERRIDES = config["database"].get("pragmas", {})
+DB_BULK_CHUNK_SIZE = config["database"]["bulk_chunk_size"]
+DB_FETCH_BATCH_SIZE = config["database"]["fetch_batch_size"]
+
+# Serialization
+JSON_BACKEND = config["serialization"]["json_backend"]
+
 # Logging
 LOG_DIR = PROJECT_ROOT / config["logging"]["log_dir"]
 LOG_LEVEL = config["logging"]["level"]
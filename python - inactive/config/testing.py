@@ -18,6 +18,9 @@ TEST_DB_PATH = TEST_DATA_DIR / 'testing.db'
 # Use same schemas as production
 SCHEMA_PATH = PROJECT_ROOT / 'shared' / 'schemas'
 
+# Fast, non-durable PRAGMA settings for throwaway test databases
+TEST_PRAGMA_PROFILE = 'test'
+
 
 def clean_test_database():
     """
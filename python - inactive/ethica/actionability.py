@@ -0,0 +1,182 @@
+"""
+Compiled goal actionability hints.
+
+A goal's how_goal_is_actionable is JSON text like
+    {"units": ["km", "miles"], "keywords": ["run", "jog*"]}
+Matching used to parse and normalize it for every (action, goal) pair. Here it
+is compiled once into an ActionabilitySpec - frozen unit set, normalized
+keywords, precompiled keyword regex - and cached per goal.
+
+The cache is keyed by goal uuid_id and checked against the hint text, so an
+edited goal is re-parsed on its next lookup even if nobody invalidates it.
+Callers that update or delete goals can still drop entries eagerly with
+invalidate_actionability_spec().
+
+Pure business logic: no database, no I/O.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Pattern, Tuple
+from uuid import UUID
+
+from categoriae.goals import Goal
+from config.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Distinct goals whose compiled hints are kept
+SPEC_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class ActionabilitySpec:
+    """
+    Parsed, normalized how_goal_is_actionable hints for one goal.
+
+    Attributes:
+        units: Allowed measurement units, lowercased and stripped
+        keywords: Title keywords, lowercased, stripped, without '*' wildcards
+        keyword_pattern: Compiled alternation of keywords (substring search)
+    """
+    units: frozenset
+    keywords: Tuple[str, ...]
+    keyword_pattern: Pattern
+
+    @classmethod
+    def parse(cls, goal: Goal) -> Optional['ActionabilitySpec']:
+        """
+        Compile a goal's hints.
+
+        Args:
+            goal: Goal with optional how_goal_is_actionable JSON
+
+        Returns:
+            ActionabilitySpec, or None when the goal falls back to plain
+            measurement_unit matching (no hints, malformed JSON, or empty
+            unit/keyword lists)
+        """
+        text = getattr(goal, 'how_goal_is_actionable', None)
+        if not text:
+            return None
+
+        try:
+            data = json.loads(text)
+            units = [u.lower().strip() for u in data.get('units', [])]
+            keywords = [k.lower().strip().replace('*', '').strip()
+                        for k in data.get('keywords', []) if k.strip()]
+        except (json.JSONDecodeError, AttributeError, TypeError) as e:
+            logger.warning(
+                f"Malformed how_goal_is_actionable JSON for goal '{goal.title[:50]}...': {e}. "
+                f"Value was: {text!r}. Falling back to simple unit matching."
+            )
+            return None
+
+        if not units or not keywords:
+            logger.debug(
+                f"Empty how_goal_is_actionable hints for goal '{goal.title[:50]}...'. "
+                f"Units: {units}, Keywords: {keywords}. Falling back to simple unit matching."
+            )
+            return None
+
+        keywords = tuple(dict.fromkeys(keywords))
+        pattern = re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+        return cls(units=frozenset(units), keywords=keywords, keyword_pattern=pattern)
+
+    def first_allowed_amount(self, measurements: dict) -> Optional[float]:
+        """
+        Value of the first measurement (in dict order) whose unit is allowed.
+
+        Returns:
+            That value, or None if no unit is allowed (or its value is None)
+        """
+        for key, value in measurements.items():
+            if key.lower() in self.units:
+                return value
+        return None
+
+    def matches_title(self, title_lower: str) -> bool:
+        """True if any keyword occurs in the (lowercased) title."""
+        return self.keyword_pattern.search(title_lower) is not None
+
+
+class ActionabilitySpecCache:
+    """
+    Bounded LRU of compiled specs, keyed by goal uuid_id.
+
+    Each entry remembers the hint text it was compiled from; a lookup with
+    different text re-parses, so stale specs are never returned.
+
+    Args:
+        maxsize: Maximum number of goals kept
+    """
+
+    def __init__(self, maxsize: int = SPEC_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[UUID, Tuple[Optional[str], Optional[ActionabilitySpec]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, goal: Goal) -> Optional[ActionabilitySpec]:
+        """Compiled spec for goal (parsed at most once per hint text)."""
+        text = getattr(goal, 'how_goal_is_actionable', None)
+        key = goal.uuid_id
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == text:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        spec = ActionabilitySpec.parse(goal)
+
+        with self._lock:
+            self._entries[key] = (text, spec)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return spec
+
+    def invalidate(self, goal_uuid: Optional[UUID] = None) -> None:
+        """Drop one goal's spec, or every spec when goal_uuid is None."""
+        with self._lock:
+            if goal_uuid is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(goal_uuid, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_spec_cache = ActionabilitySpecCache()
+
+
+def get_actionability_spec(goal: Goal) -> Optional[ActionabilitySpec]:
+    """
+    Compiled actionability hints for a goal, from the shared cache.
+
+    Args:
+        goal: Goal to compile hints for
+
+    Returns:
+        ActionabilitySpec, or None when the goal uses plain unit matching
+
+    Example:
+        >>> spec = get_actionability_spec(goal)
+        >>> spec.units
+        frozenset({'km'})
+    """
+    return _spec_cache.get(goal)
+
+
+def invalidate_actionability_spec(goal_uuid: Optional[UUID] = None) -> None:
+    """
+    Drop cached hints for an updated or deleted goal (all goals if None).
+
+    Not required for correctness - edited hint text is detected on lookup -
+    but frees the entry immediately.
+    """
+    _spec_cache.invalidate(goal_uuid)
@@ -51,8 +51,9 @@ from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from categoriae.actions import Action
-from categoriae.goals import Goal
+from categoriae.goals import Goal, SmartGoal
 from categoriae.relationships import ActionGoalRelationship
+from ethica.matching_engine import MatchingEngine
 from ethica.progress_matching import (
     infer_matches,
     filter_ambiguous_matches,
@@ -79,6 +80,22 @@ class InferenceSession:
     run_timestamp: datetime
 
 
+@dataclass
+class IncrementalInferenceResult:
+    """
+    Results from one incremental inference run.
+
+    Counts describe the delta processed, not the whole history.
+    """
+    actions_rematched: int
+    goals_rematched: int
+    relationships_invalidated: int
+    relationships_stored: int
+    full_rebuild: bool
+    through_seq: int
+    run_timestamp: datetime
+
+
 class ActionGoalInferenceService:
     """
     Coordinates automatic and manual matching between actions and goals.
@@ -99,7 +116,8 @@ class ActionGoalInferenceService:
         Args:
             action_service: ActionStorageService for fetching actions
             goal_service: GoalStorageService for fetching goals
-            progress_service: Optional ProgressTrackingService for persistence
+            progress_service: Optional ActionGoalProgressStorageService for
+                              persistence (required by infer_incremental)
         """
         self.action_service = action_service
         self.goal_service = goal_service
@@ -125,12 +143,8 @@ class ActionGoalInferenceService:
         Returns:
             InferenceSession with all results organized for review
         """
-        # Fetch all actions in period
-        all_actions = self.action_service.get_all()
-        period_actions = [
-            a for a in all_actions
-            if a.log_time and start_date <= a.log_time <= target_date
-        ]
+        # Fetch actions in period (range filtered in SQL)
+        period_actions = self.action_service.get_in_period(start_date, target_date)
 
         # Fetch all goals that overlap with period
         all_goals = self.goal_service.get_all()
@@ -153,8 +167,8 @@ class ActionGoalInferenceService:
         )
 
         # Find unmatched actions
-        matched_action_ids = {id(m.action) for m in all_matches}
-        unmatched = [a for a in period_actions if id(a) not in matched_action_ids]
+        matched_action_ids = {m.action.uuid_id for m in all_matches}
+        unmatched = [a for a in period_actions if a.uuid_id not in matched_action_ids]
 
         return InferenceSession(
             actions_analyzed=len(period_actions),
@@ -165,6 +179,74 @@ class ActionGoalInferenceService:
             run_timestamp=datetime.now()
         )
 
+    def infer_incremental(self) -> IncrementalInferenceResult:
+        """
+        Bring stored auto-inferred matches up to date with what changed.
+
+        Reads the actions and goals changed since the last run (the progress
+        service's change watermark) and re-matches only those:
+        - new or edited actions against all goals
+        - every action in the window of a new goal, or of a goal whose
+          matching hints, unit, dates or type changed
+        Their old auto-inferred rows are dropped first, so edits and deletions
+        never leave stale matches. Manual and user_confirmed rows are kept.
+
+        The first run (no watermark yet) re-infers everything once.
+
+        Returns:
+            IncrementalInferenceResult describing the delta
+
+        Raises:
+            ValueError: If the service was created without a progress_service
+        """
+        if self.progress_service is None:
+            raise ValueError("infer_incremental() needs a progress_service to persist matches")
+
+        changes = self.progress_service.pending_changes()
+        goals = self.goal_service.get_all()
+
+        if changes.full_rebuild:
+            invalidated = self.progress_service.invalidate_auto_inferred()
+            actions = self.action_service.get_all()
+            matches = infer_matches(actions, goals, require_period_match=True)
+            changed_goals = goals
+        else:
+            invalidated = self.progress_service.invalidate_auto_inferred_for(
+                action_ids=changes.action_ids, goal_ids=changes.goal_ids
+            )
+            # Deleted actions simply aren't found; their rows are already gone
+            actions = self.action_service.get_by_uuids(changes.action_ids)
+            matches = MatchingEngine(goals).infer(actions)
+
+            changed_goals = [g for g in goals if str(g.uuid_id) in changes.goal_ids]
+            for goal in changed_goals:
+                window = [a for a in self._actions_in_goal_window(goal)
+                          if str(a.uuid_id) not in changes.action_ids]
+                matches.extend(MatchingEngine([goal]).infer(window))
+
+        stored = self.progress_service.store_relationships(matches) if matches else 0
+        self.progress_service.mark_processed(changes)
+
+        return IncrementalInferenceResult(
+            actions_rematched=len(actions),
+            goals_rematched=len(changed_goals),
+            relationships_invalidated=invalidated,
+            relationships_stored=stored,
+            full_rebuild=changes.full_rebuild,
+            through_seq=changes.through_seq,
+            run_timestamp=datetime.now()
+        )
+
+    def _actions_in_goal_window(self, goal: Goal) -> List[Action]:
+        """
+        Actions a goal can match: its period for dated SmartGoals, else all.
+
+        Same rule as matches_on_period - other goals aren't period-bounded.
+        """
+        if isinstance(goal, SmartGoal) and goal.start_date:
+            return self.action_service.get_in_period(goal.start_date, goal.target_date)
+        return self.action_service.get_all()
+
     def infer_for_new_action(
         self,
         action: Action,
@@ -0,0 +1,93 @@
+"""
+Aho–Corasick multi-keyword matcher.
+
+Finds every keyword occurring in a text in one left-to-right pass, however
+many keywords there are - instead of one substring scan per keyword per goal.
+Keywords map to positions (e.g. goal indexes), so a single pass over an
+action title returns every goal whose keywords hit.
+
+Drop-in keyword matcher for MatchingEngine:
+    MatchingEngine(goals, keyword_matcher=KeywordAutomaton)
+
+Pure Python, no dependencies.
+"""
+
+from collections import deque
+from typing import Collection, Dict, List, Mapping, Set
+
+
+class KeywordAutomaton:
+    """
+    Aho–Corasick automaton over a fixed set of keywords.
+
+    Keywords are matched exactly as given (callers lowercase both keywords and
+    text for case-insensitive matching). An empty keyword occurs in every text,
+    like '' in text.
+
+    Args:
+        patterns: Keyword → positions it stands for (e.g. goal indexes)
+
+    Example:
+        >>> automaton = KeywordAutomaton({'run': {0}, 'running': {1}, 'yoga': {2}})
+        >>> automaton.matches('trail running')
+        {0, 1}
+    """
+
+    def __init__(self, patterns: Mapping[str, Collection[int]]):
+        # State 0 is the root; goto[state] maps a character to the next state
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[int]] = [set()]
+
+        for keyword, positions in patterns.items():
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].update(positions)
+
+        # Breadth-first: failure link = longest proper suffix that is also a prefix
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                # Report every keyword ending here, including suffixes of this one
+                outputs[next_state] |= outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [frozenset(output) for output in outputs]
+        self.keyword_count = len(patterns)
+
+    def matches(self, text: str) -> Set[int]:
+        """
+        Positions of every keyword occurring in text, in one pass.
+
+        Args:
+            text: Text to scan (e.g. a lowercased action title)
+
+        Returns:
+            Set of positions
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        hits = set(outputs[0])
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                hits |= outputs[state]
+
+        return hits
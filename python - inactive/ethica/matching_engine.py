@@ -0,0 +1,263 @@
+"""
+Indexed action-goal matching.
+
+infer_matches() used to test every (action, goal) pair. MatchingEngine
+compiles the goals once into three indexes, so each action only touches the
+goals it can possibly match:
+
+- Period index: SmartGoal periods cut the time line into elementary regions,
+  each storing the goals that cover it. One binary search per action finds
+  every goal whose [start_date, target_date] contains its log_time.
+- Unit index: allowed units from each goal's ActionabilitySpec map to their
+  goals, so each measurement key is one dict lookup. Goals without usable
+  hints match on measurement_unit as a substring of the key and go through
+  a keyword matcher over measurement keys instead.
+- Keyword matcher: every goal keyword at once over the action title. The
+  default (build_keyword_matcher) scans each distinct keyword once per title
+  for a few keywords and switches to an Aho–Corasick KeywordAutomaton (one
+  pass per title) for many; any object with a matches() method can be
+  plugged in.
+
+The indexes only prune candidates. Each remaining (action, goal) pair is
+decided by the rules in ethica.progress_matching (matches_on_period,
+matches_with_how_goal_is_actionable), so results are identical to
+infer_matches_pairwise(): same matches, same contributions, same
+(action, goal) order.
+
+Pure business logic: no database, no I/O.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Collection, Dict, Iterable, List, Mapping, Optional, Protocol, Set, Tuple
+
+from categoriae.actions import Action
+from categoriae.goals import Goal, SmartGoal
+from categoriae.relationships import ActionGoalRelationship
+from ethica.actionability import get_actionability_spec
+from ethica.keyword_automaton import KeywordAutomaton
+from ethica.progress_matching import (
+    AUTO_INFERRED_CONFIDENCE, matches_on_period, matches_with_how_goal_is_actionable,
+)
+
+# From this many distinct keywords on, one automaton pass beats per-keyword scans
+AUTOMATON_MIN_KEYWORDS = 48
+
+
+class KeywordMatcher(Protocol):
+    """Anything that reports which patterns occur in a text."""
+
+    def matches(self, text: str) -> Set[int]:
+        ...
+
+
+class SubstringKeywordMatcher:
+    """
+    Finds which patterns occur as substrings of a text.
+
+    Patterns shared by several goals are checked once, not once per goal.
+
+    Args:
+        patterns: Pattern → positions (e.g. goal indexes) it stands for.
+                  Patterns are matched as given (callers lowercase them)
+
+    Example:
+        >>> matcher = SubstringKeywordMatcher({'run': {0}, 'yoga': {1, 2}})
+        >>> matcher.matches('morning run')
+        {0}
+    """
+
+    def __init__(self, patterns: Mapping[str, Collection[int]]):
+        self._patterns = [(pattern, frozenset(positions)) for pattern, positions in patterns.items()]
+
+    def matches(self, text: str) -> Set[int]:
+        """Positions of every pattern occurring in text."""
+        hits = set()
+        for pattern, positions in self._patterns:
+            if pattern in text:
+                hits |= positions
+        return hits
+
+
+# Factory building a keyword matcher from pattern → positions
+KeywordMatcherFactory = Callable[[Mapping[str, Collection[int]]], KeywordMatcher]
+
+
+def build_keyword_matcher(patterns: Mapping[str, Collection[int]]) -> KeywordMatcher:
+    """
+    Pick the faster matcher for the number of patterns.
+
+    Python's substring search is C code, so a few `pattern in text` checks
+    beat a pure-Python automaton walk; past AUTOMATON_MIN_KEYWORDS patterns
+    the single automaton pass wins and keeps winning as patterns grow.
+
+    Args:
+        patterns: Pattern → positions it stands for
+
+    Returns:
+        SubstringKeywordMatcher or KeywordAutomaton
+    """
+    if len(patterns) >= AUTOMATON_MIN_KEYWORDS:
+        return KeywordAutomaton(patterns)
+    return SubstringKeywordMatcher(patterns)
+
+
+class PeriodIndex:
+    """
+    Stabbing index over closed [start, end] intervals.
+
+    The sorted distinct endpoints split the time line into elementary regions:
+    before the first endpoint, each endpoint itself, between two endpoints,
+    after the last. Each region stores the positions of intervals covering
+    it, so a lookup is one bisect.
+
+    Args:
+        intervals: (position, start, end) triples. Intervals with
+                   start > end never match
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, object, object]]):
+        intervals = list(intervals)
+        self._bounds = sorted({point for _, start, end in intervals for point in (start, end)})
+        regions: List[List[int]] = [[] for _ in range(2 * len(self._bounds) + 1)]
+
+        for position, start, end in intervals:
+            # Region 2i+1 is bounds[i] itself
+            first = 2 * bisect_left(self._bounds, start) + 1
+            last = 2 * bisect_left(self._bounds, end) + 1
+            for region in range(first, last + 1):
+                regions[region].append(position)
+
+        self._regions = [frozenset(positions) for positions in regions]
+
+    def stab(self, point) -> frozenset:
+        """Positions of intervals with start <= point <= end."""
+        index = bisect_left(self._bounds, point)
+        exact = index < len(self._bounds) and self._bounds[index] == point
+        return self._regions[2 * index + 1 if exact else 2 * index]
+
+
+class MatchingEngine:
+    """
+    Goals compiled for fast matching against many actions.
+
+    Build once per goal set, then match any number of actions.
+
+    Args:
+        goals: Goals to match against (match order follows this list)
+        require_period_match: If True, only match actions within goal period
+        keyword_matcher: Factory for the title keyword matcher, e.g.
+                         KeywordAutomaton (default: build_keyword_matcher)
+
+    Example:
+        >>> engine = MatchingEngine(active_goals)
+        >>> matches = engine.infer(period_actions)
+    """
+
+    def __init__(self, goals: List[Goal], require_period_match: bool = True,
+                 keyword_matcher: KeywordMatcherFactory = build_keyword_matcher):
+        self.goals = list(goals)
+        self.require_period_match = require_period_match
+
+        goals_by_allowed_unit: Dict[str, List[int]] = {}
+        goals_by_keyword: Dict[str, Set[int]] = {}
+        goals_by_unit_substring: Dict[str, Set[int]] = {}
+        unbounded: List[int] = []
+        periods: List[Tuple[int, object, object]] = []
+
+        for position, goal in enumerate(self.goals):
+            spec = get_actionability_spec(goal)
+            if spec is not None:
+                for unit in spec.units:
+                    goals_by_allowed_unit.setdefault(unit, []).append(position)
+                for keyword in spec.keywords:
+                    goals_by_keyword.setdefault(keyword, set()).add(position)
+            elif goal.measurement_unit:
+                unit = goal.measurement_unit.lower().replace(' ', '_')
+                goals_by_unit_substring.setdefault(unit, set()).add(position)
+
+            # Same rule as matches_on_period: only dated SmartGoals are bounded
+            if getattr(goal, 'start_date', None) and isinstance(goal, SmartGoal):
+                periods.append((position, goal.start_date, goal.target_date))
+            else:
+                unbounded.append(position)
+
+        self._goals_by_allowed_unit = goals_by_allowed_unit
+        self._keyword_matcher = keyword_matcher(goals_by_keyword)
+        self._unit_matcher = build_keyword_matcher(goals_by_unit_substring)
+        self._unbounded = frozenset(unbounded)
+        self._period_index = PeriodIndex(periods)
+
+    def candidate_positions(self, action: Action) -> Optional[frozenset]:
+        """
+        Goal positions whose period admits the action.
+
+        Returns:
+            Set of positions, or None when periods aren't checked
+        """
+        if not self.require_period_match:
+            return None
+        if not action.log_time:
+            return frozenset()
+        return self._unbounded | self._period_index.stab(action.log_time)
+
+    def match_action(self, action: Action) -> List[ActionGoalRelationship]:
+        """
+        Matches for one action, in goal order.
+
+        Args:
+            action: Action to match
+
+        Returns:
+            List of auto-inferred ActionGoalRelationship objects
+        """
+        measurements = action.measurement_units_by_amount
+        if not measurements:
+            return []  # Both unit rules need measurements
+
+        candidates = self.candidate_positions(action)
+        if candidates is not None and not candidates:
+            return []
+
+        # Index pruning only: hinted goals need an allowed unit and a title
+        # keyword, unhinted goals a key containing their measurement unit
+        positions: Set[int] = set()
+        hinted = {position for key in measurements
+                  for position in self._goals_by_allowed_unit.get(key.lower(), ())}
+        if hinted and action.title:
+            positions |= hinted & self._keyword_matcher.matches(action.title.lower())
+        for key in measurements:
+            positions |= self._unit_matcher.matches(key.lower())
+        if candidates is not None:
+            positions &= candidates
+
+        # The rules themselves decide each remaining pair
+        matches = []
+        for position in sorted(positions):
+            goal = self.goals[position]
+            if self.require_period_match and not matches_on_period(action, goal):
+                continue
+            matched, contribution = matches_with_how_goal_is_actionable(action, goal)
+            if matched:
+                matches.append(ActionGoalRelationship(
+                    action=action,
+                    goal=goal,
+                    contribution=contribution,
+                    assignment_method='auto_inferred',
+                    confidence=AUTO_INFERRED_CONFIDENCE
+                ))
+        return matches
+
+    def infer(self, actions: Iterable[Action]) -> List[ActionGoalRelationship]:
+        """
+        Matches for many actions, in (action, goal) order.
+
+        Args:
+            actions: Actions to match
+
+        Returns:
+            List of auto-inferred ActionGoalRelationship objects
+        """
+        matches = []
+        for action in actions:
+            matches.extend(self.match_action(action))
+        return matches
@@ -23,8 +23,11 @@ derived metrics (GoalProgress). No database, no formatting, no display logic.
 Written by Claude Code on 2025-10-12
 """
 
-from typing import List, Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
 from dataclasses import dataclass
+from uuid import UUID
 from categoriae.goals import Goal
 from categoriae.relationships import ActionGoalRelationship
 
@@ -42,11 +45,16 @@ class GoalProgress:
         matches: List of action-goal relationships contributing to this goal
         total_progress: Sum of all contributions (e.g., 102.5 km)
         target: Goal's target value (e.g., 120.0 km)
+        match_count: Number of contributing actions when built from stored
+                     totals without the matches themselves (None = len(matches))
+        last_contribution_at: Log time of the latest contributing action, if known
     """
     goal: Goal
     matches: List[ActionGoalRelationship]
     total_progress: float
     target: float
+    match_count: Optional[int] = None
+    last_contribution_at: Optional[datetime] = None
 
     @property
     def percent(self) -> float:
@@ -86,6 +94,8 @@ class GoalProgress:
     @property
     def matching_actions_count(self) -> int:
         """Number of actions contributing to this goal."""
+        if self.match_count is not None:
+            return self.match_count
         return len(self.matches)
 
     @property
@@ -147,6 +157,69 @@ def aggregate_goal_progress(
     )
 
 
+def progress_from_totals(
+    goal: Goal,
+    total_progress: float,
+    match_count: int,
+    last_contribution_at: Optional[datetime] = None
+) -> GoalProgress:
+    """
+    Build GoalProgress from precomputed totals (e.g. the stored goal_progress row).
+
+    Same metrics as aggregate_goal_progress() without loading or re-matching
+    the contributing actions; matches is left empty.
+
+    Args:
+        goal: Goal the totals belong to
+        total_progress: Sum of contributions
+        match_count: Number of contributing actions
+        last_contribution_at: Log time of the latest contributing action
+
+    Returns:
+        GoalProgress with matching_actions_count == match_count
+
+    Example:
+        >>> progress = progress_from_totals(goal, 102.5, 23)
+        >>> round(progress.percent, 1)
+        85.4
+    """
+    target = goal.measurement_target if goal.measurement_target is not None else 0.0
+
+    return GoalProgress(
+        goal=goal,
+        matches=[],
+        total_progress=total_progress,
+        target=target,
+        match_count=match_count,
+        last_contribution_at=last_contribution_at
+    )
+
+
+def group_matches_by_goal(
+    matches: List[ActionGoalRelationship]
+) -> Dict[UUID, List[ActionGoalRelationship]]:
+    """
+    Group matches by their goal's uuid_id, preserving match order.
+
+    Keyed by UUID rather than by Goal, so grouping doesn't depend on goal
+    field values and two loaded copies of the same goal share one group.
+
+    Args:
+        matches: Action-goal matches for any number of goals
+
+    Returns:
+        Dict mapping goal uuid_id → matches for that goal
+
+    Example:
+        >>> by_goal = group_matches_by_goal(all_matches)
+        >>> goal_matches = by_goal.get(goal.uuid_id, [])
+    """
+    matches_by_goal = defaultdict(list)
+    for match in matches:
+        matches_by_goal[match.goal.uuid_id].append(match)
+    return matches_by_goal
+
+
 def aggregate_all_goals(
     goals: List[Goal],
     all_matches: List[ActionGoalRelationship]
@@ -169,16 +242,13 @@ def aggregate_all_goals(
         >>> complete_goals = [p for p in all_progress if p.is_complete]
         >>> print(f"{len(complete_goals)} of {len(all_progress)} goals complete")
     """
-    # Group matches by goal for efficient lookup
-    from collections import defaultdict
-    matches_by_goal = defaultdict(list)
-    for match in all_matches:
-        matches_by_goal[match.goal].append(match)
+    # Group matches by goal uuid for O(1) lookup
+    matches_by_goal = group_matches_by_goal(all_matches)
 
     # Calculate progress for each goal
     progress_list = []
     for goal in goals:
-        goal_matches = matches_by_goal.get(goal, [])
+        goal_matches = matches_by_goal.get(goal.uuid_id, [])
         progress = aggregate_goal_progress(goal, goal_matches)
         progress_list.append(progress)
 
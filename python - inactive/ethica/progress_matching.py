@@ -45,17 +45,21 @@ Updated by Claude Code on 2025-10-11 - Refactored to use categoriae/relationship
 Updated by Claude Code on 2025-10-12 - Added how_goal_is_actionable-based matching
 """
 
-import json
 from datetime import datetime
 from typing import List, Optional, Tuple
 from categoriae.actions import Action
 from categoriae.goals import Goal, SmartGoal
 from categoriae.relationships import ActionGoalRelationship
 from config.logging_setup import get_logger
+from ethica.actionability import get_actionability_spec
+from ethica.keyword_automaton import KeywordAutomaton
 
 # Alias for backwards compatibility and clearer naming in this module
 ActionGoalMatch = ActionGoalRelationship
 
+# Confidence given to auto-inferred matches (period + actionability)
+AUTO_INFERRED_CONFIDENCE = 0.9
+
 logger = get_logger(__name__)
 
 
@@ -142,34 +146,11 @@ def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[boo
         Action: "Yoga class" with {"minutes": 30}
         → (False, None)  # Wrong keywords
     """
-    # If no how_goal_is_actionable hints, fall back to simple unit matching
-    if not hasattr(goal, 'how_goal_is_actionable') or not goal.how_goal_is_actionable:
-        unit_match, _, contribution = matches_on_unit(action, goal)
-        return (unit_match, contribution)
-
-    # Parse JSON how_goal_is_actionable
-    try:
-        data = json.loads(goal.how_goal_is_actionable)
-        # Normalize to lowercase and strip wildcards
-        allowed_units = [u.lower().strip() for u in data.get('units', [])]
-        required_keywords = [k.lower().strip().replace('*', '').strip()
-                           for k in data.get('keywords', []) if k.strip()]
-    except (json.JSONDecodeError, AttributeError, TypeError) as e:
-        # Malformed JSON - log warning and fall back to unit matching
-        logger.warning(
-            f"Malformed how_goal_is_actionable JSON for goal '{goal.title[:50]}...': {e}. "
-            f"Value was: {goal.how_goal_is_actionable!r}. Falling back to simple unit matching."
-        )
-        unit_match, _, contribution = matches_on_unit(action, goal)
-        return (unit_match, contribution)
+    # Hints are parsed once per goal (and per edit), not once per pair
+    spec = get_actionability_spec(goal)
 
-    if not allowed_units or not required_keywords:
-        # Empty how_goal_is_actionable hints - log and fall back to unit matching
-        logger.debug(
-            f"Empty how_goal_is_actionable hints for goal '{goal.title[:50]}...'. "
-            f"Units: {allowed_units}, Keywords: {required_keywords}. "
-            f"Falling back to simple unit matching."
-        )
+    # No usable hints (missing, malformed or empty) - fall back to simple unit matching
+    if spec is None:
         unit_match, _, contribution = matches_on_unit(action, goal)
         return (unit_match, contribution)
 
@@ -177,13 +158,8 @@ def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[boo
     if not action.measurement_units_by_amount:
         return (False, None)
 
-    # Check for exact unit match (case-insensitive)
-    contribution = None
-    for key, value in action.measurement_units_by_amount.items():
-        if key.lower() in allowed_units:
-            contribution = value
-            break
-
+    # First exact unit match (case-insensitive)
+    contribution = spec.first_allowed_amount(action.measurement_units_by_amount)
     if contribution is None:
         return (False, None)
 
@@ -191,17 +167,42 @@ def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[boo
     if not action.title:
         return (False, None)
 
-    # Check if any keyword appears in description (substring, case-insensitive)
-    action_lower = action.title.lower()
-    keyword_matched = any(kw in action_lower for kw in required_keywords)
-
-    if not keyword_matched:
+    # Any keyword as a substring, case-insensitive
+    if not spec.matches_title(action.title.lower()):
         return (False, None)
 
     # Both checks passed!
     return (True, contribution)
 
 
+def build_goal_keyword_matcher(goals: List[Goal], matcher=KeywordAutomaton):
+    """
+    Multi-keyword matcher over every goal's actionability keywords.
+
+    One matches() call scans an action title once and returns the positions
+    (indexes into goals) of every goal with a keyword in it. Goals without
+    usable how_goal_is_actionable hints never hit.
+
+    Args:
+        goals: Goals whose keywords to index
+        matcher: Matcher class/factory taking keyword → positions
+                 (default: KeywordAutomaton, Aho–Corasick)
+
+    Returns:
+        Matcher with matches(lowercased_text) -> set of goal positions
+
+    Example:
+        >>> keyword_matcher = build_goal_keyword_matcher(goals)
+        >>> [goals[i] for i in sorted(keyword_matcher.matches(action.title.lower()))]
+    """
+    goals_by_keyword = {}
+    for position, goal in enumerate(goals):
+        spec = get_actionability_spec(goal)
+        for keyword in (spec.keywords if spec else ()):
+            goals_by_keyword.setdefault(keyword, set()).add(position)
+    return matcher(goals_by_keyword)
+
+
 def infer_matches(
     actions: List[Action],
     goals: List[Goal],
@@ -216,6 +217,10 @@ def infer_matches(
 
     Uses structured how_goal_is_actionable JSON to prevent false positives.
 
+    Goals are compiled into a MatchingEngine (period, unit and keyword
+    indexes), so each action is only checked against goals it can match.
+    Results are identical to infer_matches_pairwise().
+
     Args:
         actions: List of actions to match
         goals: List of active goals
@@ -224,6 +229,22 @@ def infer_matches(
     Returns:
         List of ActionGoalMatch objects with auto-inferred relationships
     """
+    from ethica.matching_engine import MatchingEngine  # engine builds on the rules above
+
+    return MatchingEngine(goals, require_period_match=require_period_match).infer(actions)
+
+
+def infer_matches_pairwise(
+    actions: List[Action],
+    goals: List[Goal],
+    require_period_match: bool = True
+) -> List[ActionGoalMatch]:
+    """
+    Reference implementation of infer_matches(): every (action, goal) pair.
+
+    O(actions × goals). Kept as the definition the indexed engine is tested
+    against - use infer_matches() in application code.
+    """
     matches = []
 
     for action in actions:
@@ -240,7 +261,7 @@ def infer_matches(
 
             # High confidence for period + how_goal_is_actionable match
             # Actionability already validates both unit and keyword requirements
-            confidence = 0.9
+            confidence = AUTO_INFERRED_CONFIDENCE
 
             matches.append(ActionGoalMatch(
                 action=action,
@@ -27,12 +27,16 @@ Updated by Claude Code on 2025-10-14 (added presentation helper functions)
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from categoriae.terms import GoalTerm
 from categoriae.goals import Goal
 from categoriae.actions import Action
 from config.logging_setup import get_logger
 
+if TYPE_CHECKING:
+    # Type hints only - ethica works with any object offering ActionFrame's methods
+    from rhetorica.action_frame import ActionFrame
+
 logger = get_logger(__name__)
 
 
@@ -166,6 +170,28 @@ def get_actions_in_term(
     return matched_actions
 
 
+def get_term_measurement_totals(term: GoalTerm, actions: 'ActionFrame') -> Dict[str, float]:
+    """
+    Total measurements per unit for actions logged during a term.
+
+    Columnar counterpart of summing over get_actions_in_term(): the term's
+    actions are found by binary search on the frame's sorted log times and
+    summed per unit without building Action objects.
+
+    Args:
+        term: The term to total
+        actions: ActionFrame of candidate actions (e.g. ActionStorageService.get_frame())
+
+    Returns:
+        Dict of unit → total within term boundaries (inclusive)
+
+    Example:
+        >>> get_term_measurement_totals(term, action_service.get_frame())
+        {'km': 102.5, 'minutes': 940.0}
+    """
+    return actions.between(term.start_date, term.target_date).totals_by_unit()
+
+
 def is_term_complete(term: GoalTerm, check_date: Optional[datetime] = None) -> bool:
     """
     Check if a term has ended.
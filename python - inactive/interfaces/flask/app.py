@@ -8,15 +8,50 @@ import sys
 from pathlib import Path
 
 import logging
-from flask import Flask, render_template
+from flask import Flask, g, render_template
+from flask.json.provider import DefaultJSONProvider
 from dotenv import load_dotenv
 
+from rhetorica import codec
+from rhetorica.storage_session import StorageSession
+
 # Load environment variables from .env file
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+class CodecJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by rhetorica.codec.
+
+    jsonify() and request.get_json() use the fast JSON backend when one is
+    installed. Dates, UUIDs and dataclasses still go through Flask's default()
+    hook. Debug mode responses stay indented via the stdlib provider.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs.keys() - {'separators'}:
+            # indent or other formatting options only the stdlib supports
+            return super().dumps(obj, **kwargs)
+        return codec.dumps(obj, default=self.default, sort_keys=self.sort_keys)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return codec.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else args or kwargs
+        body = codec.dumps_bytes(obj, default=self.default, sort_keys=self.sort_keys)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+
 def create_app(config: dict | None = None):
     """
     Application factory pattern for Flask app.
@@ -30,6 +65,7 @@ def create_app(config: dict | None = None):
     app = Flask(__name__,
                 template_folder='templates',
                 static_folder='static')
+    app.json = CodecJSONProvider(app)
 
     # Set secret key from environment (required for sessions/flash messages)
     app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'dev-fallback-key')
@@ -51,6 +87,24 @@ def create_app(config: dict | None = None):
     app.register_blueprint(ui_actions_bp)
     app.register_blueprint(ui_goals_bp)
 
+    # One StorageSession per request: every storage service a route creates
+    # joins it, so the same action or goal is loaded once per request.
+    # Routes queuing writes with session.add()/delete() must commit() before
+    # returning, so a failed write becomes an error response.
+    @app.before_request
+    def open_storage_session():
+        g.storage_session = StorageSession().activate()
+
+    @app.teardown_request
+    def close_storage_session(exc):
+        session = g.pop('storage_session', None)
+        if session is None:
+            return
+        if session.has_pending:
+            logger.warning("Discarding storage session writes that were queued but never committed")
+        session.rollback()
+        session.close()
+
     # Home route
     @app.route('/')
     def home():
@@ -40,38 +40,37 @@ def get_actions():
         GET /api/actions?start_date=2025-10-01&target_date=2025-10-31
     """
     try:
-        service = ActionStorageService()
-        actions = service.get_all()
-
-        # Apply filters from query params
+        # Parse filters from query params before touching the database
         has_measurements = request.args.get('has_measurements', '').lower() == 'true'
         has_duration = request.args.get('has_duration', '').lower() == 'true'
         start_date_str = request.args.get('start_date')
         target_date_str = request.args.get('target_date')
 
-        if has_measurements:
-            actions = [a for a in actions if a.measurement_units_by_amount is not None]
-
-        if has_duration:
-            actions = [a for a in actions if a.duration_minutes is not None]
-
-        # Date range filtering
+        start_date = target_date = None
         if start_date_str:
             try:
                 start_date = datetime.fromisoformat(start_date_str)
-                actions = [a for a in actions if a.log_time and a.log_time >= start_date]
             except ValueError:
                 return jsonify({'error': f'Invalid start_date format: {start_date_str}. Use ISO format.'}), 400
 
         if target_date_str:
             try:
                 target_date = datetime.fromisoformat(target_date_str)
-                actions = [a for a in actions if a.log_time and a.log_time <= target_date]
             except ValueError:
                 return jsonify({'error': f'Invalid target_date format: {target_date_str}. Use ISO format.'}), 400
 
-        # Serialize actions
-        actions_data = [serialize(a, include_type=True) for a in actions]
+        def keep(a) -> bool:
+            if has_measurements and a.measurement_units_by_amount is None:
+                return False
+            if has_duration and a.duration_minutes is None:
+                return False
+            return True
+
+        # Date range is filtered in SQL; stream and serialize matches in one pass.
+        # Entities are only serialized back out, so UUIDs can stay strings
+        service = ActionStorageService()
+        actions = service.iter_in_period(start_date, target_date, uuid_as_str=True)
+        actions_data = [serialize(a, include_type=True) for a in actions if keep(a)]
 
         return jsonify({
             'actions': actions_data,
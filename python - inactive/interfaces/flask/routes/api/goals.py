@@ -11,10 +11,12 @@ from flask import request, jsonify
 from datetime import datetime
 
 from . import api_bp
-from rhetorica.storage_service import GoalStorageService, ActionStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+from rhetorica.progress_storage import ActionGoalProgressStorageService
 from rhetorica.serializers import serialize, deserialize
-from ethica.progress_matching import infer_matches
-from ethica.progress_aggregation import aggregate_goal_progress
+from ethica.actionability import invalidate_actionability_spec
+from ethica.inference_service import ActionGoalInferenceService
+from ethica.progress_aggregation import progress_from_totals
 from categoriae.goals import Goal, Milestone, SmartGoal
 from config.logging_setup import get_logger
 
@@ -231,6 +233,7 @@ def update_goal(goal_id: int):
 
         # Save updated goal
         service.save(goal, notes=f'Updated via API at {datetime.now().isoformat()}')
+        invalidate_actionability_spec(goal.uuid_id)
 
         logger.info(f"Updated goal {goal_id}")
 
@@ -287,7 +290,11 @@ def get_goal_progress(goal_id: int):
     """
     GET /api/goals/<id>/progress - Get goal with detailed progress metrics.
 
-    Calculates progress by matching actions to this goal and aggregating contributions.
+    Stored matches are first brought up to date with
+    ActionGoalInferenceService.infer_incremental(), which only re-matches
+    actions and goals changed since its last run. Totals then come from the
+    materialized goal_progress row (a primary-key lookup), and matches from
+    the goal's stored relationships.
 
     Args:
         goal_id: Goal database ID
@@ -308,6 +315,7 @@ def get_goal_progress(goal_id: int):
                 "is_complete": false,
                 "is_overachieved": false,
                 "matching_actions_count": 23,
+                "last_contribution_at": "2025-10-28T07:30:00",
                 "unit": "km"
             },
             "matches": [...]
@@ -320,28 +328,17 @@ def get_goal_progress(goal_id: int):
         if not goal:
             return jsonify({'error': f'Goal {goal_id} not found'}), 404
 
-        # Fetch all actions for matching
-        action_service = ActionStorageService()
-        actions = action_service.get_all()
+        # Store matches for actions and goals changed since the last request
+        progress_service = ActionGoalProgressStorageService()
+        ActionGoalInferenceService(ActionStorageService(), goal_service,
+                                   progress_service=progress_service).infer_incremental()
 
-        # Infer matches for this goal
-        all_matches = infer_matches(actions, [goal])
+        # Stored totals for this goal (one row)
+        totals = progress_service.get_goal_totals(goal.uuid_id)
+        progress = progress_from_totals(goal, totals.total, totals.match_count,
+                                        totals.last_contribution_at)
 
-        # Calculate progress metrics
-        progress = aggregate_goal_progress(goal, all_matches)
-
-        # Serialize matches (list of ActionGoalRelationship objects)
-        matches_data = []
-        for match in all_matches:
-            matches_data.append({
-                'action_id': match.action.id,
-                'action_description': match.action.title,
-                'contribution': match.contribution,
-                'assignment_method': match.assignment_method,
-                'confidence': match.confidence
-            })
-
-        return jsonify({
+        response = {
             'goal': serialize(goal, include_type=True),
             'progress': {
                 'total_progress': progress.total_progress,
@@ -351,10 +348,26 @@ def get_goal_progress(goal_id: int):
                 'is_complete': progress.is_complete,
                 'is_overachieved': progress.is_overachieved,
                 'matching_actions_count': progress.matching_actions_count,
+                'last_contribution_at': (progress.last_contribution_at.isoformat()
+                                         if progress.last_contribution_at else None),
                 'unit': progress.unit
-            },
-            'matches': matches_data
-        }), 200
+            }
+        }
+
+        # Serialize stored matches (list of ActionGoalRelationship objects)
+        response['matches'] = [
+            {
+                'action_id': match.action.id,
+                'action_uuid': str(match.action.uuid_id),
+                'action_description': match.action.title,
+                'contribution': match.contribution,
+                'assignment_method': match.assignment_method,
+                'confidence': match.confidence
+            }
+            for match in progress_service.get_relationships(goal_id=goal.uuid_id)
+        ]
+
+        return jsonify(response), 200
 
     except Exception as e:
         logger.error(f"Error fetching progress for goal {goal_id}: {e}", exc_info=True)
@@ -485,7 +485,7 @@ def get_term_progress_endpoint(term_id: int):
         action_service = ActionStorageService()
 
         goals = goal_service.get_all()
-        actions = action_service.get_all()
+        actions = action_service.get_in_period(term.start_date, term.target_date)
 
         # Calculate using business logic
         committed = get_committed_goals(term, goals)
@@ -43,23 +43,16 @@ def actions_list():
     try:
         service = ActionStorageService()
 
-        # Get all actions
-        actions = service.get_all()
-
         # Apply filters
         from_date_str = request.args.get('from_date')
         to_date_str = request.args.get('to_date')
         has_measurements = request.args.get('has_measurements')
         has_duration = request.args.get('has_duration')
 
-        # Date filtering
-        if from_date_str:
-            from_date = datetime.fromisoformat(from_date_str)
-            actions = [a for a in actions if a.log_time >= from_date]
-
-        if to_date_str:
-            to_date = datetime.fromisoformat(to_date_str)
-            actions = [a for a in actions if a.log_time <= to_date]
+        # Date filtering happens in SQL
+        from_date = datetime.fromisoformat(from_date_str) if from_date_str else None
+        to_date = datetime.fromisoformat(to_date_str) if to_date_str else None
+        actions = service.get_in_period(from_date, to_date, order_by='log_time DESC')
 
         # Feature filtering
         if has_measurements == 'true':
@@ -72,9 +65,6 @@ def actions_list():
         elif has_duration == 'false':
             actions = [a for a in actions if a.duration_minutes is None]
 
-        # Sort by log_time descending (most recent first)
-        actions = sorted(actions, key=lambda a: a.log_time, reverse=True)
-
         return render_template('actions_list.html',
                              actions=actions,
                              from_date=from_date_str,
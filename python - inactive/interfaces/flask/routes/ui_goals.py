@@ -10,6 +10,7 @@ Written by Claude Code on 2025-10-17.
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from datetime import datetime
 from rhetorica.storage_service import GoalStorageService
+from ethica.actionability import invalidate_actionability_spec
 from categoriae.goals import Goal, Milestone, SmartGoal
 from config.logging_setup import get_logger
 
@@ -223,6 +224,7 @@ def goals_edit(goal_id: int):
 
         # Save updated goal
         service.save(goal, notes=f'Updated via web UI at {datetime.now().isoformat()}')
+        invalidate_actionability_spec(goal.uuid_id)
 
         logger.info(f"Updated goal {goal_id}: {goal.title}")
         flash(f"Successfully updated goal: {goal.title}", "success")
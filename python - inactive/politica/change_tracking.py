@@ -0,0 +1,149 @@
+"""
+Change log for incremental processing.
+
+Triggers append one change_log row per insert, update or delete of a tracked
+table. Each row gets an ever-increasing seq (AUTOINCREMENT, so numbers are
+never reused after pruning). Consumers - e.g. incremental action-goal
+inference - remember the last seq they processed in change_watermarks and
+next time read only the rows after it, so their cost follows the number of
+changes rather than the size of the tables.
+
+Updates are only logged when a column listed in TRACKED_COLUMNS changes
+(e.g. editing a goal's notes doesn't force re-matching). Inserts and deletes
+are always logged.
+
+Installed on existing databases by migration 3; all statements are idempotent.
+
+Like the rest of politica, this module knows nothing about domain entities.
+"""
+
+import sqlite3
+from typing import Iterable, List, Optional
+from config.logging_setup import get_logger
+from politica.filters import validate_identifier
+
+logger = get_logger(__name__)
+
+
+# table → columns whose update is logged (rows are identified by uuid_id)
+TRACKED_COLUMNS = {
+    'actions': ['uuid_id', 'title', 'log_time', 'measurement_units_by_amount'],
+    'goals': ['uuid_id', 'goal_type', 'measurement_unit', 'start_date', 'target_date',
+              'how_goal_is_actionable'],
+}
+
+CHANGE_LOG_TABLE = """
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_uuid TEXT NOT NULL,
+    operation TEXT NOT NULL,                -- 'insert', 'update', 'delete'
+    changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+WATERMARK_TABLE = """
+CREATE TABLE IF NOT EXISTS change_watermarks (
+    consumer TEXT PRIMARY KEY,              -- e.g. 'action_goal_inference'
+    last_seq INTEGER NOT NULL,              -- Last change_log.seq processed
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def _trigger_statements(table: str, columns: List[str]) -> List[str]:
+    """CREATE TRIGGER statements logging inserts, tracked updates and deletes of table."""
+    table = validate_identifier(table)
+    changed = ' OR '.join(f"OLD.{validate_identifier(c)} IS NOT NEW.{c}" for c in columns)
+    log = "INSERT INTO change_log (table_name, row_uuid, operation) VALUES ('{table}', {row}, '{op}');"
+
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_log_insert AFTER INSERT ON {table}\n"
+        f"BEGIN {log.format(table=table, row='NEW.uuid_id', op='insert')} END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_log_update AFTER UPDATE ON {table}\n"
+        f"WHEN {changed}\n"
+        f"BEGIN {log.format(table=table, row='NEW.uuid_id', op='update')} END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_log_delete AFTER DELETE ON {table}\n"
+        f"BEGIN {log.format(table=table, row='OLD.uuid_id', op='delete')} END",
+    ]
+
+
+def apply_change_tracking(conn: sqlite3.Connection) -> None:
+    """
+    Create the change log, the watermark table and the triggers.
+
+    Args:
+        conn: Open connection (inside the caller's transaction)
+    """
+    conn.execute(CHANGE_LOG_TABLE)
+    conn.execute(WATERMARK_TABLE)
+    for table, columns in TRACKED_COLUMNS.items():
+        for statement in _trigger_statements(table, columns):
+            conn.execute(statement)
+    logger.info(f"Change tracking installed on {', '.join(TRACKED_COLUMNS)}")
+
+
+def latest_change_seq(conn: sqlite3.Connection) -> int:
+    """Highest seq ever assigned (0 if nothing has changed yet)."""
+    # sqlite_sequence keeps the high-water mark even after the log is pruned
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'change_log'").fetchone()
+    return row[0] if row else 0
+
+
+def read_changes(conn: sqlite3.Connection, after_seq: int, through_seq: int,
+                 tables: Optional[Iterable[str]] = None) -> List[sqlite3.Row]:
+    """
+    Change rows with after_seq < seq <= through_seq, oldest first.
+
+    Args:
+        conn: Open connection
+        after_seq: Last seq already processed
+        through_seq: Last seq to include
+        tables: Only these tables (default: all)
+
+    Returns:
+        Rows of (seq, table_name, row_uuid, operation)
+    """
+    sql = ("SELECT seq, table_name, row_uuid, operation FROM change_log "
+           "WHERE seq > ? AND seq <= ?")
+    values: list = [after_seq, through_seq]
+    if tables is not None:
+        tables = list(tables)
+        sql += f" AND table_name IN ({', '.join('?' for _ in tables)})"
+        values.extend(tables)
+    return conn.execute(sql + " ORDER BY seq", values).fetchall()
+
+
+def get_watermark(conn: sqlite3.Connection, consumer: str) -> Optional[int]:
+    """Last seq processed by consumer, or None if it has never run."""
+    row = conn.execute(
+        "SELECT last_seq FROM change_watermarks WHERE consumer = ?", [consumer]
+    ).fetchone()
+    return row[0] if row else None
+
+
+def set_watermark(conn: sqlite3.Connection, consumer: str, seq: int) -> None:
+    """Record that consumer has processed every change up to seq."""
+    conn.execute(
+        "INSERT INTO change_watermarks (consumer, last_seq) VALUES (?, ?) "
+        "ON CONFLICT(consumer) DO UPDATE SET last_seq = excluded.last_seq, "
+        "updated_at = CURRENT_TIMESTAMP",
+        [consumer, seq]
+    )
+
+
+def prune_changes(conn: sqlite3.Connection) -> int:
+    """
+    Delete change rows every consumer has processed.
+
+    Consumers that have never run aren't waited for - they start with a full
+    pass instead of reading the log.
+
+    Returns:
+        Number of rows deleted
+    """
+    cursor = conn.execute(
+        "DELETE FROM change_log WHERE seq <= (SELECT COALESCE(MIN(last_seq), ?) FROM change_watermarks)",
+        [latest_change_seq(conn)]
+    )
+    return cursor.rowcount
@@ -0,0 +1,158 @@
+"""
+Pooled, long-lived SQLite connections for the Database layer.
+
+Opening a connection is the largest fixed cost of a small query: SQLite has to
+open the file, parse the schema and start with a cold page cache. This module
+keeps connections alive and hands them out again instead of reconnecting.
+
+Pool behaviour:
+- Each thread holds at most one connection at a time. Nested use on the same
+  thread reuses that connection and joins the outer transaction.
+- When a thread's outermost transaction ends, its connection goes back to a
+  shared idle stack, so worker threads (e.g. Flask's threaded server) reuse
+  warm connections instead of opening new ones.
+- Connections beyond the idle limit are closed rather than kept.
+- Every new connection gets the configured PRAGMA settings (see politica.pragmas).
+
+Like the rest of politica, this module knows nothing about domain entities.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+from config.logging_setup import get_logger
+from politica.pragmas import apply_pragmas
+
+logger = get_logger(__name__)
+
+
+class ConnectionPool:
+    """
+    Thread-aware pool of SQLite connections for a single database file.
+
+    Connections are created with check_same_thread=False because they move
+    between threads, but a connection is only ever used by one thread at a time.
+    """
+
+    def __init__(self, db_path: Path, max_idle: int = 5, pragmas: Optional[dict] = None):
+        """
+        Configure the pool. No connections are opened until first use.
+
+        Args:
+            db_path: Path to SQLite database file
+            max_idle: Maximum number of idle connections kept open for reuse
+            pragmas: Resolved PRAGMA settings applied to each new connection
+        """
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.pragmas = pragmas or {}
+
+        self._local = threading.local()
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with Row factory and the pool's pragmas."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        apply_pragmas(conn, self.pragmas)
+        logger.debug(f"Opened new pooled connection to {self.db_path}")
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection, or open a new one if none are idle."""
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool has been closed")
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the idle stack, closing it if the pool is full."""
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+        logger.debug("Closed surplus pooled connection")
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager for a transactional connection.
+
+        Handles connection lifecycle:
+        - Reuses this thread's connection if one is already checked out
+        - Commits on success of the outermost block
+        - Rolls back on exception in the outermost block
+        - Returns the connection to the pool instead of closing it
+
+        Usage:
+            with pool.connection() as conn:
+                conn.execute(sql, values)
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+
+        if conn is not None:
+            # Nested use on this thread - join the outer transaction
+            local.depth += 1
+            try:
+                yield conn
+            finally:
+                local.depth -= 1
+            return
+
+        conn = self._checkout()
+        local.conn = conn
+        local.depth = 1
+
+        try:
+            yield conn
+        except BaseException as e:
+            conn.rollback()
+            logger.error(f"Database transaction rolled back: {e!r}")
+            raise
+        else:
+            conn.commit()
+            logger.debug("Database transaction committed")
+        finally:
+            local.conn = None
+            local.depth = 0
+            self._checkin(conn)
+
+    @contextmanager
+    def detached_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection that is not shared with this thread's transactions.
+
+        For long-lived readers such as streaming cursors: the connection stays
+        checked out while the caller iterates, and writes made on the same
+        thread in the meantime still go through their own transaction.
+        """
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._checkin(conn)
+
+    def close(self) -> None:
+        """
+        Close all idle connections and refuse further checkouts.
+
+        Connections currently checked out are closed when they are returned.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+
+        for conn in idle:
+            conn.close()
+
+        logger.debug(f"Closed connection pool for {self.db_path}")
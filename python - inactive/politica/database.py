@@ -11,17 +11,38 @@ All methods accept/return dicts, never domain objects like Action or Goal.
 """
 
 import sqlite3
-import json
+import threading
 from pathlib import Path
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from contextlib import contextmanager
-from config import DB_PATH, SCHEMA_PATH
+from config import (
+    DB_PATH, SCHEMA_PATH, DB_POOL_SIZE, DB_PRAGMA_PROFILE, DB_PRAGMA_OVERRIDES,
+    DB_BULK_CHUNK_SIZE, DB_FETCH_BATCH_SIZE,
+)
 from config.logging_setup import get_logger
+from politica import change_tracking, goal_progress
+from politica.connection_pool import ConnectionPool
+from politica.pragmas import resolve_pragmas
+from politica.migrations import migrate
+from politica.filters import (
+    build_aggregates, build_columns, build_keyset, build_where, validate_identifier,
+    validate_order_by,
+)
+# Dependency-free JSON codec (no domain imports), shared with the serializers
+from rhetorica import codec
 
 # Module logger
 logger = get_logger(__name__)
 
 
+
+_ARCHIVE_INSERT_SQL = """
+    INSERT INTO archive (source_table, source_id, record_data, reason, notes)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
 def _archive_records(db_connection, table: str, records: List[dict], reason: str, notes: str = '') -> None:
     """
     Archive records to archive table.
@@ -29,6 +50,8 @@ def _archive_records(db_connection, table: str, records: List[dict], reason: str
     PRIVATE MODULE FUNCTION - Not part of Database class API.
     Use Database.archive_and_delete() instead.
 
+    Writes all records with a single executemany() call.
+
     Args:
         db_connection: Active database connection (from context manager)
         table: Source table name
@@ -42,23 +65,51 @@ def _archive_records(db_connection, table: str, records: List[dict], reason: str
 
     logger.info(f"Archiving {len(records)} records from {table} (reason: {reason})")
 
-    cursor = db_connection.cursor()
+    dumps = codec.dumps
+    db_connection.executemany(_ARCHIVE_INSERT_SQL, (
+        (table, record.get('id'), dumps(record, default=str), reason, notes)
+        for record in records
+    ))
 
-    for record in records:
-        record_json = json.dumps(record, default=str)
+    logger.info(f"✓ Archived {len(records)} records from {table}")
 
-        cursor.execute("""
-            INSERT INTO archive (source_table, source_id, record_data, reason, notes)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            table,
-            record.get('id'),
-            record_json,
-            reason,
-            notes
-        ))
 
-    logger.info(f"✓ Archived {len(records)} records from {table}")
+def _archive_records_in_sql(db_connection, table: str, columns: List[str],
+                            where_sql: str, values: list,
+                            reason: str, notes: str = '') -> int:
+    """
+    Archive matching records with a single INSERT ... SELECT inside SQLite.
+
+    PRIVATE MODULE FUNCTION - Not part of Database class API.
+    Use Database.archive_and_delete(in_database=True) instead.
+
+    Rows are serialized with json_object() by SQLite, so they are never
+    loaded into Python. Suited to large deletions such as cache invalidation.
+
+    Args:
+        db_connection: Active database connection (from context manager)
+        table: Source table name
+        columns: All column names of the source table
+        where_sql: WHERE clause selecting the records (from _build_where_clause)
+        values: Parameters for where_sql
+        reason: Why archiving ('delete', 'update', 'manual')
+        notes: Optional additional context
+
+    Returns:
+        Number of records archived
+    """
+    json_pairs = ', '.join(f"'{col}', {col}" for col in columns)
+    source_id = 'id' if 'id' in columns else 'NULL'
+
+    sql = (
+        f"INSERT INTO archive (source_table, source_id, record_data, reason, notes) "
+        f"SELECT ?, {source_id}, json_object({json_pairs}), ?, ? FROM {table}{where_sql}"
+    )
+    logger.debug(f"SQL: {sql}")
+
+    cursor = db_connection.execute(sql, [table, reason, notes, *values])
+    logger.info(f"✓ Archived {cursor.rowcount} records from {table} in SQL (reason: {reason})")
+    return cursor.rowcount
 
 
 def _delete_records_unsafe(db_connection, table: str, filters: dict) -> int:
@@ -72,7 +123,7 @@ def _delete_records_unsafe(db_connection, table: str, filters: dict) -> int:
     Args:
         db_connection: Active database connection (from context manager)
         table: Name of the database table
-        filters: Dict of column:value pairs for WHERE clause
+        filters: Dict of column:value pairs (or politica.filters conditions)
 
     Returns:
         Number of rows deleted
@@ -85,9 +136,7 @@ def _delete_records_unsafe(db_connection, table: str, filters: dict) -> int:
         raise ValueError("Must provide filters to prevent deleting all records")
 
     # Build WHERE clause
-    conditions = [f"{col} = ?" for col in filters.keys()]
-    where_sql = " WHERE " + " AND ".join(conditions)
-    values = list(filters.values())
+    where_sql, values = build_where(filters)
 
     sql = f"DELETE FROM {table}{where_sql}"
 
@@ -110,71 +159,106 @@ class Database:
     Initialized once per application with database path and schemas.
     """
 
-    def __init__(self, db_path: Path = DB_PATH, schema_dir: Path = SCHEMA_PATH):
+    def __init__(self, db_path: Path = DB_PATH, schema_dir: Path = SCHEMA_PATH,
+                 pool_size: int = DB_POOL_SIZE,
+                 pragma_profile: str = DB_PRAGMA_PROFILE,
+                 pragma_overrides: Optional[dict] = None,
+                 bulk_chunk_size: int = DB_BULK_CHUNK_SIZE,
+                 fetch_batch_size: int = DB_FETCH_BATCH_SIZE):
         """
         Initialize database connection manager.
 
         Ensures database exists with proper schema. Creates if missing.
         Raises error if database cannot be created or schemas are invalid.
+        Configures the connection pool used by every operation on this instance.
 
         Args:
             db_path: Path to SQLite database file
             schema_dir: Directory containing .sql schema files
+            pool_size: Maximum idle connections kept open for reuse
+            pragma_profile: Named PRAGMA profile ('server', 'bulk_import', 'test', 'default')
+            pragma_overrides: Optional pragma:value dict applied on top of the profile
+                              (defaults to [database.pragmas] in config.toml)
+            bulk_chunk_size: Default rows per executemany() batch in insert_many()
+            fetch_batch_size: Default rows per fetchmany() batch in iter_query()
 
         Raises:
             FileNotFoundError: If schema files not found
+            ValueError: If pragma profile or overrides are invalid
             sqlite3.Error: If database initialization fails
         """
         self.db_path = db_path
         self.schema_dir = schema_dir
+        self.pragma_profile = pragma_profile
+        self.bulk_chunk_size = bulk_chunk_size
+        self.fetch_batch_size = fetch_batch_size
+
+        if pragma_overrides is None:
+            pragma_overrides = DB_PRAGMA_OVERRIDES
+        pragmas = resolve_pragmas(pragma_profile, pragma_overrides)
 
         # Ensure database exists with schema
         self._ensure_initialized()
 
+        # Long-lived connections, reused across calls and threads
+        self._pool = ConnectionPool(self.db_path, max_idle=pool_size, pragmas=pragmas)
+
+        # Per-table schema columns and INSERT SQL, filled lazily on first use
+        self._table_columns: dict[str, list[str]] = {}
+        self._insert_plans: dict[str, tuple[list[str], str]] = {}
+
+    def close(self):
+        """
+        Close all pooled connections.
+
+        Call when the database is no longer needed (e.g. test teardown).
+        The instance cannot be used after closing.
+        """
+        self._pool.close()
+
     def _ensure_initialized(self):
         """
-        Check if database exists, initialize if not.
+        Create the database if missing and apply pending schema migrations.
 
-        Creates storage directory and executes all schema files.
+        Creates storage directory, then runs politica.migrations: new databases
+        get every step, existing ones only the steps they haven't applied.
         Logs each step for debugging.
         """
         if self.db_path.exists():
             logger.info(f"Database found at {self.db_path}")
-            return
-
-        logger.warning(f"Database not found at {self.db_path}, initializing...")
-
-        # Create storage directory
-        storage_path = self.db_path.parent
-        storage_path.mkdir(parents=True, exist_ok=True)
-
-        # Find schema files
-        schema_files = sorted(self.schema_dir.glob('*.sql'))
-        if not schema_files:
-            logger.error(f"No schema files found in {self.schema_dir}")
-            raise FileNotFoundError(f"No .sql files in {self.schema_dir}")
+        else:
+            logger.warning(f"Database not found at {self.db_path}, initializing...")
 
-        logger.info(f"Found {len(schema_files)} schema files to execute")
+            # Create storage directory
+            storage_path = self.db_path.parent
+            storage_path.mkdir(parents=True, exist_ok=True)
 
-        # Execute schemas
-        conn = sqlite3.connect(self.db_path)
         try:
-            for schema_file in schema_files:
-                logger.info(f"Executing schema: {schema_file.name}")
-                with open(schema_file, 'r') as f:
-                    schema = f.read()
-                    conn.executescript(schema)
-
-            conn.commit()
-            logger.info("✓ Database initialized successfully with all schemas")
+            applied = migrate(self.db_path, self.schema_dir)
         except sqlite3.Error as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error(f"Failed to migrate database: {e}")
             raise
         except FileNotFoundError as e:
             logger.error(f"Schema file not found: {e}")
             raise
-        finally:
-            conn.close()
+
+        if applied:
+            logger.info(f"✓ Database initialized successfully (migrations {applied})")
+
+    def migrate(self) -> List[int]:
+        """
+        Apply pending schema migrations to this database.
+
+        Runs automatically at construction; call again after adding migrations
+        at runtime. Clears the schema caches, since migrations can change columns.
+
+        Returns:
+            Versions applied (empty if already current)
+        """
+        applied = migrate(self.db_path, self.schema_dir)
+        if applied:
+            self.invalidate_schema_cache()
+        return applied
 
     @contextmanager
     def _get_connection(self):
@@ -182,51 +266,132 @@ class Database:
         Context manager for database connections.
 
         Handles connection lifecycle:
-        - Opens connection with Row factory (returns dict-like rows)
+        - Borrows a pooled connection with Row factory (returns dict-like rows)
         - Commits on success
         - Rolls back on exception
-        - Always closes connection
+        - Returns connection to the pool (nested use joins the outer transaction)
 
         Usage:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(sql, values)
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Return dict-like rows
+        with self._pool.connection() as conn:
+            yield conn
 
-        try:
+    @contextmanager
+    def transaction(self):
+        """
+        Run several Database calls as one transaction.
+
+        Every call made on this thread inside the block joins the same
+        connection and transaction: all of them commit together when the
+        block exits, or roll back together if it raises.
+
+        Usage:
+            with db.transaction():
+                db.insert_many('action_goal_progress', rows, conflict_target=['action_id', 'goal_id'])
+                db.update_by_uuid('goals', goal_uuid, {'notes': 'Progress stored'})
+
+        Yields:
+            The underlying connection (for callers that need raw SQL)
+        """
+        with self._get_connection() as conn:
             yield conn
-            conn.commit()
-            logger.debug("Database transaction committed")
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database transaction rolled back: {e}")
-            raise
-        finally:
-            conn.close()
-            logger.debug("Database connection closed")
+
+    def _get_table_columns(self, conn, table: str) -> list[str]:
+        """
+        Get all column names of a table, cached after the first lookup.
+
+        Args:
+            conn: Active database connection (from context manager)
+            table: Name of the database table
+
+        Returns:
+            Column names in schema order (including id, if present)
+        """
+        columns = self._table_columns.get(table)
+        if columns is None:
+            # table_info format: (cid, name, type, notnull, dflt_value, pk)
+            table_info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+            columns = [col[1] for col in table_info]
+            self._table_columns[table] = columns
+        return columns
+
+    def _get_insert_plan(self, conn, table: str) -> tuple[list[str], str]:
+        """
+        Get schema columns and prepared INSERT SQL for a table.
+
+        Reads PRAGMA table_info once per table and caches the result, so writes
+        after the first skip the schema round-trip. The cache is dropped by
+        invalidate_schema_cache() whenever the schema changes.
+
+        Args:
+            conn: Active database connection (from context manager)
+            table: Name of the database table
+
+        Returns:
+            Tuple of (schema_columns, insert_sql)
+
+        Raises:
+            ValueError: If the table has no columns (excluding id)
+        """
+        plan = self._insert_plans.get(table)
+        if plan is not None:
+            return plan
+
+        # Get actual table columns from database schema (not from data!)
+        # This ensures we use the schema as the source of truth
+        # Exclude id (autoincrement)
+        schema_columns = [col for col in self._get_table_columns(conn, table) if col != 'id']
+
+        if not schema_columns:
+            raise ValueError(f"No columns found in {table} schema (excluding id)")
+
+        # Use schema columns for INSERT statement
+        placeholders = ', '.join(['?' for _ in schema_columns])
+        columns_str = ', '.join(schema_columns)
+        sql = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
+
+        logger.debug(f"Cached schema columns for {table}: {schema_columns}")
+        plan = (schema_columns, sql)
+        self._insert_plans[table] = plan
+        return plan
+
+    def invalidate_schema_cache(self, table: Optional[str] = None):
+        """
+        Forget cached schema columns and INSERT SQL.
+
+        Call after anything that changes table structure (migrations).
+
+        Args:
+            table: Table to invalidate. If None, clears the cache for all tables.
+        """
+        if table is None:
+            self._table_columns.clear()
+            self._insert_plans.clear()
+        else:
+            self._table_columns.pop(table, None)
+            self._insert_plans.pop(table, None)
+        logger.debug(f"Invalidated schema cache for {table or 'all tables'}")
 
     def _build_where_clause(self, filters: dict) -> tuple[str, list]:
         """
         Build SQL WHERE clause from filters dictionary.
 
         Args:
-            filters: Dict of column:value pairs
-                     Example: {'unit': 'km_run', 'id': 5}
+            filters: Dict of column:value pairs, where a value may also be a
+                     condition from politica.filters (Between, In, IsNull, ...)
+                     Example: {'unit': 'km_run', 'log_time': Gte('2025-10-01')}
 
         Returns:
             Tuple of (sql_string, values_list)
-            Example: (" WHERE unit = ? AND id = ?", ['km_run', 5])
-        """
-        if not filters:
-            return "", []
-
-        conditions = [f"{col} = ?" for col in filters.keys()]
-        where_sql = " WHERE " + " AND ".join(conditions)
-        values = list(filters.values())
+            Example: (" WHERE unit = ? AND log_time >= ?", ['km_run', '2025-10-01'])
 
-        return where_sql, values
+        Raises:
+            ValueError: If a column name is not a valid identifier
+        """
+        return build_where(filters)
 
     def _build_set_clause(self, updates: dict) -> tuple[str, list]:
         """
@@ -250,21 +415,76 @@ class Database:
         return set_sql, values
 
 
-    def query(self, table: str, filters: Optional[dict] = None, order_by: Optional[str] = None) -> List[dict]:
+    def _build_select(self, table: str, filters: Optional[dict] = None,
+                      order_by: Optional[str] = None,
+                      columns: Optional[List[str]] = None,
+                      limit: Optional[int] = None,
+                      offset: Optional[int] = None,
+                      after: Optional[dict] = None) -> tuple[str, list]:
+        """
+        Build SELECT SQL for query() and iter_query().
+
+        Returns:
+            Tuple of (sql_string, values_list)
+
+        Raises:
+            ValueError: If an identifier, ORDER BY term, limit or offset is invalid
+        """
+        # Build SQL query
+        sql = f"SELECT {build_columns(columns)} FROM {validate_identifier(table)}"
+
+        # Add WHERE clause if filters provided
+        where_sql, values = self._build_where_clause(filters)
+
+        # Keyset pagination: continue after the last row of the previous page
+        if after:
+            keyset_sql, keyset_values = build_keyset(after)
+            where_sql = f"{where_sql} AND {keyset_sql}" if where_sql else f" WHERE {keyset_sql}"
+            values = values + keyset_values
+        sql += where_sql
+
+        # Add ORDER BY if specified
+        if order_by:
+            sql += f" ORDER BY {validate_order_by(order_by)}"
+
+        if limit is not None or offset is not None:
+            for name, number in (('limit', limit), ('offset', offset)):
+                if number is not None and (not isinstance(number, int) or number < 0):
+                    raise ValueError(f"{name} must be a non-negative integer, got {number!r}")
+            sql += " LIMIT ? OFFSET ?"
+            values = values + [-1 if limit is None else limit, offset or 0]
+
+        logger.debug(f"SQL: {sql}")
+        logger.debug(f"Values: {values}")
+        return sql, values
+
+    def query(self, table: str, filters: Optional[dict] = None, order_by: Optional[str] = None,
+              columns: Optional[List[str]] = None, limit: Optional[int] = None,
+              offset: Optional[int] = None, after: Optional[dict] = None) -> List[dict]:
         """
         Fetch records from a database table.
 
         Args:
             table: Name of the database table
-            filters: Optional dict of column:value pairs for WHERE clause
-                     Example: {'unit': 'km_run', 'start_date': '2025-10-10'}
+            filters: Optional dict of column:value pairs for WHERE clause.
+                     Values may be conditions from politica.filters
+                     Example: {'unit': 'km_run', 'log_time': Between(start, end)}
             order_by: Optional column name to order results by
                       Example: 'created_at DESC'
+            columns: Optional list of columns to return (default: all)
+            limit: Optional maximum number of rows
+            offset: Optional number of rows to skip
+            after: Optional keyset cursor - only rows after these column values.
+                   Use with an ascending order_by on the same columns
+                   Example: {'log_time': last['log_time'], 'uuid_id': last['uuid_id']}
 
         Returns:
             List of dicts, each representing a row from the table
             Empty list if no records found
 
+        Raises:
+            ValueError: If a column name, ORDER BY term, limit or offset is invalid
+
         Example:
             # Get all actions
             actions = db.query('actions')
@@ -274,35 +494,130 @@ class Database:
 
             # Get recent actions
             recent = db.query('actions', order_by='log_time DESC')
-        """
-        # Build SQL query
-        sql = f"SELECT * FROM {table}"
-        values = []
-
-        # Add WHERE clause if filters provided
-        if filters:
-            where_sql, values = self._build_where_clause(filters)
-            sql += where_sql
 
-        # Add ORDER BY if specified
-        if order_by:
-            sql += f" ORDER BY {order_by}"
+            # Actions in October, 50 at a time
+            page = db.query('actions', filters={'log_time': Between('2025-10-01', '2025-11-01')},
+                            order_by='log_time, uuid_id', limit=50)
+        """
+        sql, values = self._build_select(table, filters, order_by,
+                                         columns, limit, offset, after)
 
         logger.info(f"Querying {len(filters) if filters else 'all'} records from {table}")
-        logger.debug(f"SQL: {sql}")
-        logger.debug(f"Values: {values}")
 
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, values)
-            rows = cursor.fetchall()
+            cursor = conn.execute(sql, values)
 
-            # Convert Row objects to regular dicts
-            results = [dict(row) for row in rows]
+            # Convert Row objects to regular dicts straight from the cursor
+            results = [dict(row) for row in cursor]
 
             logger.debug(f"Query returned {len(results)} rows")
             return results
 
+    def aggregate(self, table: str, aggregates: dict,
+                  group_by: Optional[List[str]] = None,
+                  filters: Optional[dict] = None) -> List[dict]:
+        """
+        Compute aggregates inside SQLite, optionally per group.
+
+        Only one row per group crosses into Python, however many rows are
+        aggregated.
+
+        Args:
+            table: Name of the database table
+            aggregates: Dict of result name → (function, column), with function
+                        one of COUNT, SUM, TOTAL, MIN, MAX, AVG
+                        Example: {'total': ('SUM', 'contribution'), 'n': ('COUNT', '*')}
+            group_by: Optional columns to group by (returned in each row)
+            filters: Optional dict of column:value pairs (or conditions) for WHERE
+
+        Returns:
+            List of dicts with the group_by columns and aggregate names. Without
+            group_by, exactly one row (aggregates of an empty table are NULL,
+            except COUNT and TOTAL)
+
+        Raises:
+            ValueError: If a name, function or column is not allowed
+
+        Example:
+            per_goal = db.aggregate('action_goal_progress',
+                                    {'total': ('SUM', 'contribution'), 'n': ('COUNT', '*')},
+                                    group_by=['goal_id'])
+        """
+        select = build_aggregates(aggregates)
+        if group_by:
+            select = f"{build_columns(group_by)}, {select}"
+
+        sql = f"SELECT {select} FROM {validate_identifier(table)}"
+        where_sql, values = self._build_where_clause(filters)
+        sql += where_sql
+        if group_by:
+            sql += f" GROUP BY {build_columns(group_by)}"
+
+        logger.debug(f"SQL: {sql}")
+        with self._get_connection() as conn:
+            results = [dict(row) for row in conn.execute(sql, values)]
+
+        logger.info(f"Aggregated {table} into {len(results)} rows")
+        return results
+
+    def iter_query(self, table: str, filters: Optional[dict] = None,
+                   order_by: Optional[str] = None,
+                   batch_size: Optional[int] = None,
+                   as_dicts: bool = True,
+                   columns: Optional[List[str]] = None,
+                   limit: Optional[int] = None,
+                   after: Optional[dict] = None) -> Iterator[Union[dict, sqlite3.Row]]:
+        """
+        Stream records from a database table instead of loading them all.
+
+        Rows are fetched with fetchmany() in batches, so memory stays bounded
+        by batch_size regardless of table size. The generator holds its own
+        pooled connection until it is exhausted or closed.
+
+        Note: Under the rollback journal (pragma profile 'default') an open
+        stream blocks writers; the WAL profiles ('server', 'bulk_import') don't.
+
+        Args:
+            table: Name of the database table
+            filters: Optional dict of column:value pairs (or politica.filters conditions)
+            order_by: Optional column name to order results by
+            batch_size: Rows per fetchmany() call (default: fetch_batch_size)
+            as_dicts: If True, yield dicts. If False, yield sqlite3.Row objects
+                      (dict-like, cheaper when the caller converts them anyway)
+            columns: Optional list of columns to return (default: all)
+            limit: Optional maximum number of rows
+            after: Optional keyset cursor, as in query()
+
+        Yields:
+            One dict (or sqlite3.Row) per row
+
+        Example:
+            for record in db.iter_query('actions', order_by='log_time'):
+                process(record)
+        """
+        sql, values = self._build_select(table, filters, order_by,
+                                         columns, limit, after=after)
+        batch_size = batch_size or self.fetch_batch_size
+
+        logger.info(f"Streaming records from {table} (batch size {batch_size})")
+
+        with self._pool.detached_connection() as conn:
+            cursor = conn.execute(sql, values)
+            streamed = 0
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                streamed += len(rows)
+                if as_dicts:
+                    for row in rows:
+                        yield dict(row)
+                else:
+                    yield from rows
+
+            logger.debug(f"Streamed {streamed} rows from {table}")
+
     def insert(self, table: str, records: List[dict]):
         """
         Insert records into a database table.
@@ -334,25 +649,11 @@ class Database:
             logger.warning("Attempted to insert empty list of records")
             raise ValueError("Cannot insert empty list of records")
 
-        # Get actual table columns from database schema (not from data!)
-        # This ensures we use the schema as the source of truth
         with self._get_connection() as conn:
+            # Schema columns are the source of truth (cached per table)
+            schema_columns, sql = self._get_insert_plan(conn, table)
             cursor = conn.cursor()
-            cursor.execute(f"PRAGMA table_info({table})")
-            table_info = cursor.fetchall()
 
-            # Extract column names, excluding id (autoincrement)
-            # table_info format: (cid, name, type, notnull, dflt_value, pk)
-            schema_columns = [col[1] for col in table_info if col[1] != 'id']
-
-            if not schema_columns:
-                raise ValueError(f"No columns found in {table} schema (excluding id)")
-
-            # Use schema columns for INSERT statement
-            placeholders = ', '.join(['?' for _ in schema_columns])
-            columns_str = ', '.join(schema_columns)
-
-            sql = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
             logger.info(f"Inserting {len(records)} records into {table}")
             logger.debug(f"Using schema columns: {schema_columns}")
             logger.debug(f"SQL: {sql}")
@@ -368,6 +669,72 @@ class Database:
         logger.info(f"✓ Inserted {len(records)} records into {table}. IDs: {inserted_ids[0]}-{inserted_ids[-1]}")
         return inserted_ids
 
+    def insert_many(self, table: str, records: Iterable[dict],
+                    chunk_size: Optional[int] = None,
+                    conflict_target: Optional[List[str]] = None) -> int:
+        """
+        Bulk insert records with executemany() in a single transaction.
+
+        Faster than insert() for large batches because it skips per-row
+        execute() calls and row ID collection. Use it when row IDs are not
+        needed (tables keyed by uuid_id). Records are consumed in chunks, so
+        a generator can stream rows without building one big list.
+
+        Args:
+            table: Name of the database table
+            records: Iterable of dicts where keys match table columns
+                     (missing keys insert NULL)
+            chunk_size: Rows per executemany() call (default: bulk_chunk_size)
+            conflict_target: Columns of a UNIQUE constraint. Rows that would
+                             violate it are skipped (ON CONFLICT ... DO NOTHING)
+                             instead of failing the whole batch
+
+        Returns:
+            int: Number of records inserted (skipped conflicts not counted)
+
+        Raises:
+            ValueError: If records is empty (nothing is written)
+
+        Example:
+            count = db.insert_many('actions', (to_row(a) for a in imported_actions))
+            new = db.insert_many('action_goal_progress', rows, conflict_target=['action_id', 'goal_id'])
+        """
+        chunk_size = chunk_size or self.bulk_chunk_size
+        records = iter(records)
+        attempted = 0
+        inserted = 0
+
+        with self._get_connection() as conn:
+            schema_columns, sql = self._get_insert_plan(conn, table)
+            if conflict_target:
+                sql += f" ON CONFLICT({build_columns(conflict_target)}) DO NOTHING"
+            cursor = conn.cursor()
+
+            logger.info(f"Bulk inserting into {table} (chunk size {chunk_size})")
+            logger.debug(f"SQL: {sql}")
+
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                cursor.executemany(
+                    sql,
+                    ([record.get(col) for col in schema_columns] for record in chunk)
+                )
+                attempted += len(chunk)
+                # Rows changed by the statements themselves (not by triggers)
+                inserted += cursor.rowcount
+                logger.debug(f"Inserted chunk of {len(chunk)} ({inserted} total)")
+
+            if attempted == 0:
+                logger.warning("Attempted to bulk insert empty list of records")
+                raise ValueError("Cannot insert empty list of records")
+
+        if inserted < attempted:
+            logger.info(f"Skipped {attempted - inserted} conflicting records in {table}")
+        logger.info(f"✓ Bulk inserted {inserted} records into {table}")
+        return inserted
+
 
     def update(self, table: str, record_id: int, updates: dict,
                archive_old: bool = True, notes: str = '') -> dict:
@@ -397,43 +764,7 @@ class Database:
             result = db.update('goals', record_id=5,
                              updates={'target_date': '2025-12-31'})
         """
-        if not updates:
-            logger.error("Cannot update with empty updates dict")
-            raise ValueError("updates dict cannot be empty")
-
-        # Fetch the current record for archiving
-        current_records = self.query(table, filters={'id': record_id})
-
-        if not current_records:
-            logger.error(f"Record with id={record_id} not found in {table}")
-            raise ValueError(f"No record found with id={record_id} in {table}")
-
-        current_record = current_records[0]
-
-        # Build UPDATE SQL
-        set_sql, values = self._build_set_clause(updates)
-        sql = f"UPDATE {table} SET {set_sql} WHERE id = ?"
-        values.append(record_id)
-
-        logger.info(f"Updating record id={record_id} in {table}")
-        logger.debug(f"SQL: {sql}")
-        logger.debug(f"Values: {values}")
-
-        with self._get_connection() as conn:
-            # Archive old version first if requested
-            if archive_old:
-                _archive_records(conn, table, [current_record],
-                               reason='update', notes=notes)
-
-            # Execute update
-            cursor = conn.cursor()
-            cursor.execute(sql, values)
-            rows_updated = cursor.rowcount
-
-            if rows_updated == 0:
-                logger.warning(f"Update affected 0 rows for id={record_id}")
-
-        logger.info(f"✓ Updated record id={record_id} in {table}")
+        rows_updated = self._update_by_key(table, 'id', record_id, updates, archive_old, notes)
 
         return {
             'id': record_id,
@@ -463,54 +794,79 @@ class Database:
         Raises:
             ValueError: If updates dict is empty or record_uuid not found
         """
-        if not updates:
-            logger.error("Cannot update with empty updates dict")
-            raise ValueError("updates dict cannot be empty")
+        rows_updated = self._update_by_key(table, 'uuid_id', record_uuid, updates, archive_old, notes)
+
+        return {
+            'uuid_id': record_uuid,
+            'archived': archive_old,
+            'updated': rows_updated > 0
+        }
+
+    def _update_by_key(self, table: str, key_column: str, key_value, updates: dict,
+                       archive_old: bool, notes: str) -> int:
+        """
+        Archive and update a single record in one connection and transaction.
 
-        # Fetch the current record for archiving
-        current_records = self.query(table, filters={'uuid_id': record_uuid})
+        The old version is copied to the archive with INSERT ... SELECT, so it
+        is read inside the same transaction as the UPDATE (no separate pre-read
+        query and no window for another writer between read and write).
+        A missing record raises ValueError, which rolls the transaction back.
 
-        if not current_records:
-            logger.error(f"Record with uuid_id={record_uuid} not found in {table}")
-            raise ValueError(f"No record found with uuid_id={record_uuid} in {table}")
+        Args:
+            table: Table name
+            key_column: Column identifying the record ('id' or 'uuid_id')
+            key_value: Value of key_column for the record
+            updates: Dict of column:value pairs to update
+            archive_old: If True, archive the old version before updating
+            notes: Optional notes for the archive entry
 
-        current_record = current_records[0]
+        Returns:
+            Number of rows updated
 
-        # Build UPDATE SQL (using uuid_id instead of id)
+        Raises:
+            ValueError: If updates dict is empty or record not found
+        """
+        if not updates:
+            logger.error("Cannot update with empty updates dict")
+            raise ValueError("updates dict cannot be empty")
+
+        # Build UPDATE SQL
         set_sql, values = self._build_set_clause(updates)
-        sql = f"UPDATE {table} SET {set_sql} WHERE uuid_id = ?"
-        values.append(record_uuid)
+        sql = f"UPDATE {table} SET {set_sql} WHERE {key_column} = ?"
+        values.append(key_value)
 
-        logger.info(f"Updating record uuid_id={record_uuid} in {table}")
+        logger.info(f"Updating record {key_column}={key_value} in {table}")
         logger.debug(f"SQL: {sql}")
         logger.debug(f"Values: {values}")
 
         with self._get_connection() as conn:
-            # Archive old version first if requested
+            # Archive old version first if requested (first write opens the transaction)
             if archive_old:
-                _archive_records(conn, table, [current_record],
-                               reason='update', notes=notes)
+                columns = self._get_table_columns(conn, table)
+                archived = _archive_records_in_sql(
+                    conn, table, columns, f" WHERE {key_column} = ?", [key_value],
+                    reason='update', notes=notes
+                )
+                if archived == 0:
+                    logger.error(f"Record with {key_column}={key_value} not found in {table}")
+                    raise ValueError(f"No record found with {key_column}={key_value} in {table}")
 
             # Execute update
-            cursor = conn.cursor()
-            cursor.execute(sql, values)
+            cursor = conn.execute(sql, values)
             rows_updated = cursor.rowcount
 
             if rows_updated == 0:
-                logger.warning(f"Update affected 0 rows for uuid_id={record_uuid}")
+                logger.error(f"Record with {key_column}={key_value} not found in {table}")
+                raise ValueError(f"No record found with {key_column}={key_value} in {table}")
 
-        logger.info(f"✓ Updated record uuid_id={record_uuid} in {table}")
-
-        return {
-            'uuid_id': record_uuid,
-            'archived': archive_old,
-            'updated': rows_updated > 0
-        }
+        logger.info(f"✓ Updated record {key_column}={key_value} in {table}")
+        return rows_updated
 
     def archive_and_delete(self, table: str, filters: dict,
                           reason: str = 'delete',
                           confirm: bool = False,
-                          notes: str = '') -> dict:
+                          notes: str = '',
+                          in_database: bool = False) -> dict:
         """
         Archive and delete records with preview/confirm workflow.
 
@@ -525,6 +881,9 @@ class Database:
             reason: Why deleting (logged in archive table)
             confirm: If False, preview only. If True, actually delete.
             notes: Optional additional context for archive
+            in_database: If True, count/archive/delete entirely inside SQLite
+                         without loading rows into Python. 'records' is then
+                         always empty. Use for large deletions.
 
         Returns:
             {
@@ -550,6 +909,9 @@ class Database:
             logger.error("Attempted to delete without filters - would delete ALL records!")
             raise ValueError("Must provide filters to prevent deleting all records")
 
+        if in_database:
+            return self._archive_and_delete_in_database(table, filters, reason, confirm, notes)
+
         # Always query first to see what we're working with
         records = self.query(table, filters)
 
@@ -590,3 +952,139 @@ class Database:
             'archived': True
         }
 
+    def _archive_and_delete_in_database(self, table: str, filters: dict, reason: str,
+                                        confirm: bool, notes: str) -> dict:
+        """
+        archive_and_delete() variant that never materializes rows in Python.
+
+        Preview runs SELECT COUNT(*); confirm runs INSERT INTO archive ... SELECT
+        followed by DELETE in one transaction.
+        """
+        where_sql, values = self._build_where_clause(filters)
+
+        with self._get_connection() as conn:
+            if not confirm:
+                count = conn.execute(f"SELECT COUNT(*) FROM {table}{where_sql}", values).fetchone()[0]
+                logger.info(f"PREVIEW: Would archive/delete {count} records from {table}")
+                return {'count': count, 'records': [], 'deleted': False, 'archived': False}
+
+            columns = self._get_table_columns(conn, table)
+            archived = _archive_records_in_sql(conn, table, columns, where_sql, values, reason, notes)
+            deleted = _delete_records_unsafe(conn, table, filters)
+
+            if archived != deleted:
+                raise sqlite3.DatabaseError(
+                    f"Archived {archived} but deleted {deleted} records from {table}"
+                )
+
+        if deleted == 0:
+            logger.info(f"No records found in {table} matching filters: {filters}")
+
+        return {
+            'count': deleted,
+            'records': [],
+            'deleted': deleted > 0,
+            'archived': deleted > 0
+        }
+
+    def get_changes(self, after_seq: int,
+                    tables: Optional[Iterable[str]] = None) -> Tuple[int, List[dict]]:
+        """
+        Read the change log (see politica.change_tracking) after a sequence number.
+
+        Args:
+            after_seq: Last change seq already processed (0 = from the beginning)
+            tables: Only changes to these tables (default: all tracked tables)
+
+        Returns:
+            Tuple of (through_seq, changes): the latest seq covered by this read,
+            and dicts with seq, table_name, row_uuid and operation, oldest first.
+            Store through_seq as the new watermark once the changes are processed
+
+        Example:
+            through, changes = db.get_changes(db.get_change_watermark('export') or 0)
+            ...
+            db.set_change_watermark('export', through)
+        """
+        with self._get_connection() as conn:
+            # Read the high-water mark first: later writers always get larger seqs
+            through_seq = change_tracking.latest_change_seq(conn)
+            rows = change_tracking.read_changes(conn, after_seq, through_seq, tables)
+            changes = [dict(row) for row in rows]
+
+        logger.info(f"Read {len(changes)} changes after seq {after_seq} (through {through_seq})")
+        return through_seq, changes
+
+    def get_change_watermark(self, consumer: str) -> Optional[int]:
+        """
+        Last change seq processed by a consumer.
+
+        Args:
+            consumer: Consumer name (e.g. 'action_goal_inference')
+
+        Returns:
+            Sequence number, or None if the consumer has never recorded one
+        """
+        with self._get_connection() as conn:
+            return change_tracking.get_watermark(conn, consumer)
+
+    def set_change_watermark(self, consumer: str, seq: int) -> None:
+        """
+        Record that a consumer has processed every change up to seq.
+
+        Args:
+            consumer: Consumer name
+            seq: through_seq returned by get_changes()
+        """
+        with self._get_connection() as conn:
+            change_tracking.set_watermark(conn, consumer, seq)
+        logger.debug(f"Watermark for {consumer} set to {seq}")
+
+    def prune_change_log(self) -> int:
+        """
+        Delete change log rows that every consumer has already processed.
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._get_connection() as conn:
+            deleted = change_tracking.prune_changes(conn)
+        logger.info(f"Pruned {deleted} change log rows")
+        return deleted
+
+    def rebuild_goal_progress(self) -> int:
+        """
+        Recompute the materialized goal_progress table from scratch.
+
+        The table is kept current by triggers (see politica.goal_progress);
+        use this after bulk repairs or to clear floating-point drift.
+
+        Returns:
+            Number of goals with progress rows
+        """
+        with self._get_connection() as conn:
+            goals = goal_progress.rebuild_goal_progress(conn)
+        logger.info(f"✓ Rebuilt progress totals for {goals} goals")
+        return goals
+
+
+_default_database: Optional[Database] = None
+_default_database_lock = threading.Lock()
+
+
+def get_default_database() -> Database:
+    """
+    Return the shared Database for the configured default paths.
+
+    Storage services created without an explicit database use this instance,
+    so every request shares one connection pool instead of building its own.
+
+    Returns:
+        Database instance for DB_PATH/SCHEMA_PATH (created on first call)
+    """
+    global _default_database
+
+    with _default_database_lock:
+        if _default_database is None:
+            _default_database = Database()
+        return _default_database
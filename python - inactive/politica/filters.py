@@ -0,0 +1,286 @@
+"""
+Filter conditions for Database queries.
+
+A filters dict maps column name → value. A plain value means equality, exactly
+as before; a condition object from this module expresses anything else:
+
+    from politica.filters import Between, Gte, In, IsNull
+
+    db.query('actions', filters={'log_time': Between('2025-10-01', '2025-10-31')})
+    db.query('goals', filters={'goal_type': In(['Goal', 'SmartGoal']),
+                               'target_date': IsNull()})
+
+Every value is passed as a bound parameter. Column names, ORDER BY terms and
+projections cannot be parameterized, so they are checked against a strict
+identifier pattern instead - anything else raises ValueError before any SQL runs.
+
+Like the rest of politica, this module knows nothing about domain entities.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_ORDER_TERM = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)(?:\s+(ASC|DESC))?$', re.IGNORECASE)
+
+
+def validate_identifier(name: str) -> str:
+    """
+    Check that a table or column name is safe to interpolate into SQL.
+
+    Args:
+        name: Table or column name
+
+    Returns:
+        The name, unchanged
+
+    Raises:
+        ValueError: If name is not a plain SQL identifier
+    """
+    if not isinstance(name, str) or not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def validate_order_by(order_by: str) -> str:
+    """
+    Check an ORDER BY expression such as 'log_time DESC, uuid_id'.
+
+    Args:
+        order_by: Comma-separated columns, each optionally followed by ASC/DESC
+
+    Returns:
+        Normalized expression
+
+    Raises:
+        ValueError: If any term is not 'column' or 'column ASC|DESC'
+    """
+    terms = []
+    for term in order_by.split(','):
+        match = _ORDER_TERM.match(term.strip())
+        if not match:
+            raise ValueError(f"Invalid ORDER BY term: {term.strip()!r}")
+        column, direction = match.groups()
+        terms.append(f"{column} {direction.upper()}" if direction else column)
+    return ', '.join(terms)
+
+
+class Condition(ABC):
+    """Base class for filter conditions other than plain equality."""
+
+    @abstractmethod
+    def to_sql(self, column: str) -> tuple[str, list]:
+        """
+        Render this condition for one column.
+
+        Returns:
+            Tuple of (sql_fragment, values_list)
+            Example: ("log_time >= ?", ['2025-10-01'])
+        """
+
+
+@dataclass(frozen=True)
+class Gt(Condition):
+    """column > value"""
+    value: Any
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} > ?", [self.value]
+
+
+@dataclass(frozen=True)
+class Gte(Condition):
+    """column >= value"""
+    value: Any
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} >= ?", [self.value]
+
+
+@dataclass(frozen=True)
+class Lt(Condition):
+    """column < value"""
+    value: Any
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} < ?", [self.value]
+
+
+@dataclass(frozen=True)
+class Lte(Condition):
+    """column <= value"""
+    value: Any
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} <= ?", [self.value]
+
+
+@dataclass(frozen=True)
+class Ne(Condition):
+    """column != value"""
+    value: Any
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} != ?", [self.value]
+
+
+@dataclass(frozen=True)
+class Between(Condition):
+    """low <= column <= high (either bound may be None for an open range)"""
+    low: Any = None
+    high: Any = None
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        if self.low is not None and self.high is not None:
+            return f"{column} BETWEEN ? AND ?", [self.low, self.high]
+        if self.low is not None:
+            return f"{column} >= ?", [self.low]
+        if self.high is not None:
+            return f"{column} <= ?", [self.high]
+        raise ValueError(f"Between on {column} needs at least one bound")
+
+
+@dataclass(frozen=True)
+class In(Condition):
+    """column IN (values...) - an empty list matches nothing"""
+    values: Sequence[Any]
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        values = list(self.values)
+        if not values:
+            return "0", []
+        placeholders = ', '.join('?' for _ in values)
+        return f"{column} IN ({placeholders})", values
+
+
+@dataclass(frozen=True)
+class NotIn(Condition):
+    """column NOT IN (values...) - an empty list matches everything"""
+    values: Sequence[Any]
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        values = list(self.values)
+        if not values:
+            return "1", []
+        placeholders = ', '.join('?' for _ in values)
+        return f"{column} NOT IN ({placeholders})", values
+
+
+@dataclass(frozen=True)
+class IsNull(Condition):
+    """column IS NULL"""
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} IS NULL", []
+
+
+@dataclass(frozen=True)
+class NotNull(Condition):
+    """column IS NOT NULL"""
+
+    def to_sql(self, column: str) -> tuple[str, list]:
+        return f"{column} IS NOT NULL", []
+
+
+def build_where(filters: Optional[dict]) -> tuple[str, list]:
+    """
+    Build a WHERE clause from a filters dict.
+
+    Args:
+        filters: Dict of column → plain value (equality) or Condition
+
+    Returns:
+        Tuple of (sql_string, values_list)
+        Example: (" WHERE unit = ? AND log_time >= ?", ['km', '2025-10-01'])
+
+    Raises:
+        ValueError: If a column name is not a valid identifier
+    """
+    if not filters:
+        return "", []
+
+    conditions = []
+    values = []
+    for column, value in filters.items():
+        validate_identifier(column)
+        if isinstance(value, Condition):
+            sql, condition_values = value.to_sql(column)
+            conditions.append(sql)
+            values.extend(condition_values)
+        else:
+            conditions.append(f"{column} = ?")
+            values.append(value)
+
+    return " WHERE " + " AND ".join(conditions), values
+
+
+def build_keyset(after: dict) -> tuple[str, list]:
+    """
+    Build a keyset-pagination condition: rows strictly after a cursor position.
+
+    The cursor columns must match the query's ORDER BY (ascending) for the
+    result to be a correct page.
+
+    Args:
+        after: Ordered dict of column → last value seen
+               Example: {'log_time': '2025-10-01T08:00:00', 'uuid_id': 'abc'}
+
+    Returns:
+        Tuple of (sql_fragment, values_list)
+        Example: ("(log_time, uuid_id) > (?, ?)", ['2025-10-01T08:00:00', 'abc'])
+    """
+    columns = [validate_identifier(column) for column in after]
+    if not columns:
+        raise ValueError("Keyset cursor needs at least one column")
+    placeholders = ', '.join('?' for _ in columns)
+    return f"({', '.join(columns)}) > ({placeholders})", list(after.values())
+
+
+def build_columns(columns: Optional[Iterable[str]]) -> str:
+    """
+    Build the SELECT column list.
+
+    Args:
+        columns: Column names to project, or None for all columns
+
+    Returns:
+        '*' or comma-separated validated column names
+    """
+    if not columns:
+        return "*"
+    return ', '.join(validate_identifier(column) for column in columns)
+
+
+# Aggregate functions allowed in Database.aggregate()
+AGGREGATE_FUNCTIONS = {'COUNT', 'SUM', 'TOTAL', 'MIN', 'MAX', 'AVG'}
+
+
+def build_aggregates(aggregates: dict) -> str:
+    """
+    Build the aggregate part of a SELECT list.
+
+    Args:
+        aggregates: Dict of result name → (function, column); column '*' is
+                    only allowed with COUNT
+                    Example: {'total': ('SUM', 'contribution'), 'n': ('COUNT', '*')}
+
+    Returns:
+        Comma-separated 'FUNCTION(column) AS name' terms
+
+    Raises:
+        ValueError: If a name, function or column is not allowed
+    """
+    if not aggregates:
+        raise ValueError("At least one aggregate is required")
+
+    terms = []
+    for name, (function, column) in aggregates.items():
+        function = function.upper()
+        if function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(f"Invalid aggregate function: {function!r}")
+        if column != '*' or function != 'COUNT':
+            validate_identifier(column)
+        terms.append(f"{function}({column}) AS {validate_identifier(name)}")
+    return ', '.join(terms)
@@ -0,0 +1,173 @@
+"""
+Materialized per-goal progress totals.
+
+goal_progress keeps one row per goal with the sum, count and latest action
+log_time of its action_goal_progress rows. Triggers update it on every
+insert, update and delete of action_goal_progress, so reading a goal's
+progress is a primary-key lookup instead of re-matching every action.
+
+- Insert: add the contribution (upsert, so the first match creates the row)
+- Delete: subtract it; last_contribution_at is only re-derived when the
+  deleted action was the latest one
+- Update of contribution/goal_id/action_id: delete effect, then insert effect
+- Action log_time edits refresh last_contribution_at of the goals it feeds
+- Goal deletes drop the goal's row
+
+PRAGMA foreign_keys is off, so the ON DELETE CASCADE clauses of
+action_goal_progress never fire. CASCADE_TRIGGERS do that work instead:
+deleting an action or goal first deletes its action_goal_progress rows,
+whose own trigger subtracts them while the action's log_time can still be
+read (BEFORE DELETE).
+
+Totals are maintained by addition and subtraction, so after many changes
+they may differ from a fresh SUM() in the last floating-point digits.
+rebuild_goal_progress() recomputes every row exactly.
+
+Installed on existing databases by migrations 4 (totals) and 5 (cascades);
+all statements are idempotent.
+
+Like the rest of politica, this module knows nothing about domain entities.
+"""
+
+import sqlite3
+from config.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+GOAL_PROGRESS_TABLE = """
+CREATE TABLE IF NOT EXISTS goal_progress (
+    goal_id TEXT PRIMARY KEY,               -- UUID of goal
+    total REAL NOT NULL DEFAULT 0,          -- Sum of action_goal_progress.contribution
+    match_count INTEGER NOT NULL DEFAULT 0, -- Number of action_goal_progress rows
+    last_contribution_at TEXT,              -- Latest log_time of a contributing action
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+# Latest log_time among a goal's contributing actions
+_LAST_CONTRIBUTION = """(
+    SELECT MAX(a.log_time) FROM action_goal_progress p
+    JOIN actions a ON a.uuid_id = p.action_id
+    WHERE p.goal_id = {row}.goal_id
+)"""
+
+_ADD_ROW = """
+    INSERT INTO goal_progress (goal_id, total, match_count, last_contribution_at)
+    VALUES ({row}.goal_id, {row}.contribution, 1,
+            (SELECT log_time FROM actions WHERE uuid_id = {row}.action_id))
+    ON CONFLICT(goal_id) DO UPDATE SET
+        total = total + excluded.total,
+        match_count = match_count + 1,
+        last_contribution_at = CASE
+            WHEN last_contribution_at IS NULL
+                 OR excluded.last_contribution_at > last_contribution_at
+            THEN excluded.last_contribution_at
+            ELSE last_contribution_at END,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+_REMOVE_ROW = """
+    UPDATE goal_progress SET
+        -- Reset exactly to zero so subtraction residue doesn't linger
+        total = CASE WHEN match_count <= 1 THEN 0.0 ELSE total - {row}.contribution END,
+        match_count = MAX(match_count - 1, 0),
+        last_contribution_at = CASE
+            WHEN last_contribution_at IS (SELECT log_time FROM actions WHERE uuid_id = {row}.action_id)
+            THEN {last}
+            ELSE last_contribution_at END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE goal_id = {row}.goal_id;
+"""
+
+TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_insert AFTER INSERT ON action_goal_progress\n"
+    f"BEGIN {_ADD_ROW.format(row='NEW')} END",
+
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_delete AFTER DELETE ON action_goal_progress\n"
+    f"BEGIN {_REMOVE_ROW.format(row='OLD', last=_LAST_CONTRIBUTION.format(row='OLD'))} END",
+
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_update AFTER UPDATE ON action_goal_progress\n"
+    "WHEN OLD.contribution IS NOT NEW.contribution OR OLD.goal_id IS NOT NEW.goal_id\n"
+    "     OR OLD.action_id IS NOT NEW.action_id\n"
+    f"BEGIN {_REMOVE_ROW.format(row='OLD', last=_LAST_CONTRIBUTION.format(row='OLD'))}"
+    f"{_ADD_ROW.format(row='NEW')} END",
+
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_action_time AFTER UPDATE OF log_time ON actions\n"
+    "WHEN OLD.log_time IS NOT NEW.log_time\n"
+    "BEGIN\n"
+    "    UPDATE goal_progress SET\n"
+    f"        last_contribution_at = {_LAST_CONTRIBUTION.format(row='goal_progress')},\n"
+    "        updated_at = CURRENT_TIMESTAMP\n"
+    "    WHERE goal_id IN (SELECT goal_id FROM action_goal_progress WHERE action_id = NEW.uuid_id);\n"
+    "END",
+
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_goal_delete AFTER DELETE ON goals\n"
+    "BEGIN DELETE FROM goal_progress WHERE goal_id = OLD.uuid_id; END",
+]
+
+# Stand-ins for ON DELETE CASCADE on action_goal_progress (migration 5)
+CASCADE_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_action_delete BEFORE DELETE ON actions\n"
+    "BEGIN DELETE FROM action_goal_progress WHERE action_id = OLD.uuid_id; END",
+
+    "CREATE TRIGGER IF NOT EXISTS trg_goal_progress_goal_cascade BEFORE DELETE ON goals\n"
+    "BEGIN DELETE FROM action_goal_progress WHERE goal_id = OLD.uuid_id; END",
+]
+
+
+def rebuild_goal_progress(conn: sqlite3.Connection) -> int:
+    """
+    Recompute every goal_progress row from action_goal_progress.
+
+    Args:
+        conn: Open connection (inside the caller's transaction)
+
+    Returns:
+        Number of goals with progress rows
+    """
+    conn.execute("DELETE FROM goal_progress")
+    cursor = conn.execute("""
+        INSERT INTO goal_progress (goal_id, total, match_count, last_contribution_at)
+        SELECT p.goal_id, SUM(p.contribution), COUNT(*), MAX(a.log_time)
+        FROM action_goal_progress p
+        LEFT JOIN actions a ON a.uuid_id = p.action_id
+        GROUP BY p.goal_id
+    """)
+    return cursor.rowcount
+
+
+def apply_goal_progress(conn: sqlite3.Connection) -> None:
+    """
+    Create goal_progress and its triggers, and fill it from existing matches.
+
+    Args:
+        conn: Open connection (inside the caller's transaction)
+    """
+    conn.execute(GOAL_PROGRESS_TABLE)
+    for statement in TRIGGERS:
+        conn.execute(statement)
+    goals = rebuild_goal_progress(conn)
+    logger.info(f"Materialized progress for {goals} goals")
+
+
+def apply_goal_progress_cascades(conn: sqlite3.Connection) -> None:
+    """
+    Delete relationship rows together with their action or goal.
+
+    Also drops rows already orphaned by earlier deletes and recomputes
+    goal_progress, so existing databases start out consistent.
+
+    Args:
+        conn: Open connection (inside the caller's transaction)
+    """
+    for statement in CASCADE_TRIGGERS:
+        conn.execute(statement)
+    cursor = conn.execute("""
+        DELETE FROM action_goal_progress
+        WHERE action_id NOT IN (SELECT uuid_id FROM actions)
+           OR goal_id NOT IN (SELECT uuid_id FROM goals)
+    """)
+    if cursor.rowcount:
+        logger.info(f"Removed {cursor.rowcount} orphaned action-goal relationships")
+    rebuild_goal_progress(conn)
@@ -0,0 +1,211 @@
+"""
+Versioned schema migrations.
+
+Each database records the migrations applied to it in a schema_version table.
+At startup, Database runs every migration newer than the recorded version, in
+order, each in its own transaction together with its schema_version row. A
+failed step rolls back completely and the next startup retries it.
+
+When the database is already current, startup reads one row and stops - the
+schema files are not globbed or read.
+
+Adding a migration:
+- Append a Migration with the next version number to MIGRATIONS
+- Make it idempotent (IF NOT EXISTS, skip already-converted rows): databases
+  created before this module existed replay every step from version 1
+- Never edit or reorder a released step; ship a new one instead
+
+Version 1 executes schemas/*.sql, so new databases and existing ones converge
+on the same schema. Changing a CREATE TABLE in a schema file only affects new
+databases - existing ones need a migration step (e.g. ALTER TABLE).
+
+Like the rest of politica, this module knows nothing about domain entities.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, List
+from config.logging_setup import get_logger
+from politica.change_tracking import apply_change_tracking
+from politica.goal_progress import apply_goal_progress, apply_goal_progress_cascades
+from politica.time_indexes import apply_time_indexes
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One ordered schema change.
+
+    Attributes:
+        version: Position in the migration sequence (1, 2, 3, ...)
+        name: Short description, stored in schema_version
+        apply: Function(conn, schema_dir) executing the change. Runs inside a
+               transaction the runner commits - it must not commit itself
+    """
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection, Path], None]
+
+
+def split_sql_statements(script: str) -> Iterator[str]:
+    """
+    Split a SQL script into complete statements.
+
+    Unlike executescript(), executing the statements one at a time keeps them
+    inside the caller's transaction. Statement boundaries come from
+    sqlite3.complete_statement(), so semicolons inside strings and
+    CREATE TRIGGER ... BEGIN ... END bodies are handled.
+
+    Args:
+        script: Contents of a .sql file
+
+    Yields:
+        One SQL statement (with any preceding comments) at a time
+    """
+    buffer = ''
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            yield buffer
+            buffer = ''
+
+    if buffer.strip():
+        # Trailing comments, or an unterminated statement SQLite will reject
+        yield buffer
+
+
+def _apply_schema_files(conn: sqlite3.Connection, schema_dir: Path) -> None:
+    """Execute every schemas/*.sql file (CREATE ... IF NOT EXISTS, so safe on existing databases)."""
+    schema_files = sorted(schema_dir.glob('*.sql'))
+    if not schema_files:
+        logger.error(f"No schema files found in {schema_dir}")
+        raise FileNotFoundError(f"No .sql files in {schema_dir}")
+
+    logger.info(f"Found {len(schema_files)} schema files to execute")
+
+    for schema_file in schema_files:
+        logger.info(f"Executing schema: {schema_file.name}")
+        for statement in split_sql_statements(schema_file.read_text()):
+            conn.execute(statement)
+
+
+def _apply_time_indexes(conn: sqlite3.Connection, schema_dir: Path) -> None:
+    """Canonicalize timestamps and index the time-range columns."""
+    rewritten = apply_time_indexes(conn)
+    if rewritten:
+        logger.info(f"Normalized {rewritten} timestamps")
+
+
+def _apply_change_tracking(conn: sqlite3.Connection, schema_dir: Path) -> None:
+    """Log changes to actions and goals for incremental consumers."""
+    apply_change_tracking(conn)
+
+
+def _apply_goal_progress(conn: sqlite3.Connection, schema_dir: Path) -> None:
+    """Materialize per-goal progress totals, maintained by triggers."""
+    apply_goal_progress(conn)
+
+
+def _apply_goal_progress_cascades(conn: sqlite3.Connection, schema_dir: Path) -> None:
+    """Delete action_goal_progress rows with their action or goal."""
+    apply_goal_progress_cascades(conn)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'baseline_schema', _apply_schema_files),
+    Migration(2, 'time_indexes', _apply_time_indexes),
+    Migration(3, 'change_tracking', _apply_change_tracking),
+    Migration(4, 'goal_progress', _apply_goal_progress),
+    Migration(5, 'goal_progress_cascades', _apply_goal_progress_cascades),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+_SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """
+    Read the highest applied migration version.
+
+    Args:
+        conn: Open connection
+
+    Returns:
+        Latest applied version, or 0 for a database without schema_version
+    """
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] or 0
+
+
+def migrate(db_path: Path, schema_dir: Path, migrations: List[Migration] = MIGRATIONS) -> List[int]:
+    """
+    Bring a database up to the latest schema version.
+
+    Each pending migration runs in its own BEGIN IMMEDIATE transaction, so a
+    second process starting at the same time waits and then sees the step as
+    already applied.
+
+    Args:
+        db_path: Path to SQLite database file (created if missing)
+        schema_dir: Directory containing .sql schema files
+        migrations: Ordered migration steps (default: MIGRATIONS)
+
+    Returns:
+        Versions applied by this call (empty if the database was current)
+
+    Raises:
+        sqlite3.Error: If a migration fails (that step is rolled back)
+        FileNotFoundError: If the baseline step finds no schema files
+    """
+    # Autocommit mode: transactions below are explicit
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    applied = []
+
+    try:
+        current = get_schema_version(conn)
+        if current >= migrations[-1].version:
+            logger.info(f"Database schema is current (version {current})")
+            return applied
+
+        conn.execute(_SCHEMA_VERSION_TABLE)
+
+        for migration in migrations:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-check under the write lock - another process may have applied it
+                if migration.version <= get_schema_version(conn):
+                    conn.execute("ROLLBACK")
+                    continue
+
+                logger.info(f"Applying migration {migration.version}: {migration.name}")
+                migration.apply(conn, schema_dir)
+                conn.execute(
+                    "INSERT INTO schema_version (version, name) VALUES (?, ?)",
+                    [migration.version, migration.name]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.error(f"Migration {migration.version} ({migration.name}) failed, rolled back")
+                raise
+
+            applied.append(migration.version)
+
+        logger.info(f"✓ Database schema migrated to version {migrations[-1].version}")
+        return applied
+    finally:
+        conn.close()
@@ -0,0 +1,109 @@
+"""
+Named SQLite PRAGMA profiles applied to every pooled connection.
+
+A profile is a plain dict of pragma name → value. Profiles are selected by name
+(see [database] in config/config.toml) and may be tweaked with per-pragma overrides.
+
+Profiles:
+- default:      SQLite's own defaults (rollback journal, synchronous=FULL)
+- server:       WAL so readers never wait on a writer, synchronous=NORMAL,
+                larger page cache and memory-mapped reads
+- bulk_import:  Like server, but synchronous=OFF and a bigger cache for large loads
+- test:         Fast, non-durable settings for throwaway test databases
+
+Note: journal_mode=WAL is persistent - once a database file is in WAL mode it
+stays in WAL mode even for connections using the 'default' profile.
+"""
+
+import re
+import sqlite3
+from typing import Optional
+from config.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+PRAGMA_PROFILES = {
+    'default': {},
+    'server': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -20000,        # Negative = KiB, so ~20 MB per connection
+        'mmap_size': 268435456,      # 256 MB of memory-mapped reads
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,        # Milliseconds to wait for a write lock
+    },
+    'bulk_import': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -65536,        # ~64 MB
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+    'test': {
+        'journal_mode': 'MEMORY',
+        'synchronous': 'OFF',
+        'temp_store': 'MEMORY',
+    },
+}
+
+# Pragmas a profile is allowed to set (values are interpolated into SQL)
+ALLOWED_PRAGMAS = {
+    'journal_mode', 'synchronous', 'cache_size', 'mmap_size',
+    'temp_store', 'busy_timeout', 'foreign_keys', 'wal_autocheckpoint',
+}
+
+_PRAGMA_VALUE = re.compile(r'^-?\w+$')
+
+
+def resolve_pragmas(profile: str, overrides: Optional[dict] = None) -> dict:
+    """
+    Build the pragma settings for a named profile plus optional overrides.
+
+    Args:
+        profile: Profile name (key of PRAGMA_PROFILES)
+        overrides: Optional dict of pragma:value replacing profile values
+
+    Returns:
+        Dict of pragma:value, journal_mode first (it must be set before the others)
+
+    Raises:
+        ValueError: If profile is unknown, or a pragma name/value is not allowed
+    """
+    if profile not in PRAGMA_PROFILES:
+        raise ValueError(
+            f"Unknown pragma profile '{profile}'. "
+            f"Choose one of: {', '.join(sorted(PRAGMA_PROFILES))}"
+        )
+
+    pragmas = dict(PRAGMA_PROFILES[profile])
+    pragmas.update(overrides or {})
+
+    for name, value in pragmas.items():
+        if name not in ALLOWED_PRAGMAS:
+            raise ValueError(f"Pragma '{name}' is not allowed in a profile")
+        if not _PRAGMA_VALUE.match(str(value)):
+            raise ValueError(f"Invalid value for pragma {name}: {value!r}")
+
+    # journal_mode first: changing it inside other settings can be rejected
+    ordered = {}
+    if 'journal_mode' in pragmas:
+        ordered['journal_mode'] = pragmas.pop('journal_mode')
+    ordered.update(pragmas)
+    return ordered
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: dict) -> None:
+    """
+    Apply resolved pragma settings to a connection.
+
+    Args:
+        conn: Open SQLite connection
+        pragmas: Dict from resolve_pragmas()
+    """
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+    if pragmas:
+        logger.debug(f"Applied pragmas: {pragmas}")
@@ -0,0 +1,122 @@
+"""
+Time-range indexes and canonical timestamps for actions and goals.
+
+Timestamps are stored as ISO text. Text compares correctly as time only while
+every value has the same shape, so this module:
+- rewrites non-canonical values ('2025-10-01 08:00', '2025-10-01') to
+  datetime.isoformat() form ('2025-10-01T08:00:00'), the form the serializers write
+- creates indexes on the time columns so range filters are index seeks
+
+Both steps are idempotent: canonical rows are skipped and indexes use IF NOT EXISTS.
+Fresh databases get the same indexes from schemas/actions.sql and schemas/goals.sql.
+
+Like the rest of politica, this module knows nothing about domain entities.
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Optional
+from config.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+# table → timestamp columns that are range-filtered
+TIME_COLUMNS = {
+    'actions': ['log_time'],
+    'goals': ['start_date', 'target_date'],
+}
+
+# (index name, table, column)
+TIME_INDEXES = [
+    ('idx_actions_log_time', 'actions', 'log_time'),
+    ('idx_goals_start_date', 'goals', 'start_date'),
+    ('idx_goals_target_date', 'goals', 'target_date'),
+]
+
+# Values already shaped like 'YYYY-MM-DDTHH:MM:SS...' are left alone
+_CANONICAL_GLOB = '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]T[0-9][0-9]:[0-9][0-9]:[0-9][0-9]*'
+
+
+def canonical_timestamp(value: str) -> Optional[str]:
+    """
+    Convert an ISO-like timestamp to datetime.isoformat() form.
+
+    Args:
+        value: Stored timestamp text
+
+    Returns:
+        Canonical text, or None if value can't be parsed
+
+    Example:
+        >>> canonical_timestamp('2025-10-01 08:00')
+        '2025-10-01T08:00:00'
+    """
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_time_columns(conn: sqlite3.Connection) -> int:
+    """
+    Rewrite non-canonical timestamps in TIME_COLUMNS.
+
+    Unparseable values are logged and left unchanged.
+
+    Args:
+        conn: Open connection (caller commits)
+
+    Returns:
+        Number of values rewritten
+    """
+    rewritten = 0
+
+    for table, columns in TIME_COLUMNS.items():
+        for column in columns:
+            rows = conn.execute(
+                f"SELECT rowid, {column} FROM {table} "
+                f"WHERE {column} IS NOT NULL AND {column} NOT GLOB ?",
+                [_CANONICAL_GLOB]
+            ).fetchall()
+
+            updates = []
+            for rowid, value in rows:
+                canonical = canonical_timestamp(value)
+                if canonical is None:
+                    logger.warning(f"Unparseable {table}.{column} left unchanged: {value!r}")
+                elif canonical != value:
+                    updates.append((canonical, rowid))
+
+            if updates:
+                conn.executemany(f"UPDATE {table} SET {column} = ? WHERE rowid = ?", updates)
+                logger.info(f"Normalized {len(updates)} timestamps in {table}.{column}")
+                rewritten += len(updates)
+
+    return rewritten
+
+
+def create_time_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Create the time-range indexes if missing.
+
+    Args:
+        conn: Open connection (caller commits)
+    """
+    for index_name, table, column in TIME_INDEXES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({column})")
+
+
+def apply_time_indexes(conn: sqlite3.Connection) -> int:
+    """
+    Normalize timestamps, then index them.
+
+    Args:
+        conn: Open connection (caller commits)
+
+    Returns:
+        Number of timestamps rewritten
+    """
+    rewritten = normalize_time_columns(conn)
+    create_time_indexes(conn)
+    return rewritten
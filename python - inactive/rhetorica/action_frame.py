@@ -0,0 +1,340 @@
+"""
+Columnar, array-backed representation of many actions.
+
+An ActionFrame holds the actions table column by column instead of as one
+Action object per row:
+- log_times: int64 microseconds since 1970-01-01, sorted ascending
+- titles: dictionary-encoded (one string per distinct title + int codes)
+- measurements: exploded into parallel (action_index, unit_id, value) columns
+
+Period filters are binary searches over the sorted log_times, unit filters
+and totals scan the measurement columns with C-level iterators, and Action
+objects are only built on demand (to_actions()). Term-wide analytics over
+tens of thousands of actions stay cheap in time and memory.
+
+Built from raw rows (ActionStorageService.get_frame(), or from_records() on
+any rows shaped like SELECT * FROM actions), so it lives in rhetorica next to
+the serializers it replaces for bulk reads.
+
+Timestamps are treated as naive local times, like the rest of the app;
+aware values are converted to UTC first.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from itertools import compress, repeat
+from math import isnan
+from operator import eq
+from typing import Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from categoriae.actions import Action
+from config.logging_setup import get_logger
+from rhetorica import codec
+
+logger = get_logger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIME = -2 ** 63  # start_times sentinel for None
+_NO_DURATION = float('nan')
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """
+    Convert a datetime to int64 microseconds since 1970-01-01.
+
+    Example:
+        >>> to_epoch_micros(datetime(1970, 1, 1, 0, 0, 1))
+        1000000
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(micros: int) -> datetime:
+    """Convert int64 microseconds since 1970-01-01 back to a naive datetime."""
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _parse_time(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+class ActionFrame:
+    """
+    Column-oriented view of many actions, sorted by log_time.
+
+    Attributes:
+        uuid_ids: Action uuid_id text, one per action
+        log_times: array('q') of epoch microseconds, ascending
+        title_codes: array('l') of indexes into title_vocabulary
+        title_vocabulary: Distinct titles
+        descriptions: Optional description per action
+        notes: Optional notes per action
+        start_times: array('q') of epoch microseconds (minimum int64 = None)
+        durations: array('d') of duration_minutes (NaN = None)
+        measure_action: array('q') of action indexes, ascending
+        measure_unit: array('l') of indexes into units
+        measure_value: array('d') of measured amounts
+        units: Distinct measurement unit names
+
+    Example:
+        >>> frame = action_service.get_frame()
+        >>> term_frame = frame.between(term.start_date, term.target_date)
+        >>> term_frame.totals_by_unit()
+        {'km': 102.5, 'minutes': 940.0}
+    """
+
+    def __init__(self, uuid_ids: List[str], log_times: array,
+                 title_codes: array, title_vocabulary: List[str],
+                 descriptions: List[Optional[str]], notes: List[Optional[str]],
+                 start_times: array, durations: array,
+                 measure_action: array, measure_unit: array, measure_value: array,
+                 units: List[str]):
+        self.uuid_ids = uuid_ids
+        self.log_times = log_times
+        self.title_codes = title_codes
+        self.title_vocabulary = title_vocabulary
+        self.descriptions = descriptions
+        self.notes = notes
+        self.start_times = start_times
+        self.durations = durations
+        self.measure_action = measure_action
+        self.measure_unit = measure_unit
+        self.measure_value = measure_value
+        self.units = units
+
+    @classmethod
+    def from_records(cls, records: Iterable) -> 'ActionFrame':
+        """
+        Build a frame from action rows.
+
+        Args:
+            records: Dicts or sqlite3.Row objects shaped like SELECT * FROM
+                     actions (a streaming cursor works). Rows already ordered
+                     by log_time skip the final sort
+
+        Returns:
+            ActionFrame sorted by log_time
+
+        Note:
+            measurement_units_by_amount that isn't a JSON object (or is an
+            empty one) is treated as no measurements, and non-numeric
+            values in it (null, strings, booleans) are skipped.
+        """
+        uuid_ids, descriptions, notes = [], [], []
+        log_times, start_times = array('q'), array('q')
+        durations = array('d')
+        title_codes = array('l')
+        title_ids: Dict[str, int] = {}
+        measure_action, measure_unit, measure_value = array('q'), array('l'), array('d')
+        unit_ids: Dict[str, int] = {}
+
+        for index, record in enumerate(records):
+            uuid_ids.append(str(record['uuid_id']))
+            log_times.append(to_epoch_micros(_parse_time(record['log_time'])))
+            title_codes.append(title_ids.setdefault(record['title'] or '', len(title_ids)))
+            descriptions.append(record['description'])
+            notes.append(record['notes'])
+
+            start_time = record['start_time']
+            start_times.append(to_epoch_micros(_parse_time(start_time)) if start_time else _NO_TIME)
+            duration = record['duration_minutes']
+            durations.append(_NO_DURATION if duration is None else duration)
+
+            measurements = record['measurement_units_by_amount']
+            if measurements:
+                if isinstance(measurements, str):
+                    try:
+                        measurements = codec.loads(measurements)
+                    except codec.JSONDecodeError:
+                        logger.warning(f"Ignoring malformed measurements on action {record['uuid_id']}")
+                        continue
+                if isinstance(measurements, dict):
+                    for unit, value in measurements.items():
+                        if not isinstance(value, (int, float)) or isinstance(value, bool):
+                            continue
+                        measure_action.append(index)
+                        measure_unit.append(unit_ids.setdefault(unit, len(unit_ids)))
+                        measure_value.append(value)
+
+        frame = cls(uuid_ids, log_times, title_codes, list(title_ids),
+                    descriptions, notes, start_times, durations,
+                    measure_action, measure_unit, measure_value, list(unit_ids))
+
+        if any(later < earlier for earlier, later in zip(log_times, log_times[1:])):
+            frame = frame.take(sorted(range(len(log_times)), key=log_times.__getitem__))
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.log_times)
+
+    @property
+    def titles(self) -> List[str]:
+        """Decoded titles, one per action."""
+        vocabulary = self.title_vocabulary
+        return [vocabulary[code] for code in self.title_codes]
+
+    def period_slice(self, start: Optional[datetime] = None,
+                     end: Optional[datetime] = None) -> slice:
+        """
+        Positions of actions with start <= log_time <= end (inclusive).
+
+        Two binary searches over the sorted log_times - no per-row work.
+
+        Args:
+            start: Earliest log_time (None = unbounded)
+            end: Latest log_time (None = unbounded)
+
+        Returns:
+            slice over the frame's action positions
+        """
+        low = 0 if start is None else bisect_left(self.log_times, to_epoch_micros(start))
+        high = len(self) if end is None else bisect_right(self.log_times, to_epoch_micros(end))
+        return slice(low, max(low, high))
+
+    def between(self, start: Optional[datetime] = None,
+                end: Optional[datetime] = None) -> 'ActionFrame':
+        """
+        Sub-frame of actions logged between start and end (inclusive).
+
+        Args:
+            start: Earliest log_time (None = unbounded)
+            end: Latest log_time (None = unbounded)
+
+        Returns:
+            New ActionFrame sharing this frame's title and unit vocabularies
+        """
+        period = self.period_slice(start, end)
+        low, high = period.start, period.stop
+
+        # Measurement rows are grouped by ascending action index
+        m_low = bisect_left(self.measure_action, low)
+        m_high = bisect_left(self.measure_action, high)
+        measure_action = array('q', self.measure_action[m_low:m_high])
+        if low:
+            measure_action = array('q', [index - low for index in measure_action])
+
+        return ActionFrame(
+            self.uuid_ids[period], self.log_times[period],
+            self.title_codes[period], self.title_vocabulary,
+            self.descriptions[period], self.notes[period],
+            self.start_times[period], self.durations[period],
+            measure_action, self.measure_unit[m_low:m_high], self.measure_value[m_low:m_high],
+            self.units,
+        )
+
+    def take(self, indices: Sequence[int]) -> 'ActionFrame':
+        """
+        Sub-frame of the actions at the given positions, in the given order.
+
+        Args:
+            indices: Action positions (e.g. from indices_with_units())
+
+        Returns:
+            New ActionFrame sharing this frame's vocabularies
+        """
+        rows_by_action: Dict[int, List[int]] = {}
+        for row, action_index in enumerate(self.measure_action):
+            rows_by_action.setdefault(action_index, []).append(row)
+
+        measure_action, measure_unit, measure_value = array('q'), array('l'), array('d')
+        for new_index, old_index in enumerate(indices):
+            for row in rows_by_action.get(old_index, ()):
+                measure_action.append(new_index)
+                measure_unit.append(self.measure_unit[row])
+                measure_value.append(self.measure_value[row])
+
+        return ActionFrame(
+            [self.uuid_ids[i] for i in indices],
+            array('q', [self.log_times[i] for i in indices]),
+            array('l', [self.title_codes[i] for i in indices]), self.title_vocabulary,
+            [self.descriptions[i] for i in indices], [self.notes[i] for i in indices],
+            array('q', [self.start_times[i] for i in indices]),
+            array('d', [self.durations[i] for i in indices]),
+            measure_action, measure_unit, measure_value, self.units,
+        )
+
+    def _measurement_mask(self, units: Iterable[str]) -> Iterable[bool]:
+        """One bool per measurement row: is its unit one of units?"""
+        wanted = [self.units.index(unit) for unit in units if unit in self.units]
+        if len(wanted) == 1:
+            return map(eq, self.measure_unit, repeat(wanted[0]))
+        wanted_ids = frozenset(wanted)
+        return map(wanted_ids.__contains__, self.measure_unit)
+
+    def indices_with_units(self, units: Iterable[str]) -> List[int]:
+        """
+        Positions of actions measured in any of the given units.
+
+        Args:
+            units: Exact measurement unit names (e.g. ['km', 'miles'])
+
+        Returns:
+            Ascending action positions
+        """
+        return list(dict.fromkeys(compress(self.measure_action, self._measurement_mask(units))))
+
+    def with_units(self, units: Iterable[str]) -> 'ActionFrame':
+        """Sub-frame of actions measured in any of the given units."""
+        return self.take(self.indices_with_units(units))
+
+    def total(self, unit: str) -> float:
+        """Sum of all measurements in one unit (0.0 if the unit never occurs)."""
+        return sum(compress(self.measure_value, self._measurement_mask([unit])))
+
+    def totals_by_unit(self) -> Dict[str, float]:
+        """
+        Sum of measurements per unit.
+
+        Returns:
+            Dict of unit → total, for units present in this frame
+        """
+        values, unit_column = self.measure_value, self.measure_unit
+        return {
+            self.units[unit_id]: sum(compress(values, map(eq, unit_column, repeat(unit_id))))
+            for unit_id in sorted(set(unit_column))
+        }
+
+    def log_time_at(self, index: int) -> datetime:
+        """log_time of the action at a position."""
+        return from_epoch_micros(self.log_times[index])
+
+    def to_actions(self, indices: Optional[Iterable[int]] = None) -> List[Action]:
+        """
+        Build Action objects, only for the rows that need them.
+
+        Args:
+            indices: Positions to convert (default: every action)
+
+        Returns:
+            List of Action entities, in the given (or log_time) order
+        """
+        indices = range(len(self)) if indices is None else indices
+        actions = []
+
+        for index in indices:
+            m_low = bisect_left(self.measure_action, index)
+            m_high = bisect_right(self.measure_action, index, m_low)
+            measurements = {
+                self.units[self.measure_unit[row]]: self.measure_value[row]
+                for row in range(m_low, m_high)
+            }
+            start_time = self.start_times[index]
+            duration = self.durations[index]
+
+            actions.append(Action(
+                self.title_vocabulary[self.title_codes[index]],
+                uuid_id=UUID(self.uuid_ids[index]),
+                description=self.descriptions[index],
+                notes=self.notes[index],
+                log_time=from_epoch_micros(self.log_times[index]),
+                measurement_units_by_amount=measurements or None,
+                duration_minutes=None if isnan(duration) else duration,
+                start_time=None if start_time == _NO_TIME else from_epoch_micros(start_time),
+            ))
+
+        return actions
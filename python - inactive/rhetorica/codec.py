@@ -0,0 +1,168 @@
+"""
+JSON codec used for storage columns, archive rows and API responses.
+
+Uses the fastest available backend and falls back to the standard library:
+- orjson   (pip install orjson)
+- msgspec  (pip install msgspec)
+- json     (always available)
+
+The backend is chosen once at import from [serialization] json_backend in
+config/config.toml ("auto" picks the first installed one) and can be switched
+with set_backend(), e.g. in a benchmark.
+
+Output matches json.dumps where it matters to callers:
+- dumps() returns str (dumps_bytes() for HTTP bodies)
+- datetime and dataclass values go through `default`, like the stdlib
+- values the fast backend rejects (e.g. ints beyond 64 bits) are encoded by
+  the stdlib instead, and text it can't parse (NaN literals, lone surrogates)
+  is re-parsed by the stdlib - so results and exceptions stay the stdlib's
+Differences: orjson and msgspec write compact UTF-8 JSON ('{"km":5.0}') and
+encode NaN/Infinity as null; the stdlib fallback keeps json.dumps spacing
+('{"km": 5.0}').
+
+Depends only on config, so every layer (including politica, for archive
+rows) can use it.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+from config import JSON_BACKEND
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on environment
+    msgspec = None
+
+
+# Exception raised by loads() for malformed JSON, whichever backend is active
+JSONDecodeError = json.JSONDecodeError
+
+AVAILABLE_BACKENDS = ['json'] + [name for name, module in
+                                 (('orjson', orjson), ('msgspec', msgspec)) if module]
+
+_ORJSON_OPTIONS = 0
+if orjson:
+    # Non-str keys like the stdlib; datetimes/dataclasses go through `default` like the stdlib
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                       | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def _json_dumps_bytes(obj: Any, default: Optional[Callable], sort_keys: bool) -> bytes:
+    return json.dumps(obj, default=default, sort_keys=sort_keys).encode('utf-8')
+
+
+def _orjson_dumps_bytes(obj: Any, default: Optional[Callable], sort_keys: bool) -> bytes:
+    options = (_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS) if sort_keys else _ORJSON_OPTIONS
+    try:
+        return orjson.dumps(obj, default=default, option=options)
+    except TypeError:
+        # orjson.JSONEncodeError: unsupported value - let the stdlib encode or raise
+        return _json_dumps_bytes(obj, default, sort_keys)
+
+
+def _orjson_loads(data):
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Stdlib accepts a few things orjson doesn't (NaN, lone surrogates) and owns the error
+        return json.loads(data)
+
+
+def _msgspec_dumps_bytes(obj: Any, default: Optional[Callable], sort_keys: bool) -> bytes:
+    if sort_keys:
+        return _json_dumps_bytes(obj, default, sort_keys)
+    try:
+        return msgspec.json.encode(obj, enc_hook=default)
+    except (TypeError, msgspec.EncodeError):
+        return _json_dumps_bytes(obj, default, sort_keys)
+
+
+def _msgspec_loads(data):
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError:
+        return json.loads(data)
+
+
+_BACKENDS = {
+    'json': (_json_dumps_bytes, json.loads),
+    'orjson': (_orjson_dumps_bytes, _orjson_loads),
+    'msgspec': (_msgspec_dumps_bytes, _msgspec_loads),
+}
+
+backend = 'json'
+# True when loads() already returns one shared str object per distinct object key
+interns_keys = False
+_dumps_bytes = _json_dumps_bytes
+_loads = json.loads
+
+
+def set_backend(name: str) -> str:
+    """
+    Select the JSON backend.
+
+    Args:
+        name: 'auto', 'orjson', 'msgspec' or 'json'
+
+    Returns:
+        Name of the backend now in use
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global backend, interns_keys, _dumps_bytes, _loads
+
+    if name == 'auto':
+        name = 'orjson' if orjson else 'msgspec' if msgspec else 'json'
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'. Choose one of: auto, {', '.join(_BACKENDS)}")
+    if name not in AVAILABLE_BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not installed")
+
+    backend = name
+    interns_keys = name == 'orjson'  # orjson caches short keys internally
+    _dumps_bytes, _loads = _BACKENDS[name]
+    return backend
+
+
+def dumps(obj: Any, default: Optional[Callable] = None, sort_keys: bool = False) -> str:
+    """
+    Encode obj as JSON text.
+
+    Args:
+        obj: Value to encode
+        default: Called for values JSON can't represent (like json.dumps)
+        sort_keys: Sort object keys
+
+    Returns:
+        JSON string
+
+    Example (orjson or msgspec backend; the stdlib writes '{"km": 5.0}'):
+        >>> dumps({'km': 5.0})
+        '{"km":5.0}'
+    """
+    return _dumps_bytes(obj, default, sort_keys).decode('utf-8')
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable] = None, sort_keys: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes (for HTTP response bodies)."""
+    return _dumps_bytes(obj, default, sort_keys)
+
+
+def loads(data):
+    """
+    Decode JSON text or bytes.
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    return _loads(data)
+
+
+set_backend(JSON_BACKEND)
@@ -7,19 +7,90 @@ Supports three assignment methods:
 - user_confirmed: User verified an auto-inferred match
 - manual: User explicitly created the relationship
 
+Rows reference actions and goals by uuid_id (TEXT foreign keys).
+
+Incremental inference reads the change log (politica.change_tracking) through
+pending_changes() and records its progress with mark_processed().
+
+Per-goal totals are materialized in goal_progress by triggers on this table
+(politica.goal_progress); get_goal_totals() reads them by primary key.
+aggregate_all_goals() and get_progress_summary() compute progress with one
+GROUP BY goal_id over the stored rows, without loading any Action.
+
 Written by Claude Code on 2025-10-12
 """
 
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Collection, Dict, FrozenSet, Iterable, List, Optional, Set, Union
+from uuid import UUID, uuid4
 from categoriae.actions import Action
 from categoriae.goals import Goal
 from categoriae.relationships import ActionGoalRelationship
+from ethica import progress_aggregation
+from ethica.progress_aggregation import GoalProgress
 from rhetorica.storage_service import ActionStorageService, GoalStorageService
+from rhetorica.storage_session import StorageSession
 from politica.database import Database
+from politica.filters import In
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+# Action or goal uuid_id, as UUID or its stored string form
+EntityId = Union[UUID, str]
+
+# Watermark name used by incremental action-goal inference
+INFERENCE_CONSUMER = 'action_goal_inference'
+
+
+class RelationshipOutcome(Enum):
+    """What upsert_relationships() did with one relationship."""
+    STORED = 'stored'                      # New row written
+    ALREADY_STORED = 'already_stored'      # Pair existed (any match method) - left as is
+    ACTION_NOT_FOUND = 'action_not_found'  # Action isn't in the database
+    GOAL_NOT_FOUND = 'goal_not_found'      # Goal isn't in the database
+
+
+@dataclass(frozen=True)
+class PendingChanges:
+    """
+    Actions and goals changed since a consumer's watermark.
+
+    Attributes:
+        through_seq: Latest change seq covered - pass back to mark_processed()
+        action_ids: uuid_id strings of actions inserted, edited or deleted
+        goal_ids: uuid_id strings of goals inserted, deleted, or edited in a
+                  column that affects matching (hints, unit, dates, type)
+        full_rebuild: True when the consumer has no watermark yet, so the
+                      change log doesn't cover its history
+    """
+    through_seq: int
+    action_ids: FrozenSet[str]
+    goal_ids: FrozenSet[str]
+    full_rebuild: bool = False
+
+    def __bool__(self) -> bool:
+        return self.full_rebuild or bool(self.action_ids or self.goal_ids)
+
+
+@dataclass(frozen=True)
+class GoalProgressTotals:
+    """
+    Stored progress totals of one goal (a goal_progress row).
+
+    Attributes:
+        goal_id: uuid_id string of the goal
+        total: Sum of contributions of all its relationships
+        match_count: Number of relationships
+        last_contribution_at: Latest log_time of a contributing action
+    """
+    goal_id: str
+    total: float
+    match_count: int
+    last_contribution_at: Optional[datetime]
+
 
 class ActionGoalProgressStorageService:
     """
@@ -34,152 +105,184 @@ class ActionGoalProgressStorageService:
 
     table_name = 'action_goal_progress'
 
-    def __init__(self, database: Optional[Database] = None):
+    def __init__(self, database: Optional[Database] = None,
+                 session: Optional[StorageSession] = None):
         """
         Initialize with database connection and entity services.
 
         Args:
-            database: Database instance. If None, creates default instance.
+            database: Database instance. If None, uses the session's database,
+                     or the shared default instance.
+            session: StorageSession for the entity services. If None, they
+                     join the active session (see StorageService).
         """
-        self.db = database or Database()
-        self.action_service = ActionStorageService(database=self.db)
-        self.goal_service = GoalStorageService(database=self.db)
+        self.action_service = ActionStorageService(database=database, session=session)
+        self.goal_service = GoalStorageService(database=database, session=session)
+        self.db = self.action_service.db
 
     def store_relationships(self, relationships: List[ActionGoalRelationship]) -> int:
         """
         Store multiple action-goal relationships.
 
-        Handles ID lookup transparently: if entities don't have IDs,
-        looks them up by matching attributes.
+        Handles ID lookup transparently (see upsert_relationships). Pairs
+        already stored and relationships whose action or goal can't be
+        found are skipped.
 
         Args:
             relationships: List of ActionGoalRelationship objects
 
         Returns:
-            int: Number of relationships successfully stored
-
-        Raises:
-            ValueError: If action or goal not found in database
+            int: Number of relationships newly stored
         """
-        stored_count = 0
+        outcomes = self.upsert_relationships(relationships)
+        return sum(outcome is RelationshipOutcome.STORED for outcome in outcomes)
 
-        for rel in relationships:
-            try:
-                self._store_single_relationship(rel)
-                stored_count += 1
-            except ValueError as e:
-                logger.warning(f"Skipping relationship: {e}")
-                continue
-
-        logger.info(f"✓ Stored {stored_count}/{len(relationships)} relationships")
-        return stored_count
-
-    def _store_single_relationship(self, rel: ActionGoalRelationship) -> None:
+    def upsert_relationships(self, relationships: List[ActionGoalRelationship]
+                             ) -> List[RelationshipOutcome]:
         """
-        Store a single relationship to database.
+        Bulk-store relationships in one transaction, reporting what happened to each.
 
-        Args:
-            rel: ActionGoalRelationship with action and goal entities
+        Action and goal uuid_ids are resolved with one IN (...) query per
+        table (per fetch batch); entities not stored under their uuid_id fall
+        back to a lookup by title and dates. Rows are written with
+        executemany() and INSERT ... ON CONFLICT(action_id, goal_id) DO NOTHING,
+        so existing pairs - including manual and user_confirmed ones - are
+        left untouched.
 
-        Raises:
-            ValueError: If action or goal cannot be found in database
-        """
-        # Get IDs (either from entities or by lookup)
-        action_id = self._get_action_id(rel.action)
-        goal_id = self._get_goal_id(rel.goal)
-
-        if not action_id:
-            raise ValueError(
-                f"Action not found in database: {rel.action.title[:50]}"
-            )
-        if not goal_id:
-            raise ValueError(
-                f"Goal not found in database: {rel.goal.title[:50]}"
-            )
-
-        # Check if relationship already exists
-        existing = self.db.query(self.table_name, filters={
-            'action_id': action_id,
-            'goal_id': goal_id
-        })
-
-        if existing:
-            logger.debug(
-                f"Relationship already exists: action_id={action_id}, "
-                f"goal_id={goal_id}, skipping"
-            )
-            return
+        Args:
+            relationships: List of ActionGoalRelationship objects
 
-        # Insert new relationship
-        self.db.insert(self.table_name, [{
-            'action_id': action_id,
-            'goal_id': goal_id,
-            'contribution': rel.contribution,
-            'match_method': rel.assignment_method,
-            'confidence': rel.confidence,
-            'matched_on': None  # Could extract from rel if we add metadata field
-        }])
+        Returns:
+            One RelationshipOutcome per relationship, in input order
 
-    def _get_action_id(self, action: Action) -> Optional[int]:
+        Example:
+            >>> outcomes = progress_service.upsert_relationships(session.confident_matches)
+            >>> outcomes.count(RelationshipOutcome.STORED)
+            42
+        """
+        if not relationships:
+            return []
+
+        action_keys = [str(rel.action.uuid_id) for rel in relationships]
+        goal_keys = [str(rel.goal.uuid_id) for rel in relationships]
+        stored_actions = self._existing_uuids('actions', action_keys)
+        stored_goals = self._existing_uuids('goals', goal_keys)
+
+        outcomes: List[Optional[RelationshipOutcome]] = [None] * len(relationships)
+        rows = []
+        for position, rel in enumerate(relationships):
+            action_id = action_keys[position]
+            if action_id not in stored_actions:
+                action_id = self._find_action_id(rel.action)
+            goal_id = goal_keys[position]
+            if goal_id not in stored_goals:
+                goal_id = self._find_goal_id(rel.goal)
+
+            if not action_id:
+                logger.warning(f"Skipping relationship: Action not found in database: {rel.action.title[:50]}")
+                outcomes[position] = RelationshipOutcome.ACTION_NOT_FOUND
+            elif not goal_id:
+                logger.warning(f"Skipping relationship: Goal not found in database: {rel.goal.title[:50]}")
+                outcomes[position] = RelationshipOutcome.GOAL_NOT_FOUND
+            else:
+                rows.append((position, {
+                    'uuid_id': str(uuid4()),
+                    'action_id': action_id,
+                    'goal_id': goal_id,
+                    'contribution': rel.contribution,
+                    'match_method': rel.assignment_method,
+                    'confidence': rel.confidence,
+                    'matched_on': None  # Could extract from rel if we add metadata field
+                }))
+
+        if rows:
+            with self.db.transaction():
+                self.db.insert_many(self.table_name, (row for _, row in rows),
+                                    conflict_target=['action_id', 'goal_id'])
+                # New uuid_ids that exist now were inserted; the rest hit an existing pair
+                inserted = self._existing_uuids(self.table_name, (row['uuid_id'] for _, row in rows))
+
+            for position, row in rows:
+                outcomes[position] = (RelationshipOutcome.STORED if row['uuid_id'] in inserted
+                                      else RelationshipOutcome.ALREADY_STORED)
+
+        stored_count = outcomes.count(RelationshipOutcome.STORED)
+        logger.info(f"✓ Stored {stored_count}/{len(relationships)} relationships "
+                    f"({outcomes.count(RelationshipOutcome.ALREADY_STORED)} already stored)")
+        return outcomes
+
+    def _existing_uuids(self, table: str, keys: Iterable[str]) -> Set[str]:
+        """Which of these uuid_id strings have a row in table - one IN query per fetch batch."""
+        keys = list(dict.fromkeys(keys))
+        batch_size = self.db.fetch_batch_size
+        found = set()
+        for start in range(0, len(keys), batch_size):
+            records = self.db.query(table, filters={'uuid_id': In(keys[start:start + batch_size])},
+                                    columns=['uuid_id'])
+            found.update(record['uuid_id'] for record in records)
+        return found
+
+    def _find_action_id(self, action: Action) -> Optional[str]:
         """
-        Get database ID for an action.
+        Find the stored uuid_id of an action not stored under its own uuid_id.
 
-        If action.id is set, returns it.
-        Otherwise, queries database by description + log_time.
+        For Actions rebuilt outside storage: queries database by title + log_time.
 
         Args:
             action: Action entity
 
         Returns:
-            Database ID or None if not found
+            uuid_id string or None if not found
         """
-        if action.id is not None:
-            return action.id
-
         # Lookup by unique attributes
-        filters = {'description': action.title}
+        filters = {'title': action.title}
         if action.log_time:
             filters['log_time'] = action.log_time.isoformat()
 
-        results = self.db.query('actions', filters=filters)
-        return results[0]['id'] if results else None
+        results = self.db.query('actions', filters=filters, columns=['uuid_id'], limit=1)
+        return results[0]['uuid_id'] if results else None
 
-    def _get_goal_id(self, goal: Goal) -> Optional[int]:
+    def _find_goal_id(self, goal: Goal) -> Optional[str]:
         """
-        Get database ID for a goal.
+        Find the stored uuid_id of a goal not stored under its own uuid_id.
 
-        If goal.id is set, returns it.
-        Otherwise, queries database by description + dates.
+        Queries database by title + dates.
 
         Args:
             goal: Goal entity
 
         Returns:
-            Database ID or None if not found
+            uuid_id string or None if not found
         """
-        if goal.id is not None:
-            return goal.id
-
         # Lookup by unique attributes
-        filters = {'description': goal.title}
+        filters = {'title': goal.title}
         if goal.start_date:
-            filters['start_date'] = goal.start_date.strftime('%Y-%m-%d')
+            filters['start_date'] = goal.start_date.isoformat()
         if goal.target_date:
-            filters['target_date'] = goal.target_date.strftime('%Y-%m-%d')
+            filters['target_date'] = goal.target_date.isoformat()
 
-        results = self.db.query('goals', filters=filters)
-        return results[0]['id'] if results else None
+        results = self.db.query('goals', filters=filters, columns=['uuid_id'], limit=1)
+        return results[0]['uuid_id'] if results else None
+
+    def _row_exists(self, table: str, entity_id: EntityId) -> bool:
+        """True if table has a row with this uuid_id."""
+        return bool(self.db.query(table, filters={'uuid_id': str(entity_id)},
+                                  columns=['uuid_id'], limit=1))
 
     def get_relationships(self,
-                         action_id: Optional[int] = None,
-                         goal_id: Optional[int] = None,
+                         action_id: Optional[EntityId] = None,
+                         goal_id: Optional[EntityId] = None,
                          method: Optional[str] = None) -> List[ActionGoalRelationship]:
         """
         Retrieve relationships from database, reconstructed as domain objects.
 
+        Actions and goals are loaded in batches (one IN query per batch), not
+        once per relationship. Under a StorageSession, entities already loaded
+        are reused and not queried again.
+
         Args:
-            action_id: Filter by action ID (optional)
-            goal_id: Filter by goal ID (optional)
+            action_id: Filter by action uuid_id (optional)
+            goal_id: Filter by goal uuid_id (optional)
             method: Filter by assignment method: 'auto_inferred',
                    'user_confirmed', or 'manual' (optional)
 
@@ -188,19 +291,24 @@ class ActionGoalProgressStorageService:
         """
         filters = {}
         if action_id is not None:
-            filters['action_id'] = action_id
+            filters['action_id'] = str(action_id)
         if goal_id is not None:
-            filters['goal_id'] = goal_id
+            filters['goal_id'] = str(goal_id)
         if method is not None:
             filters['match_method'] = method
 
         records = self.db.query(self.table_name, filters=filters)
 
+        # Fetch full entities by uuid_id
+        actions = {str(a.uuid_id): a for a in
+                   self.action_service.get_by_uuids(r['action_id'] for r in records)}
+        goals = {str(g.uuid_id): g for g in
+                 self.goal_service.get_by_uuids(r['goal_id'] for r in records)}
+
         relationships = []
         for record in records:
-            # Fetch full entities by ID
-            action = self.action_service.get_by_id(record['action_id'])
-            goal = self.goal_service.get_by_id(record['goal_id'])
+            action = actions.get(record['action_id'])
+            goal = goals.get(record['goal_id'])
 
             if not action or not goal:
                 logger.warning(
@@ -221,8 +329,8 @@ class ActionGoalProgressStorageService:
         return relationships
 
     def create_manual_match(self,
-                           action_id: int,
-                           goal_id: int,
+                           action_id: EntityId,
+                           goal_id: EntityId,
                            contribution: float,
                            reason: str = 'user_override') -> None:
         """
@@ -232,8 +340,8 @@ class ActionGoalProgressStorageService:
         Manual matches take precedence and won't be recalculated.
 
         Args:
-            action_id: Database ID of action
-            goal_id: Database ID of goal
+            action_id: uuid_id of action
+            goal_id: uuid_id of goal
             contribution: Amount action contributes to goal
             reason: Optional note about why this manual match was created
 
@@ -241,13 +349,11 @@ class ActionGoalProgressStorageService:
             ValueError: If action_id or goal_id not found
         """
         # Verify entities exist
-        action = self.action_service.get_by_id(action_id)
-        goal = self.goal_service.get_by_id(goal_id)
-
-        if not action:
-            raise ValueError(f"Action with id={action_id} not found")
-        if not goal:
-            raise ValueError(f"Goal with id={goal_id} not found")
+        if not self._row_exists('actions', action_id):
+            raise ValueError(f"Action with uuid_id={action_id} not found")
+        if not self._row_exists('goals', goal_id):
+            raise ValueError(f"Goal with uuid_id={goal_id} not found")
+        action_id, goal_id = str(action_id), str(goal_id)
 
         # Remove any existing auto-inferred match
         existing_auto = self.db.query(self.table_name, filters={
@@ -279,6 +385,7 @@ class ActionGoalProgressStorageService:
 
         # Insert manual relationship
         self.db.insert(self.table_name, [{
+            'uuid_id': str(uuid4()),
             'action_id': action_id,
             'goal_id': goal_id,
             'contribution': contribution,
@@ -292,7 +399,7 @@ class ActionGoalProgressStorageService:
             f"contribution={contribution}"
         )
 
-    def confirm_auto_match(self, action_id: int, goal_id: int) -> None:
+    def confirm_auto_match(self, action_id: EntityId, goal_id: EntityId) -> None:
         """
         User confirms an auto-inferred match.
 
@@ -300,16 +407,16 @@ class ActionGoalProgressStorageService:
         Confirmed matches won't be invalidated during cache refresh.
 
         Args:
-            action_id: Database ID of action
-            goal_id: Database ID of goal
+            action_id: uuid_id of action
+            goal_id: uuid_id of goal
 
         Raises:
             ValueError: If no auto-inferred match found for this pair
         """
         # Find existing auto-inferred match
         existing = self.db.query(self.table_name, filters={
-            'action_id': action_id,
-            'goal_id': goal_id,
+            'action_id': str(action_id),
+            'goal_id': str(goal_id),
             'match_method': 'auto_inferred'
         })
 
@@ -319,10 +426,9 @@ class ActionGoalProgressStorageService:
             )
 
         # Update to user_confirmed
-        record_id = existing[0]['id']
-        self.db.update(
+        self.db.update_by_uuid(
             table=self.table_name,
-            record_id=record_id,
+            record_uuid=existing[0]['uuid_id'],
             updates={'match_method': 'user_confirmed'},
             notes='User confirmed auto-inferred match'
         )
@@ -331,7 +437,7 @@ class ActionGoalProgressStorageService:
             f"✓ Confirmed match: action={action_id} → goal={goal_id}"
         )
 
-    def remove_match(self, action_id: int, goal_id: int) -> None:
+    def remove_match(self, action_id: EntityId, goal_id: EntityId) -> None:
         """
         Remove a relationship (any method type).
 
@@ -339,12 +445,12 @@ class ActionGoalProgressStorageService:
         Useful for correcting false positives.
 
         Args:
-            action_id: Database ID of action
-            goal_id: Database ID of goal
+            action_id: uuid_id of action
+            goal_id: uuid_id of goal
         """
         self.db.archive_and_delete(
             table=self.table_name,
-            filters={'action_id': action_id, 'goal_id': goal_id},
+            filters={'action_id': str(action_id), 'goal_id': str(goal_id)},
             reason='user_removed',
             notes='User explicitly rejected this match',
             confirm=True
@@ -354,7 +460,7 @@ class ActionGoalProgressStorageService:
             f"✓ Removed match: action={action_id} → goal={goal_id}"
         )
 
-    def invalidate_auto_inferred(self, action_id: Optional[int] = None) -> int:
+    def invalidate_auto_inferred(self, action_id: Optional[EntityId] = None) -> int:
         """
         Clear auto-inferred relationship cache.
 
@@ -374,29 +480,182 @@ class ActionGoalProgressStorageService:
         """
         filters = {'match_method': 'auto_inferred'}
         if action_id is not None:
-            filters['action_id'] = action_id
-
-        # Preview what will be deleted
-        result = self.db.archive_and_delete(
-            table=self.table_name,
-            filters=filters,
-            reason='invalidated_cache',
-            confirm=False
-        )
+            filters['action_id'] = str(action_id)
 
-        count = result['count']
+        count = self._archive_auto_inferred(filters)
         if count == 0:
             logger.info("No auto-inferred relationships to invalidate")
             return 0
 
-        # Actually delete
-        self.db.archive_and_delete(
+        logger.info(f"✓ Invalidated {count} auto-inferred relationships")
+        return count
+
+    def invalidate_auto_inferred_for(self,
+                                     action_ids: Collection[EntityId] = (),
+                                     goal_ids: Collection[EntityId] = ()) -> int:
+        """
+        Clear auto-inferred relationships of some actions and/or goals.
+
+        Used by incremental inference: only the pairs involving changed
+        actions or goals are dropped and re-matched. Manual and
+        user_confirmed relationships are NOT affected.
+
+        Args:
+            action_ids: uuid_ids of actions whose auto-inferred matches go
+            goal_ids: uuid_ids of goals whose auto-inferred matches go
+
+        Returns:
+            int: Number of relationships invalidated
+        """
+        count = 0
+        batch_size = self.db.fetch_batch_size
+        for column, ids in (('action_id', action_ids), ('goal_id', goal_ids)):
+            keys = [str(entity_id) for entity_id in ids]
+            for start in range(0, len(keys), batch_size):
+                count += self._archive_auto_inferred({
+                    'match_method': 'auto_inferred',
+                    column: In(keys[start:start + batch_size]),
+                })
+
+        if count:
+            logger.info(f"✓ Invalidated {count} auto-inferred relationships")
+        return count
+
+    def _archive_auto_inferred(self, filters: dict) -> int:
+        """Archive and delete matching rows inside SQLite - invalidations can cover thousands of rows."""
+        result = self.db.archive_and_delete(
             table=self.table_name,
             filters=filters,
             reason='invalidated_cache',
             notes='Cleared stale auto-inferred cache',
-            confirm=True
+            confirm=True,
+            in_database=True
         )
+        return result['count']
 
-        logger.info(f"✓ Invalidated {count} auto-inferred relationships")
-        return count
+    def get_goal_totals(self, goal_id: EntityId) -> GoalProgressTotals:
+        """
+        Materialized progress totals for a goal - one primary-key lookup.
+
+        Covers every stored relationship (auto-inferred, confirmed and
+        manual). Kept current by triggers as relationships are stored,
+        confirmed, removed or invalidated.
+
+        Args:
+            goal_id: uuid_id of goal
+
+        Returns:
+            GoalProgressTotals (zero totals if the goal has no relationships)
+        """
+        records = self.db.query('goal_progress', filters={'goal_id': str(goal_id)})
+        if not records:
+            return GoalProgressTotals(str(goal_id), 0.0, 0, None)
+
+        record = records[0]
+        last = record['last_contribution_at']
+        return GoalProgressTotals(
+            goal_id=record['goal_id'],
+            total=record['total'],
+            match_count=record['match_count'],
+            last_contribution_at=datetime.fromisoformat(last) if last else None
+        )
+
+    def aggregate_all_goals(self, goals: Optional[List[Goal]] = None) -> List[GoalProgress]:
+        """
+        Progress for many goals, aggregated inside SQLite.
+
+        Storage-backed counterpart of ethica.progress_aggregation.aggregate_all_goals():
+        SUM(contribution) and COUNT(*) per goal_id over the stored
+        relationships. No Action or relationship objects are built, so
+        GoalProgress.matches is empty and matching_actions_count comes from
+        the count.
+
+        Args:
+            goals: Goals to report on (default: every stored goal)
+
+        Returns:
+            List of GoalProgress, one per goal (same order as goals)
+
+        Example:
+            >>> all_progress = progress_service.aggregate_all_goals()
+            >>> complete = [p for p in all_progress if p.is_complete]
+        """
+        if goals is None:
+            goals = self.goal_service.get_all()
+            totals = self._totals_by_goal()
+        else:
+            keys = [str(goal.uuid_id) for goal in goals]
+            batch_size = self.db.fetch_batch_size
+            totals = {}
+            for start in range(0, len(keys), batch_size):
+                totals.update(self._totals_by_goal({'goal_id': In(keys[start:start + batch_size])}))
+
+        progress_list = []
+        for goal in goals:
+            total, count = totals.get(str(goal.uuid_id), (0.0, 0))
+            progress_list.append(progress_aggregation.progress_from_totals(goal, total, count))
+        return progress_list
+
+    def get_progress_summary(self, goals: Optional[List[Goal]] = None) -> dict:
+        """
+        Summary statistics across goals from stored relationships.
+
+        Same result as ethica.progress_aggregation.get_progress_summary()
+        over the stored matches; the per-goal sums come from SQL.
+
+        Args:
+            goals: Goals to summarize (default: every stored goal)
+
+        Returns:
+            Dict with total_goals, complete_goals, in_progress_goals,
+            avg_completion_percent and total_actions_matched
+        """
+        return progress_aggregation.get_progress_summary(self.aggregate_all_goals(goals))
+
+    def _totals_by_goal(self, filters: Optional[dict] = None) -> Dict[str, tuple]:
+        """goal_id → (sum of contributions, relationship count), one GROUP BY query."""
+        rows = self.db.aggregate(
+            self.table_name,
+            {'total': ('TOTAL', 'contribution'), 'match_count': ('COUNT', '*')},
+            group_by=['goal_id'],
+            filters=filters
+        )
+        return {row['goal_id']: (row['total'], row['match_count']) for row in rows}
+
+    def pending_changes(self, consumer: str = INFERENCE_CONSUMER) -> PendingChanges:
+        """
+        Actions and goals changed since consumer last called mark_processed().
+
+        Args:
+            consumer: Watermark name (one per independent incremental job)
+
+        Returns:
+            PendingChanges. full_rebuild is set when the consumer has no
+            watermark yet; the id sets are then empty
+        """
+        watermark = self.db.get_change_watermark(consumer)
+        through_seq, changes = self.db.get_changes(watermark or 0, tables=['actions', 'goals'])
+
+        if watermark is None:
+            return PendingChanges(through_seq, frozenset(), frozenset(), full_rebuild=True)
+
+        return PendingChanges(
+            through_seq=through_seq,
+            action_ids=frozenset(c['row_uuid'] for c in changes if c['table_name'] == 'actions'),
+            goal_ids=frozenset(c['row_uuid'] for c in changes if c['table_name'] == 'goals'),
+        )
+
+    def mark_processed(self, changes: PendingChanges,
+                       consumer: str = INFERENCE_CONSUMER) -> None:
+        """
+        Advance consumer's watermark past changes and prune the shared log.
+
+        Call after the matches for changes are stored. If the process dies
+        before this, the same changes are simply processed again.
+
+        Args:
+            changes: Result of pending_changes() that has been handled
+            consumer: Watermark name
+        """
+        self.db.set_change_watermark(consumer, changes.through_seq)
+        self.db.prune_change_log()
@@ -11,9 +11,13 @@ Updated by Claude Code on 2025-10-21 to add UUID support
 
 from dataclasses import fields, is_dataclass
 from datetime import datetime, date
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 from uuid import UUID
-import json
+from rhetorica import codec
+
+# Distinct values memoized per decoder in one deserialize_many() batch
+DECODE_MEMO_SIZE = 4096
 
 
 def serialize(entity: Any, include_type: bool = True, json_encode: bool = False) -> dict:
@@ -56,31 +60,33 @@ def serialize(entity: Any, include_type: bool = True, json_encode: bool = False)
 
     result = {}
 
-    for field in fields(entity):
-        value = getattr(entity, field.name)
-        db_field_name = field.name
+    for name in _get_field_names(entity.__class__):
+        value = getattr(entity, name)
 
         if value is None:
-            result[db_field_name] = None
+            result[name] = None
             continue
 
-        # Serialize based on detected type
-        if isinstance(value, UUID):
+        # Serialize based on detected type (classified once per concrete type)
+        value_type = type(value)
+        kind = _VALUE_KINDS.get(value_type)
+        if kind is None:
+            kind = _classify_value_type(value_type)
+
+        if kind is _KIND_PLAIN:
+            # Primitive types (int, str, float, bool) - keep as-is
+            result[name] = value
+        elif kind is _KIND_STR:
             # Convert UUID to string for storage
-            result[db_field_name] = str(value)
-        elif isinstance(value, datetime):
-            result[db_field_name] = value.isoformat()
-        elif isinstance(value, date):
-            result[db_field_name] = value.isoformat()
-        elif isinstance(value, (dict, list)):
-            # Keep as dict/list for in-memory use, or convert to JSON for database
-            if json_encode:
-                result[db_field_name] = json.dumps(value)
-            else:
-                result[db_field_name] = value
+            result[name] = str(value)
+        elif kind is _KIND_ISO:
+            result[name] = value.isoformat()
+        elif json_encode:
+            # dict/list converted to JSON for database
+            result[name] = codec.dumps(value)
         else:
-            # Primitive types (int, str, float, bool) - keep as-is
-            result[db_field_name] = value
+            # Keep as dict/list for in-memory use
+            result[name] = value
 
     # Add type information for polymorphism (e.g., Values hierarchy, Goal subclasses)
     if include_type:
@@ -89,7 +95,8 @@ def serialize(entity: Any, include_type: bool = True, json_encode: bool = False)
     return result
 
 
-def deserialize(data: dict, entity_class: type, json_decode: bool = False) -> Any:
+def deserialize(data: dict, entity_class: type, json_decode: bool = False,
+                uuid_as_str: bool = False) -> Any:
     """
     Reconstruct entity from dict using dataclass field metadata.
 
@@ -101,6 +108,7 @@ def deserialize(data: dict, entity_class: type, json_decode: bool = False) -> An
         data: Dict from database or API with field values
         entity_class: The dataclass to reconstruct (e.g., Goal, Action)
         json_decode: If True, parses JSON strings to dicts/lists (for DB reads, default: False)
+        uuid_as_str: If True, UUID fields keep their string form (see deserialize_many)
 
     Returns:
         Instance of entity_class with fields populated from data
@@ -128,107 +136,128 @@ def deserialize(data: dict, entity_class: type, json_decode: bool = False) -> An
 
     parsed = {}
 
-    for field in fields(entity_class):
-        if field.name not in data:
+    for name, convert in _get_deserialize_plan(entity_class, json_decode):
+        if uuid_as_str and convert is _decode_uuid:
+            convert = None
+
+        if name not in data:
             # Field not in data - let dataclass default handle it
             continue
 
-        value = data[field.name]
+        value = data[name]
 
-        if value is None:
-            parsed[field.name] = None
-            continue
-
-        # Parse based on field type annotation
-        field_type = field.type
-
-        # Extract type from Optional[T], Union[T, None], etc.
-        origin = getattr(field_type, '__origin__', None)
-        type_args = getattr(field_type, '__args__', ())
-
-        # Handle Optional[T] and Union[T, None] by extracting non-None types
-        if origin is type(None) or (hasattr(field_type, '__class__') and 'Union' in str(origin)):
-            non_none_types = [t for t in type_args if t is not type(None)]
-            if len(non_none_types) == 1:
-                # Optional[T] or Union[T, None] - use T
-                field_type = non_none_types[0]
-                origin = getattr(field_type, '__origin__', None)
-                type_args = getattr(field_type, '__args__', ())
-            elif len(non_none_types) > 1:
-                # Union[str, dict] - handle specially
-                # Try JSON decode first, fall back to string
-                if json_decode and isinstance(value, str) and value.strip().startswith(('{', '[')):
-                    try:
-                        parsed[field.name] = json.loads(value)
-                        continue
-                    except json.JSONDecodeError:
-                        parsed[field.name] = value  # Keep as string
-                        continue
-                else:
-                    parsed[field.name] = value
-                    continue
-
-        # Type-specific parsing
-        if field_type == UUID or field_type is UUID:
-            if isinstance(value, str):
-                parsed[field.name] = UUID(value)
-            else:
-                parsed[field.name] = value  # Already UUID
-        elif field_type == datetime or field_type is datetime:
-            if isinstance(value, str):
-                parsed[field.name] = datetime.fromisoformat(value)
-            else:
-                parsed[field.name] = value  # Already datetime
-        elif field_type == date or field_type is date:
-            if isinstance(value, str):
-                parsed[field.name] = datetime.strptime(value, '%Y-%m-%d').date()
-            else:
-                parsed[field.name] = value  # Already date
-        elif origin is dict and json_decode:
-            # Handles both dict and Dict[K, V]
-            if isinstance(value, str) and value.strip().startswith('{'):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    # Not valid JSON, keep as string (shouldn't happen but defensive)
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value  # Already dict or not JSON
-        elif origin is list and json_decode:
-            # Handles both list and List[T]
-            if isinstance(value, str) and value.strip().startswith('['):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value  # Already list or not JSON
-        elif (field_type == dict or field_type is dict) and json_decode:
-            # Plain dict annotation (fallback for older Python)
-            if isinstance(value, str) and value.strip().startswith('{'):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value
-        elif (field_type == list or field_type is list) and json_decode:
-            # Plain list annotation (fallback for older Python)
-            if isinstance(value, str) and value.strip().startswith('['):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value
+        if value is None or convert is None:
+            parsed[name] = value
         else:
-            # Primitive types - keep as-is (includes dict/list if not json_decode)
-            parsed[field.name] = value
+            parsed[name] = convert(value)
 
     # Create instance - dataclass __init__ handles all fields
     return entity_class(**parsed)
 
 
+def deserialize_many(rows: Iterable, entity_class: type, json_decode: bool = False,
+                     uuid_as_str: bool = False, memo_size: int = DECODE_MEMO_SIZE) -> list:
+    """
+    Reconstruct many entities of one class, decoding column by column.
+
+    Same rules as deserialize(), applied per column instead of per row: every
+    log_time is parsed in one pass, every JSON column decoded in one pass, and
+    keys of decoded JSON objects (e.g. measurement units) are shared across
+    the batch instead of duplicated per row.
+
+    datetime, date and UUID decoding is memoized per batch (bounded LRU), so
+    repeated values - a term's start_date, the goal_id on many progress rows -
+    are parsed once and share one immutable object.
+
+    Args:
+        rows: Dicts or sqlite3.Row objects (or a cursor yielding them) -
+              typically every row of one query
+        entity_class: The dataclass to reconstruct (e.g., Action)
+        json_decode: If True, parses JSON strings to dicts/lists (for DB reads, default: False)
+        uuid_as_str: If True, UUID fields keep their (deduplicated) string form
+                     instead of becoming UUID objects. For read paths that only
+                     serialize entities back out, e.g. list endpoints
+        memo_size: Maximum distinct values memoized per decoder (0 disables)
+
+    Returns:
+        List of entity_class instances, in row order
+
+    Raises:
+        TypeError: If entity_class is not a dataclass
+
+    Example:
+        >>> records = db.query('actions')
+        >>> actions = deserialize_many(records, Action, json_decode=True)
+    """
+    if not is_dataclass(entity_class):
+        raise TypeError(
+            f"Can only deserialize to dataclasses, got {entity_class.__name__}. "
+            f"Add @dataclass decorator to the class definition."
+        )
+
+    rows = rows if isinstance(rows, list) else list(rows)
+    if not rows:
+        return []
+
+    # Columns present in the batch (rows from one query share their keys)
+    first_keys = rows[0].keys()
+    present = set(first_keys)
+    uniform = True
+    if isinstance(rows[0], dict):
+        for row in rows:
+            if row.keys() != first_keys:
+                present.update(row.keys())
+                uniform = False
+
+    names = []
+    columns = []
+    # The batch shares JSON object keys unless the codec already interns them
+    shared_keys = None if codec.interns_keys else {}
+    memoized = {}
+
+    for name, convert in _get_deserialize_plan(entity_class, json_decode):
+        if name not in present:
+            # Field not in data - let dataclass default handle it
+            continue
+
+        if uniform:
+            column = [row[name] for row in rows]
+        else:
+            column = [row.get(name, _MISSING) for row in rows]
+
+        if uuid_as_str and convert is _decode_uuid:
+            convert = _keep_uuid_text
+
+        # Memoize columns with repeated values (term dates, referenced ids);
+        # for unique columns (uuid_id, log_time) the memo would only add cost
+        if convert in _MEMOIZABLE:
+            if memo_size and _has_repeats(column):
+                if convert not in memoized:
+                    memoized[convert] = lru_cache(maxsize=memo_size, typed=True)(convert)
+                convert = memoized[convert]
+            elif convert is _keep_uuid_text:
+                convert = None
+
+        if convert in _JSON_PREFIXES:
+            column = _decode_json_column(column, _JSON_PREFIXES[convert], convert, shared_keys)
+        elif convert is not None:
+            column = [
+                value if value is None or value is _MISSING else convert(value)
+                for value in column
+            ]
+
+        names.append(name)
+        columns.append(column)
+
+    # Create instances - dataclass __init__ handles all fields
+    if uniform:
+        return [entity_class(**dict(zip(names, values))) for values in zip(*columns)]
+    return [
+        entity_class(**{name: value for name, value in zip(names, values) if value is not _MISSING})
+        for values in zip(*columns)
+    ]
+
+
 def serialize_many(entities: list, include_type: bool = True) -> list[dict]:
     """
     Serialize a list of dataclass entities.
@@ -246,3 +275,195 @@ def serialize_many(entities: list, include_type: bool = True) -> list[dict]:
         [{'description': '...', 'type': 'Goal'}, ...]
     """
     return [serialize(entity, include_type=include_type) for entity in entities]
+
+
+# ============================================================================
+# COMPILED PLANS
+# ============================================================================
+# serialize()/deserialize() inspect each entity class once and cache the
+# result, instead of re-running fields() and type-annotation dispatch for every
+# field of every row. Plans reproduce the per-field rules documented above.
+# ============================================================================
+
+# Serialization kinds, decided once per concrete value type
+_KIND_PLAIN = 'plain'        # int, str, float, bool, ... - kept as-is
+_KIND_STR = 'str'            # UUID → str(value)
+_KIND_ISO = 'iso'            # datetime/date → value.isoformat()
+_KIND_CONTAINER = 'container'  # dict/list → as-is, or JSON with json_encode
+
+_VALUE_KINDS: dict = {}
+_FIELD_NAMES: dict = {}
+_DESERIALIZE_PLANS: dict = {}
+
+# Rows sampled to decide whether a column's values repeat
+_REPEAT_SAMPLE = 256
+
+# Marks a column missing from some rows of a deserialize_many() batch
+_MISSING = object()
+
+
+def _classify_value_type(value_type: type) -> str:
+    """Decide (and cache) how serialize() formats values of this type."""
+    if issubclass(value_type, UUID):
+        kind = _KIND_STR
+    elif issubclass(value_type, (datetime, date)):
+        kind = _KIND_ISO
+    elif issubclass(value_type, (dict, list)):
+        kind = _KIND_CONTAINER
+    else:
+        kind = _KIND_PLAIN
+    _VALUE_KINDS[value_type] = kind
+    return kind
+
+
+def _get_field_names(entity_class: type) -> tuple:
+    """Dataclass field names of entity_class, computed once per class."""
+    names = _FIELD_NAMES.get(entity_class)
+    if names is None:
+        names = tuple(field.name for field in fields(entity_class))
+        _FIELD_NAMES[entity_class] = names
+    return names
+
+
+def _decode_uuid(value):
+    if isinstance(value, str):
+        # Fast path for the canonical 8-4-4-4-12 form; same result as UUID(value)
+        if (len(value) == 36 and value[8] == '-' and value[13] == '-'
+                and value[18] == '-' and value[23] == '-'):
+            hex_digits = value.replace('-', '')
+            if len(hex_digits) == 32:
+                return UUID(int=int(hex_digits, 16))
+        return UUID(value)
+    return value  # Already UUID
+
+
+def _has_repeats(column: list) -> bool:
+    """True if the first rows of a column already contain a repeated value."""
+    sample = column[:_REPEAT_SAMPLE]
+    return len(set(sample)) < len(sample)
+
+
+def _keep_uuid_text(value):
+    return value  # uuid_as_str: memoized, so repeated ids share one string
+
+
+def _decode_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _decode_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date() if isinstance(value, str) else value
+
+
+def _json_decoder(prefixes):
+    """Decoder for JSON text starting with one of prefixes; anything else is kept as-is."""
+    def decode(value):
+        if isinstance(value, str) and value.strip().startswith(prefixes):
+            try:
+                return codec.loads(value)
+            except codec.JSONDecodeError:
+                # Not valid JSON, keep as string (shouldn't happen but defensive)
+                return value
+        return value  # Already dict/list or not JSON
+    return decode
+
+
+_decode_json_object = _json_decoder('{')
+_decode_json_array = _json_decoder('[')
+_decode_json_any = _json_decoder(('{', '['))
+
+# Decoders of immutable values, safe to memoize and share between entities
+_MEMOIZABLE = {_decode_uuid, _decode_datetime, _decode_date, _keep_uuid_text}
+
+_JSON_PREFIXES = {
+    _decode_json_object: '{',
+    _decode_json_array: '[',
+    _decode_json_any: ('{', '['),
+}
+
+
+def _decode_json_column(column: list, prefixes, decode, shared_keys: Optional[dict]) -> list:
+    """
+    Decode a column of JSON text in one pass, sharing object keys across the batch.
+
+    Equivalent to [decode(v) for v in column]: JSON text without leading
+    whitespace (what serialize() writes) is decoded without decode()'s
+    per-value checks, anything else goes through decode() itself.
+    Keys of decoded objects are deduplicated (one 'km' string, not 50k)
+    through shared_keys, or by the codec itself when shared_keys is None.
+    """
+    decoded_column = []
+    append = decoded_column.append
+    loads = codec.loads
+
+    for value in column:
+        if type(value) is str and value.startswith(prefixes):
+            try:
+                decoded = loads(value)
+            except codec.JSONDecodeError:
+                decoded = value  # Not valid JSON, keep as string
+            if shared_keys is not None and type(decoded) is dict:
+                decoded = {shared_keys.setdefault(key, key): item for key, item in decoded.items()}
+            append(decoded)
+        elif value is None or value is _MISSING:
+            append(value)
+        else:
+            append(decode(value))
+
+    return decoded_column
+
+
+def _compile_field_decoder(field_type, json_decode: bool):
+    """
+    Pick the decoder for one field annotation.
+
+    Returns:
+        Callable applied to non-None values, or None to keep values as-is
+    """
+    # Extract type from Optional[T], Union[T, None], etc.
+    origin = getattr(field_type, '__origin__', None)
+    type_args = getattr(field_type, '__args__', ())
+
+    if origin is type(None) or (hasattr(field_type, '__class__') and 'Union' in str(origin)):
+        non_none_types = [t for t in type_args if t is not type(None)]
+        if len(non_none_types) == 1:
+            # Optional[T] or Union[T, None] - use T
+            field_type = non_none_types[0]
+            origin = getattr(field_type, '__origin__', None)
+        elif len(non_none_types) > 1:
+            # Union[str, dict] - try JSON decode first, fall back to string
+            return _decode_json_any if json_decode else None
+
+    if field_type == UUID or field_type is UUID:
+        return _decode_uuid
+    if field_type == datetime or field_type is datetime:
+        return _decode_datetime
+    if field_type == date or field_type is date:
+        return _decode_date
+    if json_decode:
+        # Handles dict, Dict[K, V], list and List[T]
+        if origin is dict or field_type == dict or field_type is dict:
+            return _decode_json_object
+        if origin is list or field_type == list or field_type is list:
+            return _decode_json_array
+
+    # Primitive types - keep as-is (includes dict/list if not json_decode)
+    return None
+
+
+def _get_deserialize_plan(entity_class: type, json_decode: bool) -> tuple:
+    """
+    Compiled deserialization plan for a dataclass, built on first use.
+
+    Returns:
+        Tuple of (field_name, decoder_or_None) pairs in field order
+    """
+    key = (entity_class, json_decode)
+    plan = _DESERIALIZE_PLANS.get(key)
+    if plan is None:
+        plan = tuple(
+            (field.name, _compile_field_decoder(field.type, json_decode))
+            for field in fields(entity_class)
+        )
+        _DESERIALIZE_PLANS[key] = plan
+    return plan
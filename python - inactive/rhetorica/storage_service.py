@@ -7,16 +7,23 @@ Contents:
 - PolymorphicStorageService: Base for polymorphic entities
 - Values Storage: ValuesStorageService with type hierarchy
 
+Services created while a StorageSession is active (or given one) share its
+identity map and unit of work, see rhetorica.storage_session.
 
 """
 
 from abc import ABC
-from typing import List, Optional, TypeVar, Generic, Protocol, Type, Union, Any
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TypeVar, Generic, Protocol, Type, Union, Any
 from categoriae.actions import Action
 from categoriae.goals import Goal, Milestone, SmartGoal
 from categoriae.terms import GoalTerm
 from categoriae.values import Values, MajorValues, HighestOrderValues, LifeAreas, PriorityLevel
-from politica.database import Database
+from politica.database import Database, get_default_database
+from politica.filters import Between, In
+from rhetorica.action_frame import ActionFrame
+from rhetorica.storage_session import StorageSession, current_session
 
 # Protocol for entities that can be persisted (have UUID)
 from uuid import UUID
@@ -39,22 +46,44 @@ class StorageService(ABC, Generic[T]):
     """
     table_name: str = ''
     entity_class: Optional[Type[T]] = None  # Override in subclass for automatic _from_dict()
+    bulk_insert_threshold: int = 8  # Batches larger than this use Database.insert_many()
+    bulk_insert_id_chunk: int = 500  # uuid_ids per rowid read-back query after a bulk insert
 
-    def __init__(self, database: Optional[Database] = None):
+    def __init__(self, database: Optional[Database] = None,
+                 session: Optional[StorageSession] = None):
         """
         Initialize storage service with database connection.
 
         Args:
-            database: Database instance. If None, creates default instance
-                     with default paths from config.
+            database: Database instance. If None, uses the session's database,
+                     or the shared default instance with default paths from config.
+            session: StorageSession to share loads and writes with. If None,
+                     joins the active session (current_session()) when it
+                     uses the same database.
+
+        Raises:
+            ValueError: If session and database are both given but differ
         """
-        self.db = database or Database()
+        if session is None:
+            session = current_session()
+            if session is not None and database is not None and database is not session.db:
+                session = None
+        elif database is not None and database is not session.db:
+            raise ValueError("session belongs to a different database")
+
+        self.session = session
+        self.db = database or (session.db if session is not None else get_default_database())
+        if session is not None:
+            session.register(self)
 
     def store_many_instances(self, entities: List[T]) -> List[T]:
         """
         Store multiple entity instances to database.
         Populates entity.id with database-assigned ID after insert.
 
+        Batches larger than bulk_insert_threshold go through the executemany()
+        bulk path instead; their IDs are read back by uuid_id afterwards.
+
         Args:
             entities: List of domain entities (Action, Goal, etc.)
 
@@ -67,6 +96,20 @@ class StorageService(ABC, Generic[T]):
             entity_dict = self._to_dict(e)
             formatted_entries.append(entity_dict)
 
+        if len(formatted_entries) > self.bulk_insert_threshold:
+            self.db.insert_many(table=self.table_name, records=formatted_entries)
+            uuids = [entry['uuid_id'] for entry in formatted_entries]
+            ids_by_uuid = {}
+            for start in range(0, len(uuids), self.bulk_insert_id_chunk):
+                rows = self.db.query(self.table_name,
+                                     filters={'uuid_id': In(uuids[start:start + self.bulk_insert_id_chunk])},
+                                     columns=['uuid_id', 'rowid'])
+                ids_by_uuid.update((row['uuid_id'], row['rowid']) for row in rows)
+            for entity, entity_uuid in zip(entities, uuids):
+                entity.id = ids_by_uuid.get(entity_uuid)
+            self._put_mapped(entities)
+            return entities
+
         # Insert and get back list of IDs
         inserted_ids = self.db.insert(table=self.table_name, records=formatted_entries)
 
@@ -74,6 +117,7 @@ class StorageService(ABC, Generic[T]):
         for entity, db_id in zip(entities, inserted_ids):
             entity.id = db_id
 
+        self._put_mapped(entities)
         return entities
 
     def store_single_instance(self, entry: T) -> T:
@@ -102,38 +146,116 @@ class StorageService(ABC, Generic[T]):
             List of domain entities (Action, Goal, etc.) with IDs
         """
         records = self.db.query(self.table_name, filters=filters)
-        return [self._from_dict(record) for record in records]
+        return self._from_records(records)
+
+    def iter_all(self, filters: Optional[dict] = None,
+                 batch_size: Optional[int] = None,
+                 uuid_as_str: bool = False) -> Iterator[T]:
+        """
+        Stream entities from database instead of building a full list.
+
+        Generator counterpart of get_all(): rows are fetched in batches and
+        converted one batch at a time, so memory stays flat as the table grows.
+        With a session, entities it has already loaded come back as the mapped
+        instance, but streamed entities are never added to its identity map.
+
+        Args:
+            filters: Optional dict of column:value pairs to filter results
+            batch_size: Rows fetched per batch (default: Database.fetch_batch_size)
+            uuid_as_str: Leave uuid_id (and other UUID fields) as strings. Only for
+                         callers that serialize the entities straight back out
+
+        Yields:
+            Domain entities (Action, Goal, etc.)
+
+        Example:
+            for action in service.iter_all():
+                print(action.title)
+        """
+        batch_size = batch_size or self.db.fetch_batch_size
+        records = self.db.iter_query(self.table_name, filters=filters, batch_size=batch_size)
+        yield from self._iter_batches(records, batch_size, uuid_as_str)
+
+    def _iter_batches(self, records: Iterator[dict], batch_size: int,
+                      uuid_as_str: bool = False) -> Iterator[T]:
+        """
+        Decode streamed records a batch at a time so deserialize_many() works column-wise.
+
+        Entities are not added to the session's identity map, which would
+        otherwise hold every streamed row until the session closes.
+        """
+        while batch := list(islice(records, batch_size)):
+            entities = self._decode_records(batch, uuid_as_str)
+            if self.session is not None and not uuid_as_str:
+                entities = self.session.resolve(self.table_name, entities)
+            yield from entities
 
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """
         DEPRECATED: Retrieve entity by INTEGER id (backward compatibility only).
         Use get_by_uuid() instead.
 
+        Tables are keyed by uuid_id and have no id column; the INTEGER id is
+        the row's SQLite rowid, as assigned by store_many_instances().
+
         Args:
             entity_id: Database INTEGER ID (legacy)
 
         Returns:
             Domain entity, or None if not found
         """
-        records = self.db.query(self.table_name, filters={'id': entity_id})
+        records = self.db.query(self.table_name, filters={'rowid': entity_id})
         if not records:
             return None
-        return self._from_dict(records[0])
+        entity = self._mapped([self._from_dict(records[0])])[0]
+        entity.id = entity_id
+        return entity
 
     def get_by_uuid(self, entity_uuid: UUID) -> Optional[T]:
         """
         Retrieve a single entity by its UUID.
 
+        With a session, an entity already loaded is returned without a query.
+
         Args:
             entity_uuid: UUID of the entity
 
         Returns:
             Domain entity, or None if not found
         """
+        if self.session is not None:
+            entity = self.session.get(self.table_name, entity_uuid)
+            if entity is not None:
+                return entity
         records = self.db.query(self.table_name, filters={'uuid_id': str(entity_uuid)})
         if not records:
             return None
-        return self._from_dict(records[0])
+        return self._mapped([self._from_dict(records[0])])[0]
+
+    def get_by_uuids(self, entity_uuids: Iterable[Union[UUID, str]]) -> List[T]:
+        """
+        Retrieve the entities with any of the given UUIDs.
+
+        Looks them up in batches of fetch_batch_size with uuid_id IN (...).
+        UUIDs without a row (e.g. deleted entities) are skipped. With a
+        session, only UUIDs not loaded yet are queried.
+
+        Args:
+            entity_uuids: UUIDs (or their string form)
+
+        Returns:
+            Domain entities found, in no particular order
+        """
+        keys = list(dict.fromkeys(str(entity_uuid) for entity_uuid in entity_uuids))
+        batch_size = self.db.fetch_batch_size
+        entities: List[T] = []
+        if self.session is not None:
+            entities, keys = self.session.lookup(self.table_name, keys)
+        for start in range(0, len(keys), batch_size):
+            records = self.db.query(self.table_name,
+                                    filters={'uuid_id': In(keys[start:start + batch_size])})
+            entities.extend(self._from_records(records))
+        return entities
 
     def save(self, entity: T, notes: str = '') -> T:
         """
@@ -199,12 +321,14 @@ class StorageService(ABC, Generic[T]):
         entity_dict.pop('uuid_id', None)
 
         # Call database update using UUID
-        return self.db.update_by_uuid(
+        result = self.db.update_by_uuid(
             table=self.table_name,
             record_uuid=str(entity.uuid_id),
             updates=entity_dict,
             notes=notes
         )
+        self._put_mapped([entity])
+        return result
 
     def delete(self, entity_id: int, notes: str = '') -> dict:
         """
@@ -239,10 +363,12 @@ class StorageService(ABC, Generic[T]):
         # Archive and delete through database layer
         result = self.db.archive_and_delete(
             table=self.table_name,
-            filters={'id': entity_id},
+            filters={'uuid_id': str(entity.uuid_id)},
             confirm=True,  # Bypass preview mode - entity already verified
             notes=notes or f'Deleted {self.table_name} ID {entity_id}'
         )
+        if self.session is not None:
+            self.session.discard(self.table_name, entity.uuid_id)
 
         return result
 
@@ -276,6 +402,8 @@ class StorageService(ABC, Generic[T]):
             confirm=True,
             notes=notes or f'Deleted {self.table_name} UUID {entity_uuid}'
         )
+        if self.session is not None:
+            self.session.discard(self.table_name, entity_uuid)
 
         return result
 
@@ -297,19 +425,77 @@ class StorageService(ABC, Generic[T]):
         Reconstruct entity from stored dict.
 
         Uses deserialize() with json_decode for standard dataclass entities.
-        Override this method for polymorphic entities (like Values hierarchy).
+        Override _entity_class_for() for polymorphic entities (like Values hierarchy).
 
         Requires subclass to set entity_class class attribute.
         """
         from rhetorica.serializers import deserialize
 
+        return deserialize(data, self._entity_class_for(data), json_decode=True)
+
+    def _from_records(self, records: List[dict], uuid_as_str: bool = False) -> List[T]:
+        """
+        Reconstruct many entities from stored dicts, in order.
+
+        Rows are grouped by target class and each group decoded with
+        deserialize_many(), so type conversion runs column-wise per batch.
+        Subclasses that override _from_dict() keep their per-row behavior.
+        uuid_as_str is passed through to deserialize_many() (such entities
+        bypass the session's identity map).
+        """
+        entities = self._decode_records(records, uuid_as_str)
+        return entities if uuid_as_str else self._mapped(entities)
+
+    def _decode_records(self, records: List[dict], uuid_as_str: bool = False) -> List[T]:
+        """Decode rows into new entities - see _from_records()."""
+        from rhetorica.serializers import deserialize_many
+
+        if type(self)._from_dict is not StorageService._from_dict:
+            return [self._from_dict(record) for record in records]
+        if not records:
+            return []
+
+        classes = [self._entity_class_for(record) for record in records]
+        if len(set(classes)) == 1:
+            return deserialize_many(records, classes[0], json_decode=True, uuid_as_str=uuid_as_str)
+
+        # Mixed types (e.g. Goal/Milestone/SmartGoal): decode per class, restore row order
+        positions: dict = {}
+        for index, entity_class in enumerate(classes):
+            positions.setdefault(entity_class, []).append(index)
+
+        entities: List[Any] = [None] * len(records)
+        for entity_class, indexes in positions.items():
+            decoded = deserialize_many([records[i] for i in indexes], entity_class,
+                                       json_decode=True, uuid_as_str=uuid_as_str)
+            for index, entity in zip(indexes, decoded):
+                entities[index] = entity
+        return entities
+
+    def _mapped(self, entities: List[T]) -> List[T]:
+        """Swap in the session's instance for entities it has already loaded."""
+        if self.session is None:
+            return entities
+        return self.session.merge(self.table_name, entities)
+
+    def _put_mapped(self, entities: List[T]) -> None:
+        """Make just-written entities the session's instances for their uuid_ids."""
+        if self.session is not None:
+            for entity in entities:
+                self.session.put(self.table_name, entity)
+
+    def _entity_class_for(self, data: dict) -> Type[T]:
+        """
+        Class to reconstruct a stored dict as.
+
+        Returns entity_class; polymorphic services choose per row.
+        """
         if self.entity_class is None:
             raise NotImplementedError(
                 f"{self.__class__.__name__} must either set entity_class "
                 "class attribute or override _from_dict()"
             )
-
-        return deserialize(data, self.entity_class, json_decode=True)
+        return self.entity_class
 
 
 
@@ -325,6 +511,103 @@ class ActionStorageService(StorageService[Action]):
     table_name = 'actions'
     entity_class = Action
 
+    def get_in_period(self, start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      filters: Optional[dict] = None,
+                      order_by: str = 'log_time') -> List[Action]:
+        """
+        Retrieve actions logged between start and end (inclusive).
+
+        The range is pushed into SQL so only the period's rows are loaded.
+        log_time is stored as ISO text, so the SQL range is widened to whole
+        days (robust to differently formatted timestamps) and the exact bounds
+        are re-checked on the parsed datetimes.
+
+        Args:
+            start: Earliest log_time to include (None = unbounded)
+            end: Latest log_time to include (None = unbounded)
+            filters: Additional database filters (dict of column:value pairs)
+            order_by: ORDER BY expression (default: oldest first)
+
+        Returns:
+            List of Action entities with start <= log_time <= end
+
+        Example:
+            october = service.get_in_period(datetime(2025, 10, 1), datetime(2025, 10, 31, 23, 59))
+        """
+        records = self.db.query(self.table_name,
+                                filters=self._period_filters(start, end, filters),
+                                order_by=order_by)
+        return [a for a in self._from_records(records) if self._in_period(a, start, end)]
+
+    def iter_in_period(self, start: Optional[datetime] = None,
+                       end: Optional[datetime] = None,
+                       filters: Optional[dict] = None,
+                       order_by: str = 'log_time',
+                       batch_size: Optional[int] = None,
+                       uuid_as_str: bool = False) -> Iterator[Action]:
+        """
+        Stream actions logged between start and end (inclusive).
+
+        Generator counterpart of get_in_period(), see iter_all().
+        """
+        batch_size = batch_size or self.db.fetch_batch_size
+        records = self.db.iter_query(self.table_name,
+                                     filters=self._period_filters(start, end, filters),
+                                     order_by=order_by, batch_size=batch_size)
+        for action in self._iter_batches(records, batch_size, uuid_as_str):
+            if self._in_period(action, start, end):
+                yield action
+
+    def get_frame(self, start: Optional[datetime] = None,
+                  end: Optional[datetime] = None,
+                  filters: Optional[dict] = None,
+                  batch_size: Optional[int] = None) -> ActionFrame:
+        """
+        Load actions between start and end (inclusive) as a columnar ActionFrame.
+
+        Rows are streamed straight into arrays - no Action object is built
+        per row. Use frame.to_actions() for the few rows that need entities.
+
+        Args:
+            start: Earliest log_time to include (None = unbounded)
+            end: Latest log_time to include (None = unbounded)
+            filters: Additional database filters (dict of column:value pairs)
+            batch_size: Rows per fetch (default: database fetch_batch_size)
+
+        Returns:
+            ActionFrame sorted by log_time
+
+        Example:
+            frame = service.get_frame(term.start_date, term.target_date)
+            km = frame.total('km')
+        """
+        records = self.db.iter_query(self.table_name,
+                                     filters=self._period_filters(start, end, filters),
+                                     order_by='log_time',
+                                     batch_size=batch_size or self.db.fetch_batch_size,
+                                     as_dicts=False)
+        return ActionFrame.from_records(records).between(start, end)
+
+    @staticmethod
+    def _period_filters(start: Optional[datetime], end: Optional[datetime],
+                        filters: Optional[dict]) -> Optional[dict]:
+        """Add a whole-day log_time range to filters (None if no filters at all)."""
+        db_filters = filters.copy() if filters else {}
+        if start is not None or end is not None:
+            db_filters['log_time'] = Between(
+                start.date().isoformat() if start is not None else None,
+                (end.date() + timedelta(days=1)).isoformat() if end is not None else None,
+            )
+        return db_filters or None
+
+    @staticmethod
+    def _in_period(action: Action, start: Optional[datetime], end: Optional[datetime]) -> bool:
+        """Exact inclusive bounds check on the parsed log_time."""
+        return bool(action.log_time
+                    and (start is None or action.log_time >= start)
+                    and (end is None or action.log_time <= end))
+
 
 class TermStorageService(StorageService[GoalTerm]):
     """
@@ -379,21 +662,16 @@ class ValuesStorageService(PolymorphicStorageService):
 
     table_name = 'personal_values'
 
-    def _from_dict(self, data: dict) -> Union[Values, MajorValues, HighestOrderValues, LifeAreas]:
+    def _entity_class_for(self, data: dict) -> Type[Union[Values, MajorValues, HighestOrderValues, LifeAreas]]:
         """
-        Reconstruct appropriate Values subclass from stored dict.
+        Pick the Values subclass for a stored dict.
 
-        Uses deserialize with polymorphic class selection based on incentive_type.
+        Polymorphic class selection based on incentive_type.
         Field names match 1:1 with database columns (no renaming needed).
+        Deserialized with json_decode=True to parse alignment_guidance.
         """
-        from rhetorica.serializers import deserialize
-
-        # Determine which class to deserialize to based on incentive_type
         incentive_type = data.get('incentive_type', 'general')
-        entity_class = self.CLASS_MAP.get(incentive_type, Values)
-
-        # Use deserialize with json_decode=True to parse alignment_guidance
-        return deserialize(data, entity_class, json_decode=True)
+        return self.CLASS_MAP.get(incentive_type, Values)
 
     def get_all(
         self,
@@ -477,21 +755,14 @@ class GoalStorageService(PolymorphicStorageService):
 
     table_name = 'goals'
 
-    def _from_dict(self, data: dict) -> Union[Goal, Milestone, SmartGoal]:
+    def _entity_class_for(self, data: dict) -> Type[Union[Goal, Milestone, SmartGoal]]:
         """
-        Reconstruct appropriate Goal subclass from stored dict.
+        Pick the Goal subclass for a stored dict.
 
-        Uses deserialize with polymorphic class selection based on goal_type.
-        Updated to use target_date field consistently.
+        Polymorphic class selection based on goal_type.
         """
-        from rhetorica.serializers import deserialize
-
-        # Determine which class to deserialize to based on goal_type
         goal_type = data.get('goal_type', 'Goal')
-        entity_class = self.CLASS_MAP.get(goal_type, Goal)
-
-        # Use deserialize with json_decode=True for any JSON fields
-        return deserialize(data, entity_class, json_decode=True)
+        return self.CLASS_MAP.get(goal_type, Goal)
 
     def get_all(
         self,
@@ -0,0 +1,314 @@
+"""
+Request-scoped identity map and unit of work for storage services.
+
+A StorageSession is shared by every storage service created while it is
+active (or given to them explicitly). It keeps one entity instance per
+(table, uuid_id):
+- get_by_uuid() for an entity already loaded is answered from the map,
+  without a query
+- get_by_uuids() only queries the uuid_ids not loaded yet
+- get_all() and the other list loads hand back the mapped instance for rows
+  already seen, so an action or goal is one object for the whole request
+- iter_all() and iter_in_period() also hand back mapped instances, but do
+  not map what they stream, so memory stays bounded
+
+Writes queued with add() and delete() are held until commit(), which runs
+them all in one Database.transaction(): new entities go through
+store_many_instances() (the bulk path for big batches), existing ones
+through update_instance(), deletions through delete_by_uuid(). Calls made
+directly on a service (save, update_instance, delete_by_uuid) still write
+immediately and keep the map current.
+
+Sessions are not thread-safe - use one per request or unit of work.
+
+Example:
+    with StorageSession() as session:
+        actions = ActionStorageService()      # joins the active session
+        action = actions.get_by_uuid(action_uuid)
+        action.notes = 'Felt good'
+        session.add(action)
+    # committed on exit, rolled back if the block raised
+"""
+
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+from politica.database import Database, get_default_database
+from politica.filters import In
+from config.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Identity map key: (table name, uuid_id string)
+IdentityKey = Tuple[str, str]
+
+_current_session: ContextVar[Optional['StorageSession']] = ContextVar('storage_session', default=None)
+
+
+def current_session() -> Optional['StorageSession']:
+    """
+    Return the session activated in the current context, if any.
+
+    Storage services created without an explicit session join this one.
+    """
+    return _current_session.get()
+
+
+class StorageSession:
+    """
+    Identity map plus pending writes, shared by the services of one request.
+
+    Attributes:
+        db: Database every participating service reads and writes
+    """
+
+    def __init__(self, database: Optional[Database] = None):
+        """
+        Initialize an empty session.
+
+        Args:
+            database: Database instance. If None, uses the shared default instance.
+        """
+        self.db = database or get_default_database()
+        self._identity: Dict[IdentityKey, Any] = {}
+        self._services: Dict[type, Any] = {}          # entity class → storage service
+        self._pending_saves: Dict[IdentityKey, Any] = {}
+        self._pending_deletes: Dict[IdentityKey, Tuple[Any, str, bool]] = {}  # entity, notes, added
+        self._token: Optional[Token] = None
+
+    # Activation
+
+    def activate(self) -> 'StorageSession':
+        """
+        Make this the current session, so new storage services join it.
+
+        Returns:
+            self (for chaining)
+        """
+        if self._token is None:
+            self._token = _current_session.set(self)
+        return self
+
+    def close(self) -> None:
+        """Discard pending writes and the identity map, and deactivate."""
+        self._pending_saves.clear()
+        self._pending_deletes.clear()
+        self._identity.clear()
+        if self._token is not None:
+            try:
+                _current_session.reset(self._token)
+            except ValueError:  # closed from another context (e.g. a copied one)
+                _current_session.set(None)
+            self._token = None
+
+    def __enter__(self) -> 'StorageSession':
+        return self.activate()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.close()
+
+    # Identity map
+
+    def register(self, service: Any) -> None:
+        """
+        Record which storage service handles which entity classes.
+
+        Called by StorageService.__init__; add() and delete() use it to find
+        the service for an entity. The first service registered for a class wins.
+        """
+        classes = list(getattr(service, 'CLASS_MAP', {}).values())
+        if service.entity_class is not None:
+            classes.append(service.entity_class)
+        for entity_class in classes:
+            self._services.setdefault(entity_class, service)
+
+    def get(self, table: str, entity_uuid: Union[UUID, str]) -> Optional[Any]:
+        """Entity loaded for (table, uuid_id) in this session, or None."""
+        return self._identity.get((table, str(entity_uuid)))
+
+    def lookup(self, table: str, keys: Iterable[str]) -> Tuple[List[Any], List[str]]:
+        """
+        Split uuid_id strings into entities already loaded and keys still to query.
+
+        Returns:
+            Tuple of (mapped entities, missing keys)
+        """
+        found, missing = [], []
+        for key in keys:
+            entity = self._identity.get((table, key))
+            if entity is None:
+                missing.append(key)
+            else:
+                found.append(entity)
+        return found, missing
+
+    def merge(self, table: str, entities: List[Any]) -> List[Any]:
+        """
+        Map freshly loaded entities, keeping the instance already in the session.
+
+        Args:
+            table: Table the entities were loaded from
+            entities: Entities just decoded from rows
+
+        Returns:
+            Same length and order; entities seen before are replaced by
+            their mapped instance (with any edits made to it)
+        """
+        identity = self._identity
+        merged = []
+        for entity in entities:
+            merged.append(identity.setdefault((table, str(entity.uuid_id)), entity))
+        return merged
+
+    def resolve(self, table: str, entities: List[Any]) -> List[Any]:
+        """
+        Like merge(), but without mapping entities the session hasn't seen.
+
+        Used for streamed loads, so the identity map doesn't grow with them.
+
+        Returns:
+            Same length and order; entities already mapped are replaced by
+            their mapped instance
+        """
+        identity = self._identity
+        if not identity:
+            return entities
+        return [identity.get((table, str(entity.uuid_id)), entity) for entity in entities]
+
+    def put(self, table: str, entity: Any) -> None:
+        """Make entity the mapped instance for its uuid_id (after it was written)."""
+        self._identity[(table, str(entity.uuid_id))] = entity
+
+    def discard(self, table: str, entity_uuid: Union[UUID, str]) -> None:
+        """Forget the mapped instance for a deleted row."""
+        self._identity.pop((table, str(entity_uuid)), None)
+
+    # Unit of work
+
+    def add(self, entity: Any) -> Any:
+        """
+        Queue entity to be inserted or updated at commit().
+
+        Whether it is inserted or updated is decided at commit time by its
+        uuid_id, like StorageService.save().
+
+        Args:
+            entity: Domain entity handled by a service of this session
+
+        Returns:
+            The entity (now the mapped instance for its uuid_id)
+
+        Raises:
+            ValueError: If no service of this session handles its class
+        """
+        service = self._service_for(entity)
+        key = (service.table_name, str(entity.uuid_id))
+        self._pending_deletes.pop(key, None)
+        self._pending_saves[key] = entity
+        self._identity[key] = entity
+        return entity
+
+    def delete(self, entity: Any, notes: str = '') -> None:
+        """
+        Queue entity to be archived and deleted at commit().
+
+        Args:
+            entity: Domain entity handled by a service of this session
+            notes: Optional notes for the archive entry
+
+        Raises:
+            ValueError: If no service of this session handles its class
+        """
+        service = self._service_for(entity)
+        key = (service.table_name, str(entity.uuid_id))
+        # Whether an entity added in this session was ever stored is checked at commit()
+        added = self._pending_saves.pop(key, None) is not None
+        self._pending_deletes[key] = (entity, notes, added)
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether commit() has anything to write."""
+        return bool(self._pending_saves or self._pending_deletes)
+
+    def commit(self) -> int:
+        """
+        Write all queued saves and deletes in one transaction.
+
+        Per table, stored uuid_ids are looked up with one IN (...) query;
+        new entities are inserted together, the others updated (archiving
+        their previous version). Deletes of entities that were added in
+        this session and never stored are dropped without a write. If any
+        write fails the whole batch rolls back and stays queued.
+
+        Returns:
+            Number of entities written
+        """
+        if not self.has_pending:
+            return 0
+
+        saves: Dict[Any, List[Any]] = {}
+        for entity in self._pending_saves.values():
+            saves.setdefault(self._service_for(entity), []).append(entity)
+        deletes: Dict[Any, List[Tuple[Any, str, bool]]] = {}
+        for pending in self._pending_deletes.values():
+            deletes.setdefault(self._service_for(pending[0]), []).append(pending)
+
+        written = 0
+        with self.db.transaction():
+            for service, entities in saves.items():
+                stored = self._row_keys(service, [str(e.uuid_id) for e in entities])
+                new = [e for e in entities if str(e.uuid_id) not in stored]
+                if new:
+                    service.store_many_instances(new)
+                for entity in entities:
+                    if str(entity.uuid_id) in stored:
+                        service.update_instance(entity)
+                written += len(entities)
+            for service, pending in deletes.items():
+                added_keys = [str(entity.uuid_id) for entity, _, added in pending if added]
+                stored = self._row_keys(service, added_keys) if added_keys else set()
+                for entity, notes, added in pending:
+                    if added and str(entity.uuid_id) not in stored:
+                        # Added in this session and never stored - nothing to delete
+                        self.discard(service.table_name, entity.uuid_id)
+                        continue
+                    service.delete_by_uuid(entity.uuid_id, notes=notes)
+                    written += 1
+
+        self._pending_saves.clear()
+        self._pending_deletes.clear()
+        logger.debug(f"Session committed {written} writes")
+        return written
+
+    def rollback(self) -> None:
+        """
+        Drop queued writes and the identity map.
+
+        Mapped instances may carry edits that were never written, so the
+        next load reads fresh rows. Writes already made directly through a
+        service are not undone.
+        """
+        self._pending_saves.clear()
+        self._pending_deletes.clear()
+        self._identity.clear()
+
+    def _service_for(self, entity: Any) -> Any:
+        for entity_class in type(entity).__mro__:
+            service = self._services.get(entity_class)
+            if service is not None:
+                return service
+        raise ValueError(f"No storage service in this session handles {type(entity).__name__}")
+
+    def _row_keys(self, service: Any, keys: List[str]) -> set:
+        """Which of keys have a row in the service's table."""
+        batch_size = self.db.fetch_batch_size
+        found = set()
+        for start in range(0, len(keys), batch_size):
+            records = self.db.query(service.table_name, columns=['uuid_id'],
+                                    filters={'uuid_id': In(keys[start:start + batch_size])})
+            found.update(record['uuid_id'] for record in records)
+        return found
@@ -29,3 +29,6 @@ CREATE TABLE IF NOT EXISTS actions (
     start_time TEXT,                                -- When action started (ISO format)
     duration_minutes REAL                           -- Duration in minutes
 );
+
+-- Index for time-range queries (term/period lookups); log_time is canonical ISO text
+CREATE INDEX IF NOT EXISTS idx_actions_log_time ON actions(log_time);
@@ -36,3 +36,7 @@ CREATE TABLE IF NOT EXISTS goals (
   how_goal_is_actionable TEXT,                    -- How to achieve it
   expected_term_length INTEGER                    -- Expected duration in weeks (e.g., 10)
 );
+
+-- Indexes for goals overlapping a period (start_date <= end AND target_date >= start)
+CREATE INDEX IF NOT EXISTS idx_goals_start_date ON goals(start_date);
+CREATE INDEX IF NOT EXISTS idx_goals_target_date ON goals(target_date);
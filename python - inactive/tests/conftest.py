@@ -10,7 +10,7 @@ Written by Claude Code on 2025-10-11
 import pytest
 from pathlib import Path
 from politica.database import Database
-from config.testing import TEST_DB_PATH, SCHEMA_PATH, clean_test_database, ensure_test_data_dir
+from config.testing import TEST_DB_PATH, SCHEMA_PATH, TEST_PRAGMA_PROFILE, clean_test_database, ensure_test_data_dir
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -52,9 +52,12 @@ def test_db():
         TEST_DB_PATH.unlink()
 
     # Create fresh database with production schemas
-    db = Database(db_path=TEST_DB_PATH, schema_dir=SCHEMA_PATH)
+    db = Database(db_path=TEST_DB_PATH, schema_dir=SCHEMA_PATH, pragma_profile=TEST_PRAGMA_PROFILE)
 
     yield db, TEST_DB_PATH
 
+    # Release pooled connections before the next test deletes the file
+    db.close()
+
     # Database persists after test for inspection
     # Run `python -m pytest --verbose` to see test database location
@@ -0,0 +1,95 @@
+"""
+Tests for the columnar ActionFrame (rhetorica.action_frame).
+"""
+
+from datetime import datetime
+
+from categoriae.actions import Action
+from categoriae.terms import GoalTerm
+from ethica.term_lifecycle import get_actions_in_term, get_term_measurement_totals
+from rhetorica.action_frame import ActionFrame
+from rhetorica.serializers import serialize
+from rhetorica.storage_service import ActionStorageService
+
+
+def _actions():
+    return [
+        Action('Run', log_time=datetime(2025, 10, 3, 7, 0), measurement_units_by_amount={'km': 5.0}),
+        Action('Yoga', log_time=datetime(2025, 10, 1, 8, 0),
+               measurement_units_by_amount={'minutes': 30.0}, duration_minutes=30.0,
+               start_time=datetime(2025, 10, 1, 7, 30)),
+        Action('Run', log_time=datetime(2025, 10, 5, 7, 0),
+               measurement_units_by_amount={'km': 8.0, 'minutes': 45.0}),
+        Action('Rest', log_time=datetime(2025, 10, 9, 21, 0), notes='Sore legs'),
+    ]
+
+
+def _frame(actions):
+    return ActionFrame.from_records(serialize(a, include_type=False, json_encode=True) for a in actions)
+
+
+def test_from_records_sorts_and_roundtrips_to_actions():
+    """Unordered rows come back sorted by log_time, and to_actions() rebuilds equal entities"""
+    actions = _actions()
+    frame = _frame(actions)
+
+    expected = sorted(actions, key=lambda a: a.log_time)
+    assert len(frame) == 4
+    assert frame.titles == ['Yoga', 'Run', 'Run', 'Rest']
+    assert frame.title_vocabulary == ['Run', 'Yoga', 'Rest']   # interned once each
+    assert frame.to_actions() == expected
+    assert frame.to_actions([2]) == [expected[2]]
+
+
+def test_period_slice_and_between_are_inclusive():
+    """between() keeps both bounds and re-bases measurement rows"""
+    frame = _frame(_actions())
+
+    october_3_to_5 = frame.between(datetime(2025, 10, 3, 7, 0), datetime(2025, 10, 5, 7, 0))
+
+    assert frame.period_slice(datetime(2025, 10, 3, 7, 0), datetime(2025, 10, 5, 7, 0)) == slice(1, 3)
+    assert october_3_to_5.titles == ['Run', 'Run']
+    assert october_3_to_5.totals_by_unit() == {'km': 13.0, 'minutes': 45.0}
+    assert [a.measurement_units_by_amount for a in october_3_to_5.to_actions()] == [
+        {'km': 5.0}, {'km': 8.0, 'minutes': 45.0}]
+    assert len(frame.between(datetime(2026, 1, 1))) == 0
+
+
+def test_unit_filters():
+    """Unit filters select actions by exact unit name"""
+    frame = _frame(_actions())
+
+    assert frame.indices_with_units(['km']) == [1, 2]
+    assert frame.indices_with_units(['km', 'minutes']) == [0, 1, 2]
+    assert frame.indices_with_units(['miles']) == []
+    assert frame.with_units(['minutes']).total('minutes') == 75.0
+    assert frame.total('miles') == 0
+
+
+def test_non_numeric_measurements_are_skipped():
+    """Null, string and boolean measurement values are ignored instead of failing the load"""
+    run = serialize(Action('Run', log_time=datetime(2025, 10, 3, 7, 0)), include_type=False, json_encode=True)
+    run['measurement_units_by_amount'] = '{"km": null, "pace": "fast", "outdoor": true, "minutes": 30}'
+
+    frame = ActionFrame.from_records([run])
+
+    assert len(frame) == 1
+    assert frame.totals_by_unit() == {'minutes': 30.0}
+    assert frame.indices_with_units(['km']) == []
+
+
+def test_term_totals_match_object_loop(test_db):
+    """Frame loaded from the table gives the same term totals as summing Action objects"""
+    db, _ = test_db
+    service = ActionStorageService(database=db)
+    service.store_many_instances(_actions())
+    term = GoalTerm(term_number=1, start_date=datetime(2025, 10, 2), target_date=datetime(2025, 10, 6))
+
+    frame = service.get_frame()
+
+    expected = {}
+    for action in get_actions_in_term(term, service.get_all()):
+        for unit, value in (action.measurement_units_by_amount or {}).items():
+            expected[unit] = expected.get(unit, 0.0) + value
+    assert get_term_measurement_totals(term, frame) == expected
+    assert len(service.get_frame(term.start_date, term.target_date)) == 2
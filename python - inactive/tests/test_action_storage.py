@@ -96,3 +96,67 @@ def test_action_update(test_db):
     assert updated.measurement_units_by_amount == {'distance_km': 10.0}  # Updated field
 
 
+
+def test_store_many_actions_bulk_path(test_db):
+    """Large batches are written with the bulk insert path and read back intact"""
+    db, _ = test_db
+
+    actions = []
+    for n in range(25):
+        action = Action(f'Imported run {n}')
+        action.measurement_units_by_amount = {'km': float(n + 1)}
+        actions.append(action)
+
+    service = ActionStorageService(database=db)
+    assert len(actions) > service.bulk_insert_threshold
+    service.store_many_instances(actions)
+
+    # IDs are populated exactly as on the small-batch path
+    assert all(isinstance(action.id, int) for action in actions)
+    assert len({action.id for action in actions}) == 25
+
+    retrieved = {a.uuid_id: a for a in service.get_all()}
+    assert len(retrieved) == 25
+    for action in actions:
+        assert retrieved[action.uuid_id].title == action.title
+        assert retrieved[action.uuid_id].measurement_units_by_amount == action.measurement_units_by_amount
+
+
+def test_iter_all_matches_get_all(test_db):
+    """Streaming entities yields the same actions as get_all()"""
+    db, _ = test_db
+    service = ActionStorageService(database=db)
+    service.store_many_instances([Action(f'Streamed {n}') for n in range(5)])
+
+    streamed = list(service.iter_all(batch_size=2))
+    assert sorted(a.uuid_id for a in streamed) == sorted(a.uuid_id for a in service.get_all())
+
+
+def test_get_in_period_bounds_are_inclusive(test_db):
+    """Only actions logged within the period are loaded, bounds included"""
+    db, _ = test_db
+    service = ActionStorageService(database=db)
+    for day, hour in [(1, 9), (5, 12), (10, 18), (11, 7)]:
+        action = Action(f'Day {day}')
+        action.log_time = datetime(2025, 10, day, hour)
+        service.store_single_instance(action)
+
+    start, end = datetime(2025, 10, 1, 9), datetime(2025, 10, 10, 18)
+    in_period = service.get_in_period(start, end)
+
+    assert [a.title for a in in_period] == ['Day 1', 'Day 5', 'Day 10']
+    assert [a.title for a in service.iter_in_period(start=datetime(2025, 10, 10))] == ['Day 10', 'Day 11']
+
+
+def test_legacy_integer_id_lookup_and_delete(test_db):
+    """get_by_id()/delete() find rows by the id store_single_instance() assigned"""
+    db, _ = test_db
+    service = ActionStorageService(database=db)
+    kept, doomed = (service.store_single_instance(Action(title)) for title in ('Kept', 'Doomed'))
+
+    assert service.get_by_id(kept.id).uuid_id == kept.uuid_id
+    assert service.get_by_id(kept.id).id == kept.id
+    assert service.get_by_id(10_000) is None
+
+    service.delete(doomed.id)
+    assert [a.uuid_id for a in service.get_all()] == [kept.uuid_id]
@@ -0,0 +1,73 @@
+"""
+Tests for compiled goal actionability hints (ethica.actionability).
+"""
+
+import json
+
+from categoriae.actions import Action
+from categoriae.goals import Goal
+from ethica.actionability import ActionabilitySpec, ActionabilitySpecCache
+from ethica.progress_matching import matches_with_how_goal_is_actionable
+
+
+def _goal(units, keywords):
+    return Goal(title='Run 120km', measurement_unit='km',
+                how_goal_is_actionable=json.dumps({'units': units, 'keywords': keywords}))
+
+
+def test_parse_normalizes_units_and_keywords():
+    """Units/keywords are lowercased and stripped; '*' wildcards removed; regex chars escaped"""
+    spec = ActionabilitySpec.parse(_goal([' KM ', 'Miles'], ['*Run*', 'C++', '  ', 'run']))
+
+    assert spec.units == {'km', 'miles'}
+    assert spec.keywords == ('run', 'c++')
+    assert spec.matches_title('learning c++ basics')
+    assert not spec.matches_title('swim')
+    assert spec.first_allowed_amount({'Minutes': 3.0, 'KM': 5.0, 'miles': 2.0}) == 5.0
+
+
+def test_unusable_hints_fall_back():
+    """Missing, malformed or empty hints give no spec (plain unit matching)"""
+    assert ActionabilitySpec.parse(Goal(title='No hints')) is None
+    assert ActionabilitySpec.parse(Goal(title='Bad', how_goal_is_actionable='{not json')) is None
+    assert ActionabilitySpec.parse(Goal(title='List', how_goal_is_actionable='[1, 2]')) is None
+    assert ActionabilitySpec.parse(_goal(['km'], [])) is None
+
+
+def test_cache_parses_once_and_notices_edits(monkeypatch):
+    """Each hint text is parsed once per goal; edited hints are re-parsed"""
+    cache = ActionabilitySpecCache()
+    goal = _goal(['km'], ['run'])
+    parses = []
+    original = ActionabilitySpec.parse.__func__
+    monkeypatch.setattr(ActionabilitySpec, 'parse',
+                        classmethod(lambda cls, g: parses.append(g) or original(cls, g)))
+
+    first = cache.get(goal)
+    assert cache.get(goal) is first
+    assert len(parses) == 1
+
+    goal.how_goal_is_actionable = json.dumps({'units': ['miles'], 'keywords': ['run']})
+    assert cache.get(goal).units == {'miles'}
+    assert len(parses) == 2
+
+    cache.invalidate(goal.uuid_id)
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded():
+    """Least recently used goals are evicted past maxsize"""
+    cache = ActionabilitySpecCache(maxsize=2)
+    goals = [_goal(['km'], ['run']) for _ in range(3)]
+    for goal in goals:
+        cache.get(goal)
+
+    assert len(cache) == 2
+
+
+def test_matching_uses_spec():
+    """Pairwise matching reads units and keywords from the compiled spec"""
+    goal = _goal(['km'], ['run'])
+
+    assert matches_with_how_goal_is_actionable(Action('Morning RUN', measurement_units_by_amount={'KM': 5.0}), goal) == (True, 5.0)
+    assert matches_with_how_goal_is_actionable(Action('Walk', measurement_units_by_amount={'km': 5.0}), goal) == (False, None)
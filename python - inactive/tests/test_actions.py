@@ -11,6 +11,8 @@ Testing philosophy:
 """
 from datetime import datetime
 
+import pytest
+
 from categoriae.actions import Action
 
 
@@ -99,3 +101,13 @@ def test_action_with_mixed_measurements():
 
     assert action.is_valid()
     assert len(action.measurement_units_by_amount) == 3
+
+
+def test_action_is_slotted():
+    """Actions store fields in slots - no per-instance __dict__, no stray attributes"""
+    action = Action("Ran", duration_minutes=30.0)
+
+    assert not hasattr(action, '__dict__')
+    assert action.duration_minutes == 30.0
+    with pytest.raises(AttributeError):
+        action.distance = 5.0
@@ -0,0 +1,50 @@
+"""
+Tests for the goals API routes (interfaces.flask.routes.api.goals).
+"""
+
+from datetime import datetime
+
+import pytest
+
+import politica.database
+from categoriae.actions import Action
+from categoriae.goals import SmartGoal
+from interfaces.flask.app import create_app
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+
+
+@pytest.fixture
+def client(test_db, monkeypatch):
+    """Flask test client whose storage services use the test database"""
+    db, _ = test_db
+    monkeypatch.setattr(politica.database, '_default_database', db)
+    return create_app({'TESTING': True}).test_client()
+
+
+def test_goal_progress_counts_freshly_logged_action(test_db, client):
+    """An action logged after the goal counts without running inference by hand"""
+    db, _ = test_db
+    goal = GoalStorageService(database=db).store_single_instance(SmartGoal(
+        title='Run 120km', measurement_unit='km', measurement_target=120.0,
+        start_date=datetime(2025, 10, 1), target_date=datetime(2025, 12, 10),
+        how_goal_is_relevant='Fitness', how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}'))
+
+    response = client.get(f'/api/goals/{goal.id}/progress')
+    assert response.status_code == 200
+    assert response.get_json()['progress']['matching_actions_count'] == 0
+    assert response.get_json()['matches'] == []
+
+    run = ActionStorageService(database=db).store_single_instance(
+        Action('Morning run', log_time=datetime(2025, 10, 3, 7, 30), measurement_units_by_amount={'km': 5.0}))
+
+    body = client.get(f'/api/goals/{goal.id}/progress').get_json()
+    assert body['progress']['total_progress'] == 5.0
+    assert body['progress']['matching_actions_count'] == 1
+    assert [(m['action_uuid'], m['contribution']) for m in body['matches']] == [(str(run.uuid_id), 5.0)]
+    assert set(body['matches'][0]) >= {'action_id', 'action_description', 'contribution',
+                                       'assignment_method', 'confidence'}
+
+
+def test_goal_progress_unknown_goal(client):
+    """Unknown goal ids are a 404"""
+    assert client.get('/api/goals/999/progress').status_code == 404
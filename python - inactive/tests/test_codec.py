@@ -0,0 +1,60 @@
+"""
+Tests for the pluggable JSON codec (rhetorica.codec).
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from rhetorica import codec
+
+
+@pytest.fixture(params=codec.AVAILABLE_BACKENDS)
+def backend(request):
+    """Run a test once per installed backend, restoring the active one afterwards"""
+    previous = codec.backend
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+def test_roundtrip_matches_stdlib(backend):
+    """Every backend decodes to what the stdlib would produce"""
+    term_goals_by_id = {'3f1c': {'title': 'Run 120km', 'progress': 0.4, 'tags': ['ü', None]}}
+
+    encoded = codec.dumps(term_goals_by_id)
+
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == term_goals_by_id
+    assert codec.loads(encoded) == term_goals_by_id
+    assert codec.loads(encoded.encode('utf-8')) == term_goals_by_id
+
+
+def test_unsupported_values_fall_back_to_stdlib(backend):
+    """default= handles datetimes; ints and keys the fast backends reject still encode"""
+    record = {'log_time': datetime(2025, 10, 1, 8, 0), 'big': 2 ** 70, 1: 'int key'}
+
+    decoded = json.loads(codec.dumps(record, default=str))
+
+    assert decoded == {'log_time': '2025-10-01 08:00:00', 'big': 2 ** 70, '1': 'int key'}
+    assert list(json.loads(codec.dumps({'b': 1, 'a': 2}, sort_keys=True))) == ['a', 'b']
+
+
+def test_invalid_json_raises_stdlib_error(backend):
+    """Malformed input raises json.JSONDecodeError whichever backend is active"""
+    with pytest.raises(codec.JSONDecodeError):
+        codec.loads('{not json')
+    with pytest.raises(TypeError):
+        codec.dumps({'obj': object()})
+
+
+def test_set_backend_validates_name():
+    """Unknown names are rejected; 'auto' picks an installed backend"""
+    previous = codec.backend
+    try:
+        assert codec.set_backend('auto') in codec.AVAILABLE_BACKENDS
+        with pytest.raises(ValueError):
+            codec.set_backend('yaml')
+    finally:
+        codec.set_backend(previous)
@@ -0,0 +1,361 @@
+"""
+Tests for the generic Database layer (politica).
+
+Covers connection pooling and transaction behaviour using plain dict records.
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from config.testing import SCHEMA_PATH
+from politica.database import Database
+from politica.filters import Between, In, IsNull, NotNull
+from politica.pragmas import resolve_pragmas
+
+
+def test_pool_reuses_connections(test_db):
+    """Sequential operations should borrow the same long-lived connection"""
+    db, _ = test_db
+
+    with db._get_connection() as first:
+        pass
+    with db._get_connection() as second:
+        pass
+
+    assert first is second
+
+
+def test_nested_connection_joins_outer_transaction(test_db):
+    """An error in the outer block rolls back work done in a nested block"""
+    db, _ = test_db
+
+    with pytest.raises(RuntimeError):
+        with db._get_connection() as outer:
+            db.insert('actions', [{'uuid_id': 'a-1', 'title': 'Nested', 'log_time': '2025-10-01T08:00:00'}])
+            with db._get_connection() as inner:
+                assert inner is outer
+            raise RuntimeError("abort outer transaction")
+
+    assert db.query('actions') == []
+
+
+def test_pool_serves_worker_threads(test_db):
+    """Worker threads can read and write through the shared pool"""
+    db, _ = test_db
+    errors = []
+
+    def worker(n):
+        try:
+            db.insert('actions', [{'uuid_id': f'w-{n}', 'title': f'Worker {n}', 'log_time': '2025-10-01T08:00:00'}])
+            db.query('actions')
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(db.query('actions')) == 8
+
+
+def test_pragma_profile_applied_to_pooled_connections(tmp_path):
+    """The 'server' profile puts the database in WAL mode with synchronous=NORMAL"""
+    db = Database(db_path=tmp_path / 'server.db', schema_dir=SCHEMA_PATH, pragma_profile='server')
+    try:
+        with db._get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    finally:
+        db.close()
+
+
+def test_unknown_pragma_profile_rejected():
+    """Profiles are validated before any connection is opened"""
+    with pytest.raises(ValueError):
+        resolve_pragmas('turbo')
+    with pytest.raises(ValueError):
+        resolve_pragmas('server', {'cache_size': '1; DROP TABLE actions'})
+
+
+def test_insert_plan_cached_until_invalidated(test_db):
+    """Schema columns are read once per table and dropped on invalidation"""
+    db, _ = test_db
+
+    db.insert('actions', [{'uuid_id': 'c-1', 'title': 'First', 'log_time': '2025-10-01T08:00:00'}])
+    assert 'actions' in db._insert_plans
+
+    # Schema change: the stale plan would silently ignore the new column
+    with db._get_connection() as conn:
+        conn.execute("ALTER TABLE actions ADD COLUMN source TEXT")
+    db.invalidate_schema_cache('actions')
+
+    db.insert('actions', [{'uuid_id': 'c-2', 'title': 'Second', 'log_time': '2025-10-01T09:00:00',
+                           'source': 'import'}])
+    assert db.query('actions', filters={'uuid_id': 'c-2'})[0]['source'] == 'import'
+
+
+def test_insert_many_chunks_in_one_transaction(test_db):
+    """Bulk insert writes every chunk, and a failing chunk rolls back the whole batch"""
+    db, _ = test_db
+
+    rows = ({'uuid_id': f'b-{n}', 'title': f'Bulk {n}', 'log_time': '2025-10-01T08:00:00'}
+            for n in range(23))
+    assert db.insert_many('actions', rows, chunk_size=5) == 23
+    assert len(db.query('actions')) == 23
+
+    # Duplicate primary key in the last chunk: nothing from this batch is kept
+    batch = [{'uuid_id': f'x-{n}', 'title': 'Dup', 'log_time': '2025-10-01T08:00:00'} for n in range(6)]
+    batch.append({'uuid_id': 'b-0', 'title': 'Dup', 'log_time': '2025-10-01T08:00:00'})
+    with pytest.raises(sqlite3.IntegrityError):
+        db.insert_many('actions', batch, chunk_size=3)
+    assert len(db.query('actions')) == 23
+
+    with pytest.raises(ValueError):
+        db.insert_many('actions', [])
+
+
+def test_insert_many_skips_conflicts(test_db):
+    """With conflict_target, duplicates of a UNIQUE key are skipped, not fatal"""
+    db, _ = test_db
+    row = {'action_id': 'a-1', 'goal_id': 'g-1', 'contribution': 1.0, 'match_method': 'manual'}
+    db.insert_many('action_goal_progress', [{**row, 'uuid_id': 'p-1'}])
+
+    inserted = db.insert_many('action_goal_progress',
+                              [{**row, 'uuid_id': 'p-2', 'contribution': 9.0},
+                               {**row, 'uuid_id': 'p-3', 'goal_id': 'g-2'}],
+                              conflict_target=['action_id', 'goal_id'])
+
+    assert inserted == 1
+    assert sorted((r['uuid_id'], r['contribution']) for r in db.query('action_goal_progress')) == \
+        [('p-1', 1.0), ('p-3', 1.0)]
+
+
+def test_transaction_groups_calls(test_db):
+    """Calls inside transaction() commit or roll back together"""
+    db, _ = test_db
+    action = {'title': 'Grouped', 'log_time': '2025-10-01T08:00:00'}
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_many('actions', [{**action, 'uuid_id': 'a-1'}])
+            db.update_by_uuid('actions', 'a-1', {'title': 'Renamed'})
+            raise RuntimeError("abort")
+    assert db.query('actions') == []
+
+    with db.transaction():
+        db.insert_many('actions', [{**action, 'uuid_id': 'a-1'}])
+        db.insert_many('actions', [{**action, 'uuid_id': 'a-2'}])
+    assert len(db.query('actions')) == 2
+
+
+def _seed_progress_rows(db, count):
+    db.insert_many('action_goal_progress', [
+        {'uuid_id': f'p-{n}', 'action_id': f'a-{n}', 'goal_id': 'g-1', 'contribution': 1.5,
+         'match_method': 'auto_inferred', 'confidence': 0.9}
+        for n in range(count)
+    ])
+
+
+def test_archive_and_delete_batches_archive_rows(test_db):
+    """Python-side archiving writes one archive row per deleted record"""
+    db, _ = test_db
+    _seed_progress_rows(db, 12)
+
+    result = db.archive_and_delete('action_goal_progress', {'goal_id': 'g-1'}, confirm=True)
+
+    assert result['count'] == 12
+    assert db.query('action_goal_progress') == []
+    archived = db.query('archive', filters={'source_table': 'action_goal_progress'})
+    assert len(archived) == 12
+    assert json.loads(archived[0]['record_data'])['goal_id'] == 'g-1'
+
+
+def test_archive_and_delete_in_database(test_db):
+    """In-database archiving never returns rows but archives every one of them"""
+    db, _ = test_db
+    _seed_progress_rows(db, 12)
+
+    preview = db.archive_and_delete('action_goal_progress', {'goal_id': 'g-1'}, in_database=True)
+    assert preview['count'] == 12 and preview['deleted'] is False
+    assert len(db.query('action_goal_progress')) == 12
+
+    result = db.archive_and_delete('action_goal_progress', {'goal_id': 'g-1'},
+                                   reason='invalidated_cache', confirm=True, in_database=True)
+
+    assert result == {'count': 12, 'records': [], 'deleted': True, 'archived': True}
+    assert db.query('action_goal_progress') == []
+    archived = db.query('archive', filters={'reason': 'invalidated_cache'})
+    assert len(archived) == 12
+    record = json.loads(archived[0]['record_data'])
+    assert record['goal_id'] == 'g-1'
+    assert record['contribution'] == 1.5
+
+
+def test_update_by_uuid_archives_and_updates_atomically(test_db):
+    """Old version is archived and the update applied in the same transaction"""
+    db, _ = test_db
+    db.insert('actions', [{'uuid_id': 'u-1', 'title': 'Before', 'log_time': '2025-10-01T08:00:00'}])
+
+    result = db.update_by_uuid('actions', 'u-1', {'title': 'After'}, notes='edited')
+
+    assert result == {'uuid_id': 'u-1', 'archived': True, 'updated': True}
+    assert db.query('actions', filters={'uuid_id': 'u-1'})[0]['title'] == 'After'
+    archived = db.query('archive', filters={'source_table': 'actions'})
+    assert len(archived) == 1
+    assert json.loads(archived[0]['record_data'])['title'] == 'Before'
+    assert archived[0]['notes'] == 'edited'
+
+
+def test_update_by_uuid_missing_record_leaves_no_archive(test_db):
+    """Updating an unknown UUID raises and writes nothing"""
+    db, _ = test_db
+
+    with pytest.raises(ValueError):
+        db.update_by_uuid('actions', 'missing', {'title': 'After'})
+    with pytest.raises(ValueError):
+        db.update_by_uuid('actions', 'missing', {'title': 'After'}, archive_old=False)
+
+    assert db.query('archive') == []
+
+
+
+def test_iter_query_streams_in_batches(tmp_path):
+    """Streaming returns the same rows as query() and, under WAL, doesn't block writers"""
+    db = Database(db_path=tmp_path / 'stream.db', schema_dir=SCHEMA_PATH, pragma_profile='server')
+    try:
+        db.insert_many('actions', [
+            {'uuid_id': f's-{n:02d}', 'title': f'Stream {n}', 'log_time': '2025-10-01T08:00:00'}
+            for n in range(11)
+        ])
+
+        stream = db.iter_query('actions', order_by='uuid_id', batch_size=4)
+        first = next(stream)
+        assert first['uuid_id'] == 's-00'
+
+        # A write on the same thread while the stream is open commits on its own connection
+        db.insert('actions', [{'uuid_id': 'z-late', 'title': 'Late', 'log_time': '2025-10-02T08:00:00'}])
+
+        rest = list(stream)
+        assert [first] + rest == db.query('actions', order_by='uuid_id')[:11]
+        assert isinstance(next(db.iter_query('actions', as_dicts=False)), sqlite3.Row)
+    finally:
+        db.close()
+
+
+def _seed_dated_actions(db):
+    db.insert_many('actions', [
+        {'uuid_id': f'd-{day:02d}', 'title': f'Day {day}', 'log_time': f'2025-10-{day:02d}T08:00:00',
+         'duration_minutes': 30.0 if day % 2 else None}
+        for day in range(1, 11)
+    ])
+
+
+def test_query_condition_filters(test_db):
+    """Range, IN-list and NULL conditions are evaluated by SQLite"""
+    db, _ = test_db
+    _seed_dated_actions(db)
+
+    in_range = db.query('actions', filters={'log_time': Between('2025-10-03', '2025-10-05T23:59')})
+    assert sorted(r['uuid_id'] for r in in_range) == ['d-03', 'd-04', 'd-05']
+
+    picked = db.query('actions', filters={'uuid_id': In(['d-01', 'd-07', 'missing'])})
+    assert sorted(r['uuid_id'] for r in picked) == ['d-01', 'd-07']
+    assert db.query('actions', filters={'uuid_id': In([])}) == []
+
+    assert len(db.query('actions', filters={'duration_minutes': IsNull()})) == 5
+    assert len(db.query('actions', filters={'duration_minutes': NotNull(),
+                                            'log_time': Between(low='2025-10-06')})) == 2
+
+
+def test_query_projection_limit_and_keyset(test_db):
+    """Column projection, LIMIT/OFFSET and keyset cursors page through the same order"""
+    db, _ = test_db
+    _seed_dated_actions(db)
+
+    page = db.query('actions', columns=['uuid_id', 'log_time'], order_by='log_time', limit=3)
+    assert page[0] == {'uuid_id': 'd-01', 'log_time': '2025-10-01T08:00:00'}
+
+    by_offset = db.query('actions', columns=['uuid_id'], order_by='log_time', limit=3, offset=3)
+    by_cursor = db.query('actions', columns=['uuid_id'], order_by='log_time, uuid_id', limit=3,
+                         after={'log_time': page[-1]['log_time'], 'uuid_id': page[-1]['uuid_id']})
+    assert by_offset == by_cursor == [{'uuid_id': 'd-04'}, {'uuid_id': 'd-05'}, {'uuid_id': 'd-06'}]
+
+
+def test_query_rejects_unsafe_identifiers(test_db):
+    """Names that can't be bound as parameters are validated before any SQL runs"""
+    db, _ = test_db
+
+    with pytest.raises(ValueError):
+        db.query('actions', filters={'title = title OR 1': 'x'})
+    with pytest.raises(ValueError):
+        db.query('actions', order_by='log_time; DROP TABLE actions')
+    with pytest.raises(ValueError):
+        db.query('actions', columns=['*'])
+    with pytest.raises(ValueError):
+        db.query('actions', limit=-1)
+
+
+
+def _query_plan(conn, sql, values):
+    return ' '.join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", values))
+
+
+def _create_legacy_database(db_path, rows_sql=''):
+    """A database created from the schema files before the time indexes existed"""
+    conn = sqlite3.connect(db_path)
+    for schema_file in sorted(SCHEMA_PATH.glob('*.sql')):
+        conn.executescript(schema_file.read_text())
+    conn.executescript(f"""
+        DROP INDEX idx_actions_log_time;
+        DROP INDEX idx_goals_start_date;
+        DROP INDEX idx_goals_target_date;
+        {rows_sql}
+    """)
+    conn.close()
+
+
+def test_time_range_queries_use_indexes(tmp_path):
+    """Period filters scan the table before the upgrade and seek an index after it"""
+    db_path = tmp_path / 'legacy.db'
+    _create_legacy_database(db_path)
+    action_sql = "SELECT * FROM actions WHERE log_time BETWEEN ? AND ?"
+    goal_sql = "SELECT * FROM goals WHERE start_date <= ? AND target_date >= ?"
+    action_range, goal_range = ['2025-10-03', '2025-10-05'], ['2025-12-01', '2025-10-01']
+
+    conn = sqlite3.connect(db_path)
+    assert 'SCAN actions' in _query_plan(conn, action_sql, action_range)
+    assert 'SCAN goals' in _query_plan(conn, goal_sql, goal_range)
+    conn.close()
+
+    db = Database(db_path=db_path, schema_dir=SCHEMA_PATH, pragma_profile='test')
+    try:
+        sql, values = db._build_select('actions', {'log_time': Between(*action_range)})
+        with db._get_connection() as conn:
+            assert 'USING INDEX idx_actions_log_time' in _query_plan(conn, sql, values)
+            assert 'USING INDEX idx_goals_' in _query_plan(conn, goal_sql, goal_range)
+    finally:
+        db.close()
+
+
+def test_existing_database_timestamps_canonicalized(tmp_path):
+    """Opening an older database rewrites non-canonical timestamps to isoformat()"""
+    db_path = tmp_path / 'legacy.db'
+    _create_legacy_database(db_path, """
+        INSERT INTO actions (uuid_id, title, log_time) VALUES
+            ('l-1', 'Spaced', '2025-10-01 08:00'),
+            ('l-2', 'Date only', '2025-10-02'),
+            ('l-3', 'Canonical', '2025-10-03T08:00:00');
+    """)
+
+    db = Database(db_path=db_path, schema_dir=SCHEMA_PATH, pragma_profile='test')
+    try:
+        times = [r['log_time'] for r in db.query('actions', order_by='log_time')]
+        assert times == ['2025-10-01T08:00:00', '2025-10-02T00:00:00', '2025-10-03T08:00:00']
+    finally:
+        db.close()
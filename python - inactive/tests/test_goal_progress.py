@@ -0,0 +1,140 @@
+"""
+Tests for the materialized goal_progress table (politica.goal_progress).
+
+Whatever happens to action_goal_progress, each goal_progress row must equal
+SUM/COUNT/MAX recomputed from scratch.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from categoriae.actions import Action
+from categoriae.goals import Goal
+from ethica.progress_aggregation import progress_from_totals
+from rhetorica.progress_storage import ActionGoalProgressStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+
+
+def _expected(db):
+    """goal_id → (total, count, last log_time) recomputed with plain SQL"""
+    with db._get_connection() as conn:
+        rows = conn.execute("""
+            SELECT p.goal_id, SUM(p.contribution), COUNT(*), MAX(a.log_time)
+            FROM action_goal_progress p JOIN actions a ON a.uuid_id = p.action_id
+            GROUP BY p.goal_id
+        """).fetchall()
+    return {row[0]: (pytest.approx(row[1]), row[2], row[3]) for row in rows}
+
+
+def _materialized(db):
+    return {r['goal_id']: (r['total'], r['match_count'], r['last_contribution_at'])
+            for r in db.query('goal_progress') if r['match_count']}
+
+
+def test_totals_follow_every_write(test_db):
+    """Inserts, confirms, edits, removals and invalidations keep totals exact"""
+    db, _ = test_db
+    rng = random.Random(7)
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+
+    goal_list = [goals.store_single_instance(Goal(title=f'Goal {n}', measurement_target=50.0))
+                 for n in range(3)]
+    action_list = [actions.store_single_instance(
+        Action(f'Action {n}', log_time=datetime(2025, 10, 1) + timedelta(hours=rng.randint(0, 500))))
+        for n in range(12)]
+
+    for action in action_list:
+        for goal in rng.sample(goal_list, rng.randint(1, 3)):
+            progress.create_manual_match(action.uuid_id, goal.uuid_id, rng.choice([1.5, 2.0, 7.25]))
+    assert _materialized(db) == _expected(db)
+
+    # Turn some into auto-inferred, confirm one, remove others
+    rows = db.query('action_goal_progress')
+    for row in rows[:8]:
+        db.update_by_uuid('action_goal_progress', row['uuid_id'],
+                          {'match_method': 'auto_inferred', 'contribution': 3.0})
+    progress.confirm_auto_match(rows[0]['action_id'], rows[0]['goal_id'])
+    for row in rows[-5:]:
+        progress.remove_match(row['action_id'], row['goal_id'])
+    assert _materialized(db) == _expected(db)
+
+    # Moving the latest action earlier changes last_contribution_at
+    latest = max(action_list, key=lambda a: a.log_time)
+    db.update_by_uuid('actions', str(latest.uuid_id), {'log_time': '2025-09-01T00:00:00'})
+    assert _materialized(db) == _expected(db)
+
+    progress.invalidate_auto_inferred()
+    assert _materialized(db) == _expected(db)
+
+
+def test_goal_totals_and_progress(test_db):
+    """get_goal_totals is a row lookup; goals without matches read as zero"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    goal = goals.store_single_instance(Goal(title='Run 10km', measurement_target=10.0, measurement_unit='km'))
+    idle = goals.store_single_instance(Goal(title='Idle'))
+    run = actions.store_single_instance(Action('Run', log_time=datetime(2025, 10, 3, 7, 30)))
+    progress.create_manual_match(run.uuid_id, goal.uuid_id, 4.0)
+
+    totals = progress.get_goal_totals(goal.uuid_id)
+    metrics = progress_from_totals(goal, totals.total, totals.match_count, totals.last_contribution_at)
+
+    assert (totals.total, totals.match_count) == (4.0, 1)
+    assert totals.last_contribution_at == datetime(2025, 10, 3, 7, 30)
+    assert (metrics.percent, metrics.matching_actions_count, metrics.remaining) == (40.0, 1, 6.0)
+    assert progress.get_goal_totals(idle.uuid_id).match_count == 0
+
+    goals.delete_by_uuid(goal.uuid_id)
+    assert db.query('goal_progress', filters={'goal_id': str(goal.uuid_id)}) == []
+
+
+def test_rebuild_matches_triggers(test_db):
+    """rebuild_goal_progress() reproduces the trigger-maintained rows"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    goal = goals.store_single_instance(Goal(title='Read'))
+    for n in range(4):
+        action = actions.store_single_instance(Action(f'Read {n}', log_time=datetime(2025, 10, 1 + n)))
+        progress.create_manual_match(action.uuid_id, goal.uuid_id, 0.1)
+
+    before = _materialized(db)
+    assert db.rebuild_goal_progress() == 1
+    assert _materialized(db) == {key: (pytest.approx(t), c, last) for key, (t, c, last) in before.items()}
+
+
+def test_deleting_actions_and_goals_removes_their_matches(test_db):
+    """Deleted actions and goals take their relationship rows (and totals) with them"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    run, walk = (goals.store_single_instance(Goal(title=title)) for title in ('Run', 'Walk'))
+    action_list = [actions.store_single_instance(Action(f'Move {n}', log_time=datetime(2025, 10, 1 + n)))
+                   for n in range(4)]
+    for action in action_list:
+        progress.create_manual_match(action.uuid_id, run.uuid_id, 2.0)
+        progress.create_manual_match(action.uuid_id, walk.uuid_id, 1.0)
+
+    # The latest action goes: totals shrink and last_contribution_at falls back
+    actions.delete_by_uuid(action_list[-1].uuid_id)
+    assert db.query('action_goal_progress', filters={'action_id': str(action_list[-1].uuid_id)}) == []
+    assert _materialized(db) == _expected(db)
+    assert _materialized(db)[str(run.uuid_id)] == (6.0, 3, action_list[2].log_time.isoformat())
+
+    goals.delete_by_uuid(walk.uuid_id)
+    assert db.query('action_goal_progress', filters={'goal_id': str(walk.uuid_id)}) == []
+    assert _materialized(db) == _expected(db)
+
+    # Later deletes only touch the remaining goal
+    actions.delete_by_uuid(action_list[0].uuid_id)
+    assert _materialized(db) == _expected(db)
+    assert db.rebuild_goal_progress() == 1
+    assert _materialized(db) == _expected(db)
@@ -6,7 +6,7 @@ This is the essential roundtrip test for the Swift port reference.
 """
 
 from datetime import datetime, timedelta
-from categoriae.goals import Goal
+from categoriae.goals import Goal, Milestone, SmartGoal
 from rhetorica.storage_service import GoalStorageService
 
 
@@ -42,4 +42,25 @@ def test_goal_roundtrip(test_db):
     assert retrieved.how_goal_is_relevant == original_goal.how_goal_is_relevant
     # ID should be assigned
     assert retrieved.id is not None
-    assert isinstance(retrieved.id, int)
\ No newline at end of file
+    assert isinstance(retrieved.id, int)
+
+def test_get_all_mixed_goal_types_keep_order(test_db):
+    """Batch decoding groups rows by goal_type but returns them in table order"""
+    db, _ = test_db
+    start = datetime.now() + timedelta(days=1)
+    goals = [
+        Goal(title="Loose goal"),
+        Milestone(title="Halfway", target_date=start + timedelta(days=35)),
+        SmartGoal(title="Run 120km", measurement_unit="km", measurement_target=120.0,
+                  start_date=start, target_date=start + timedelta(days=70),
+                  how_goal_is_relevant="Health", how_goal_is_actionable="Run 3x a week"),
+        Goal(title="Another loose goal"),
+    ]
+
+    service = GoalStorageService(database=db)
+    for goal in goals:
+        service.store_single_instance(goal)
+
+    retrieved = service.get_all()
+    assert [type(g) for g in retrieved] == [Goal, Milestone, SmartGoal, Goal]
+    assert [g.title for g in retrieved] == [g.title for g in goals]
@@ -0,0 +1,156 @@
+"""
+Tests for change tracking and incremental action-goal inference.
+
+After any sequence of edits, infer_incremental() must leave the same
+auto-inferred rows as re-inferring everything from scratch.
+"""
+
+import json
+from datetime import datetime
+
+from categoriae.actions import Action
+from categoriae.goals import SmartGoal
+from categoriae.relationships import ActionGoalRelationship
+from ethica.inference_service import ActionGoalInferenceService
+from ethica.progress_matching import infer_matches
+from rhetorica.progress_storage import ActionGoalProgressStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+
+
+def _services(db):
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    return actions, goals, progress, ActionGoalInferenceService(actions, goals, progress)
+
+
+def _goal(title, keywords, start_day=1, end_day=31):
+    return SmartGoal(
+        title=title, measurement_unit='km', measurement_target=100.0,
+        start_date=datetime(2025, 10, start_day), target_date=datetime(2025, 10, end_day, 23, 59),
+        how_goal_is_relevant='Health',
+        how_goal_is_actionable=json.dumps({'units': ['km'], 'keywords': keywords}),
+    )
+
+
+def _stored(db):
+    return sorted((r['action_id'], r['goal_id'], r['contribution'])
+                  for r in db.query('action_goal_progress'))
+
+
+def _from_scratch(actions, goals):
+    return sorted((str(m.action.uuid_id), str(m.goal.uuid_id), m.contribution)
+                  for m in infer_matches(actions.get_all(), goals.get_all()))
+
+
+def test_triggers_log_only_matching_relevant_changes(test_db):
+    """Inserts/deletes always logged; updates only when a tracked column changes"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    action = actions.store_single_instance(Action('Run', log_time=datetime(2025, 10, 2)))
+
+    db.update_by_uuid('actions', str(action.uuid_id), {'notes': 'felt good'})
+    db.update_by_uuid('actions', str(action.uuid_id), {'title': 'Trail run'})
+    actions.delete_by_uuid(action.uuid_id)
+
+    through, changes = db.get_changes(0)
+    assert [c['operation'] for c in changes] == ['insert', 'update', 'delete']
+    assert {c['row_uuid'] for c in changes} == {str(action.uuid_id)}
+    assert through == changes[-1]['seq']
+
+
+def test_watermark_and_pruning(test_db):
+    """Consumers read after their watermark; rows every consumer has seen are pruned"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    actions.store_single_instance(Action('One', log_time=datetime(2025, 10, 2)))
+    first, _ = db.get_changes(0)
+    db.set_change_watermark('a', first)
+    db.set_change_watermark('b', 0)
+    actions.store_single_instance(Action('Two', log_time=datetime(2025, 10, 3)))
+
+    assert db.get_change_watermark('a') == first
+    assert db.get_change_watermark('never-ran') is None
+    assert [c['seq'] for c in db.get_changes(first)[1]] == [first + 1]
+
+    assert db.prune_change_log() == 0  # 'b' hasn't seen anything yet
+    db.set_change_watermark('b', first)
+    assert db.prune_change_log() == 1
+    assert [c['seq'] for c in db.get_changes(0)[1]] == [first + 1]
+
+
+def test_incremental_inference_matches_full_recompute(test_db):
+    """Each run processes only the delta and ends in the from-scratch state"""
+    db, _ = test_db
+    actions, goals, progress, inference = _services(db)
+    run_goal = goals.store_single_instance(_goal('Run 100km', ['run']))
+    goals.store_single_instance(_goal('Bike 100km', ['bike'], start_day=15))
+    morning = actions.store_single_instance(
+        Action('Morning run', log_time=datetime(2025, 10, 5), measurement_units_by_amount={'km': 5.0}))
+    actions.store_single_instance(
+        Action('Bike to work', log_time=datetime(2025, 10, 20), measurement_units_by_amount={'km': 12.0}))
+
+    first = inference.infer_incremental()
+    assert first.full_rebuild and first.relationships_stored == 2
+    assert _stored(db) == _from_scratch(actions, goals)
+
+    # Nothing changed: nothing re-matched
+    idle = inference.infer_incremental()
+    assert (idle.actions_rematched, idle.goals_rematched, idle.relationships_stored) == (0, 0, 0)
+
+    # New action and an edited one
+    actions.store_single_instance(
+        Action('Evening run', log_time=datetime(2025, 10, 16), measurement_units_by_amount={'km': 7.0}))
+    morning.measurement_units_by_amount = {'km': 6.5}
+    actions.save(morning)
+    delta = inference.infer_incremental()
+    assert (delta.actions_rematched, delta.goals_rematched) == (2, 0)
+    assert _stored(db) == _from_scratch(actions, goals)
+
+    # Goal hints change: its window is re-matched
+    run_goal.how_goal_is_actionable = json.dumps({'units': ['km'], 'keywords': ['bike']})
+    goals.save(run_goal)
+    delta = inference.infer_incremental()
+    assert (delta.actions_rematched, delta.goals_rematched) == (0, 1)
+    assert _stored(db) == _from_scratch(actions, goals)
+
+    # Deleted action: its matches go
+    actions.delete_by_uuid(morning.uuid_id)
+    inference.infer_incremental()
+    assert _stored(db) == _from_scratch(actions, goals)
+
+
+def test_incremental_inference_keeps_manual_matches(test_db):
+    """Re-matching a changed action leaves user decisions alone"""
+    db, _ = test_db
+    actions, goals, progress, inference = _services(db)
+    goal = goals.store_single_instance(_goal('Run 100km', ['run']))
+    run = actions.store_single_instance(
+        Action('Run', log_time=datetime(2025, 10, 5), measurement_units_by_amount={'km': 3.0}))
+    inference.infer_incremental()
+
+    progress.create_manual_match(run.uuid_id, goal.uuid_id, 4.0)
+    run.title = 'Long run'
+    actions.save(run)
+    inference.infer_incremental()
+
+    assert [(r.assignment_method, r.contribution)
+            for r in progress.get_relationships(goal_id=goal.uuid_id)] == [('manual', 4.0)]
+
+
+def test_progress_storage_uses_uuids(test_db):
+    """Relationships are stored, read back and confirmed by uuid_id"""
+    db, _ = test_db
+    actions, goals, progress, _ = _services(db)
+    goal = goals.store_single_instance(_goal('Run 100km', ['run']))
+    action = actions.store_single_instance(
+        Action('Run', log_time=datetime(2025, 10, 5), measurement_units_by_amount={'km': 5.0}))
+
+    stored = progress.store_relationships([ActionGoalRelationship(
+        action=action, goal=goal, contribution=5.0, assignment_method='auto_inferred', confidence=0.9)])
+    progress.confirm_auto_match(action.uuid_id, goal.uuid_id)
+
+    [relationship] = progress.get_relationships(action_id=action.uuid_id)
+    assert stored == 1
+    assert relationship.goal.uuid_id == goal.uuid_id
+    assert relationship.assignment_method == 'user_confirmed'
@@ -0,0 +1,60 @@
+"""
+Tests for the Aho–Corasick keyword matcher (ethica.keyword_automaton).
+"""
+
+import json
+import random
+
+from categoriae.goals import Goal
+from ethica.keyword_automaton import KeywordAutomaton
+from ethica.matching_engine import SubstringKeywordMatcher, build_keyword_matcher
+from ethica.progress_matching import build_goal_keyword_matcher
+
+
+def test_overlapping_keywords_all_reported():
+    """Keywords that overlap or are suffixes of each other are all found"""
+    automaton = KeywordAutomaton({'he': {0}, 'she': {1}, 'his': {2}, 'hers': {3}})
+
+    assert automaton.matches('ushers') == {0, 1, 3}
+    assert automaton.matches('this') == {2}
+    assert automaton.matches('xyz') == set()
+
+
+def test_empty_keyword_matches_everything():
+    """'' occurs in every text, like the substring rule"""
+    automaton = KeywordAutomaton({'': {0}, 'run': {1}})
+
+    assert automaton.matches('') == {0}
+    assert automaton.matches('run') == {0, 1}
+
+
+def test_agrees_with_substring_scans():
+    """Random keyword sets over a small alphabet: same hits as `keyword in text`"""
+    rng = random.Random(3)
+    for _ in range(2000):
+        patterns = {''.join(rng.choice('abc') for _ in range(rng.randint(0, 4))): {n}
+                    for n in range(rng.randint(0, 8))}
+        text = ''.join(rng.choice('abcd') for _ in range(rng.randint(0, 15)))
+
+        assert KeywordAutomaton(patterns).matches(text) == SubstringKeywordMatcher(patterns).matches(text)
+
+
+def test_build_keyword_matcher_switches_on_size():
+    """Few patterns use substring scans, many use the automaton"""
+    assert isinstance(build_keyword_matcher({'run': {0}}), SubstringKeywordMatcher)
+    assert isinstance(build_keyword_matcher({f'kw{n}': {n} for n in range(100)}), KeywordAutomaton)
+
+
+def test_goal_keyword_matcher_returns_goals_in_one_pass():
+    """One scan of a title returns every goal whose keywords hit"""
+    goals = [
+        Goal(title='Run', how_goal_is_actionable=json.dumps({'units': ['km'], 'keywords': ['run', 'jog']})),
+        Goal(title='Yoga', how_goal_is_actionable=json.dumps({'units': ['minutes'], 'keywords': ['yoga']})),
+        Goal(title='No hints', measurement_unit='km'),
+        Goal(title='Trail', how_goal_is_actionable=json.dumps({'units': ['km'], 'keywords': ['trail*']})),
+    ]
+
+    matcher = build_goal_keyword_matcher(goals)
+
+    assert matcher.matches('trail run then yoga') == {0, 1, 3}
+    assert matcher.matches('swim') == set()
@@ -0,0 +1,125 @@
+"""
+Tests for the indexed matching engine (ethica.matching_engine).
+
+Property tests: for many random goal/action sets, infer_matches() (indexed)
+must return exactly what infer_matches_pairwise() (every pair) returns.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from categoriae.actions import Action
+from categoriae.goals import Goal, Milestone, SmartGoal
+from ethica.keyword_automaton import KeywordAutomaton
+from ethica.matching_engine import MatchingEngine, PeriodIndex
+from ethica.progress_matching import infer_matches, infer_matches_pairwise
+
+BASE = datetime(2025, 10, 1)
+UNITS = ['km', 'KM', 'distance_km', 'minutes', 'Minutes', 'pages', 'reps', 'Hours Slept']
+KEYWORDS = ['run', 'Yoga', '*write*', '*', ' read ', 'stretch', 'ru']
+TITLES = ['Morning run', 'YOGA class', 'Wrote 3 pages', 'reading', 'Stretch + run', '', None]
+
+
+def _hints(rng):
+    kind = rng.random()
+    if kind < 0.1:
+        return None
+    if kind < 0.15:
+        return rng.choice(['not json', '[1, 2]', '{"units": [1]}', '{"units": ["km"]}', '{}'])
+    return json.dumps({
+        'units': rng.sample([u.lower() for u in UNITS] + ['KM ', 'Minutes'], rng.randint(0, 3)),
+        'keywords': rng.sample(KEYWORDS, rng.randint(0, 3)),
+    })
+
+
+def _random_goal(rng):
+    start = BASE + timedelta(days=rng.randint(0, 20))
+    end = start + timedelta(days=rng.randint(1, 20))
+    unit = rng.choice([None, '', 'km', 'Minutes', 'hours slept', 'page'])
+    kind = rng.random()
+    if kind < 0.4:
+        return SmartGoal(
+            title='Smart', measurement_unit=unit or 'km', measurement_target=rng.choice([10.0, 50.0]),
+            start_date=start, target_date=end, how_goal_is_relevant='Relevant',
+            how_goal_is_actionable=_hints(rng) or '{"units": ["km"], "keywords": ["run"]}',
+        )
+    if kind < 0.5:
+        return Milestone(title='Milestone', measurement_unit=unit, target_date=end,
+                         how_goal_is_actionable=_hints(rng))
+    return Goal(title='Goal', measurement_unit=unit,
+                start_date=start if rng.random() < 0.5 else None, target_date=end,
+                how_goal_is_actionable=_hints(rng))
+
+
+def _random_action(rng, boundaries):
+    measurements = {rng.choice(UNITS): rng.choice([None, 0.0, 2.5, 10.0])
+                    for _ in range(rng.randint(0, 3))}
+    if rng.random() < 0.3:
+        log_time = rng.choice(boundaries)  # exactly on a goal start/target
+    else:
+        log_time = BASE + timedelta(hours=rng.randint(-48, 24 * 45))
+    return Action(rng.choice(TITLES), log_time=log_time if rng.random() > 0.05 else None,
+                  measurement_units_by_amount=measurements or rng.choice([None, {}]))
+
+
+def _as_tuples(matches):
+    return [(id(m.action), id(m.goal), m.contribution, m.assignment_method, m.confidence)
+            for m in matches]
+
+
+@pytest.mark.parametrize('seed', range(40))
+@pytest.mark.parametrize('require_period_match', [True, False])
+def test_indexed_matches_equal_pairwise(seed, require_period_match):
+    """Same matches, contributions and order as checking every pair"""
+    rng = random.Random(seed)
+    goals = [_random_goal(rng) for _ in range(rng.randint(0, 12))]
+    boundaries = [d for g in goals for d in (g.start_date, g.target_date) if d] or [BASE]
+    actions = [_random_action(rng, boundaries) for _ in range(rng.randint(0, 60))]
+
+    expected = infer_matches_pairwise(actions, goals, require_period_match)
+
+    assert _as_tuples(infer_matches(actions, goals, require_period_match)) == _as_tuples(expected)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_automaton_engine_equals_pairwise(seed):
+    """The Aho–Corasick keyword matcher plugs into the engine without changing results"""
+    rng = random.Random(1000 + seed)
+    goals = [_random_goal(rng) for _ in range(rng.randint(0, 12))]
+    boundaries = [d for g in goals for d in (g.start_date, g.target_date) if d] or [BASE]
+    actions = [_random_action(rng, boundaries) for _ in range(rng.randint(0, 60))]
+
+    engine = MatchingEngine(goals, keyword_matcher=KeywordAutomaton)
+
+    assert _as_tuples(engine.infer(actions)) == _as_tuples(infer_matches_pairwise(actions, goals))
+
+
+def test_period_index_closed_intervals():
+    """Endpoints are inclusive; empty and inverted intervals behave"""
+    index = PeriodIndex([(0, 10, 20), (1, 20, 30), (2, 15, 15), (3, 40, 35)])
+
+    assert index.stab(5) == frozenset()
+    assert index.stab(10) == {0}
+    assert index.stab(15) == {0, 2}
+    assert index.stab(20) == {0, 1}
+    assert index.stab(25) == {1}
+    assert index.stab(37) == frozenset()
+    assert PeriodIndex([]).stab(1) == frozenset()
+
+
+def test_engine_only_checks_period_candidates():
+    """Goals outside the action's period are never candidates"""
+    goals = [
+        SmartGoal(title=f'Run {n}', measurement_unit='km', measurement_target=10.0,
+                  start_date=BASE + timedelta(days=10 * n), target_date=BASE + timedelta(days=10 * n + 9),
+                  how_goal_is_relevant='Health', how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}')
+        for n in range(5)
+    ]
+    engine = MatchingEngine(goals)
+    action = Action('Evening run', log_time=BASE + timedelta(days=23), measurement_units_by_amount={'km': 4.0})
+
+    assert engine.candidate_positions(action) == {2}
+    assert [m.goal for m in engine.match_action(action)] == [goals[2]]
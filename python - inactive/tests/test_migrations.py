@@ -0,0 +1,88 @@
+"""
+Tests for versioned schema migrations (politica.migrations).
+"""
+
+import sqlite3
+
+import pytest
+
+from config.testing import SCHEMA_PATH
+from politica.database import Database
+from politica.migrations import (
+    LATEST_VERSION, MIGRATIONS, Migration, get_schema_version, migrate, split_sql_statements,
+)
+
+
+def test_new_database_migrated_to_latest(tmp_path):
+    """A fresh database gets every step and records each version"""
+    db_path = tmp_path / 'fresh.db'
+
+    assert migrate(db_path, SCHEMA_PATH) == [m.version for m in MIGRATIONS]
+
+    conn = sqlite3.connect(db_path)
+    assert get_schema_version(conn) == LATEST_VERSION
+    assert conn.execute("SELECT COUNT(*) FROM actions").fetchone()[0] == 0
+    conn.close()
+
+
+def test_current_database_skips_schema_files(tmp_path):
+    """Once current, startup doesn't read the schema directory at all"""
+    db_path = tmp_path / 'current.db'
+    migrate(db_path, SCHEMA_PATH)
+
+    assert migrate(db_path, tmp_path / 'no-such-dir') == []
+    db = Database(db_path=db_path, schema_dir=tmp_path / 'no-such-dir', pragma_profile='test')
+    db.close()
+
+
+def test_existing_unversioned_database_is_upgraded(tmp_path):
+    """Databases created before schema_version replay the idempotent steps"""
+    db_path = tmp_path / 'legacy.db'
+    conn = sqlite3.connect(db_path)
+    conn.executescript((SCHEMA_PATH / 'actions.sql').read_text())
+    conn.execute("DROP INDEX idx_actions_log_time")
+    conn.execute("INSERT INTO actions (uuid_id, title, log_time) VALUES ('a-1', 'Kept', '2025-10-01 08:00')")
+    conn.commit()
+    conn.close()
+
+    assert migrate(db_path, SCHEMA_PATH) == [m.version for m in MIGRATIONS]
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT log_time FROM actions").fetchall() == [('2025-10-01T08:00:00',)]
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'idx_actions_log_time'").fetchone()
+    conn.close()
+
+
+def test_failed_migration_rolls_back(tmp_path):
+    """A failing step leaves neither its changes nor its version behind"""
+    db_path = tmp_path / 'failing.db'
+    migrate(db_path, SCHEMA_PATH)
+
+    def broken(conn, schema_dir):
+        conn.execute("CREATE TABLE half_done (x INTEGER)")
+        conn.execute("INSERT INTO no_such_table VALUES (1)")
+
+    steps = MIGRATIONS + [Migration(LATEST_VERSION + 1, 'broken', broken)]
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(db_path, SCHEMA_PATH, steps)
+
+    conn = sqlite3.connect(db_path)
+    assert get_schema_version(conn) == LATEST_VERSION
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+    conn.close()
+
+
+def test_split_sql_statements_keeps_trigger_bodies_whole():
+    """Semicolons inside trigger bodies and strings don't split statements"""
+    script = """
+        -- comment
+        CREATE TABLE t (x TEXT);
+        INSERT INTO t VALUES ('a;b');
+        CREATE TRIGGER tr AFTER INSERT ON t BEGIN
+            INSERT INTO t VALUES ('c');
+        END;
+    """
+    statements = list(split_sql_statements(script))
+
+    assert len(statements) == 3
+    assert 'END;' in statements[2]
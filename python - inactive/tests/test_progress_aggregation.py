@@ -8,14 +8,16 @@ Written by Claude Code on 2025-10-12
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from categoriae.actions import Action
-from categoriae.goals import Goal, SmartGoal
+from categoriae.goals import Goal, Milestone, SmartGoal
 from categoriae.relationships import ActionGoalRelationship
 from ethica.progress_aggregation import (
     aggregate_goal_progress,
     aggregate_all_goals,
     get_progress_summary,
+    group_matches_by_goal,
     GoalProgress
 )
 
@@ -274,6 +276,34 @@ def test_aggregate_all_goals_with_no_matches():
     assert progress_list[1].total_progress == 0.0  # No matches
 
 
+def test_aggregate_all_goals_matches_loaded_copies_by_uuid():
+    """Matches group by goal uuid_id, so an edited or reloaded copy still finds them."""
+    goal = Goal(title="Goal 1", measurement_unit="km", measurement_target=100.0)
+    action = Action("Run")
+    matches = [ActionGoalRelationship(action=action, goal=goal, contribution=30.0,
+                                      assignment_method="auto_inferred", confidence=0.9)]
+
+    reloaded = replace(goal, how_goal_is_relevant="Edited after matching")
+
+    assert list(group_matches_by_goal(matches)) == [goal.uuid_id]
+    assert aggregate_all_goals([reloaded], matches)[0].total_progress == 30.0
+
+
+def test_goal_hash_is_identity_based():
+    """Goal hashes stay stable when fields change; subclasses stay hashable."""
+    goal = Goal(title="Run 120km", measurement_unit="km")
+    by_goal = {goal: "progress"}
+
+    goal.title = "Run 150km"
+    goal.measurement_target = 150.0
+
+    assert by_goal[goal] == "progress"
+    assert hash(goal) == hash(goal.uuid_id)
+    milestone = Milestone(title="50km", target_date=datetime(2025, 5, 1))
+    assert hash(milestone) == hash(milestone.uuid_id)
+    assert SmartGoal.__hash__ is Goal.__hash__
+
+
 # ===== SUMMARY STATISTICS TESTS =====
 
 def test_get_progress_summary_empty():
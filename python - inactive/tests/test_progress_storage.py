@@ -0,0 +1,63 @@
+"""
+Tests for bulk relationship persistence (ActionGoalProgressStorageService.upsert_relationships).
+"""
+
+from datetime import datetime
+
+from categoriae.actions import Action
+from categoriae.goals import Goal
+from categoriae.relationships import ActionGoalRelationship
+from rhetorica.progress_storage import ActionGoalProgressStorageService, RelationshipOutcome
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+
+
+def _match(action, goal, contribution=2.0):
+    return ActionGoalRelationship(action=action, goal=goal, contribution=contribution,
+                                  assignment_method='auto_inferred', confidence=0.9)
+
+
+def test_upsert_reports_outcome_per_relationship(test_db):
+    """New, repeated, already-stored and unresolvable relationships each get their outcome"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    goal = goals.store_single_instance(Goal(title='Run'))
+    run, walk = (actions.store_single_instance(Action(title, log_time=datetime(2025, 10, 1)))
+                 for title in ('Run', 'Walk'))
+    progress.create_manual_match(walk.uuid_id, goal.uuid_id, 5.0)
+
+    outcomes = progress.upsert_relationships([
+        _match(run, goal),
+        _match(run, goal, 3.0),                    # Same pair twice in one batch
+        _match(walk, goal),                        # Manual match already stored
+        _match(Action('Never saved'), goal),
+        _match(run, Goal(title='Never saved')),
+    ])
+
+    assert outcomes == [
+        RelationshipOutcome.STORED,
+        RelationshipOutcome.ALREADY_STORED,
+        RelationshipOutcome.ALREADY_STORED,
+        RelationshipOutcome.ACTION_NOT_FOUND,
+        RelationshipOutcome.GOAL_NOT_FOUND,
+    ]
+    stored = {(r.action.title, r.assignment_method, r.contribution) for r in progress.get_relationships()}
+    assert stored == {('Run', 'auto_inferred', 2.0), ('Walk', 'manual', 5.0)}
+
+
+def test_upsert_resolves_rebuilt_entities_by_attributes(test_db):
+    """Entities not stored under their uuid_id are found by title and dates"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    stored_action = actions.store_single_instance(Action('Run', log_time=datetime(2025, 10, 1, 7)))
+    stored_goal = goals.store_single_instance(Goal(title='Run 10km'))
+
+    copy_action = Action('Run', log_time=datetime(2025, 10, 1, 7))
+    copy_goal = Goal(title='Run 10km')
+
+    assert progress.store_relationships([_match(copy_action, copy_goal)]) == 1
+    [row] = db.query('action_goal_progress')
+    assert (row['action_id'], row['goal_id']) == (str(stored_action.uuid_id), str(stored_goal.uuid_id))
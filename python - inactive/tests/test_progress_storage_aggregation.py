@@ -0,0 +1,94 @@
+"""
+Parity tests: SQL-backed aggregation in ActionGoalProgressStorageService
+against the pure-Python functions in ethica.progress_aggregation.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from categoriae.actions import Action
+from categoriae.goals import Goal, SmartGoal
+from categoriae.relationships import ActionGoalRelationship
+from ethica.progress_aggregation import aggregate_all_goals, get_progress_summary
+from rhetorica.progress_storage import ActionGoalProgressStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+
+
+def _metrics(progress):
+    return (progress.goal.uuid_id, pytest.approx(progress.total_progress), progress.target,
+            pytest.approx(progress.percent), progress.is_complete, progress.matching_actions_count)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_storage_aggregation_equals_python(test_db, seed):
+    """Same per-goal metrics and summary as aggregating the loaded relationships"""
+    db, _ = test_db
+    rng = random.Random(seed)
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+
+    goal_list = []
+    for n in range(rng.randint(1, 6)):
+        target = rng.choice([None, 0.0, 10.0, 25.0])
+        if rng.random() < 0.5:
+            goal = SmartGoal(title=f'Smart {n}', measurement_unit='km', measurement_target=target or 10.0,
+                             start_date=datetime(2025, 10, 1), target_date=datetime(2025, 10, 31),
+                             how_goal_is_relevant='Health', how_goal_is_actionable='{}')
+        else:
+            goal = Goal(title=f'Goal {n}', measurement_target=target)
+        goal_list.append(goals.store_single_instance(goal))
+
+    relationships = []
+    for n in range(rng.randint(0, 25)):
+        action = actions.store_single_instance(
+            Action(f'Action {n}', log_time=datetime(2025, 10, 1) + timedelta(days=rng.randint(0, 30))))
+        for goal in rng.sample(goal_list, rng.randint(0, len(goal_list))):
+            relationships.append(ActionGoalRelationship(
+                action=action, goal=goal, contribution=rng.choice([0.0, 1.5, 3.3, 12.0]),
+                assignment_method=rng.choice(['auto_inferred', 'manual']), confidence=0.9))
+    if relationships:
+        progress.store_relationships(relationships)
+
+    stored_matches = progress.get_relationships()
+    expected = aggregate_all_goals(goal_list, stored_matches)
+    actual = progress.aggregate_all_goals(goal_list)
+
+    assert [_metrics(p) for p in actual] == [_metrics(p) for p in expected]
+    assert progress.get_progress_summary(goal_list) == pytest.approx(get_progress_summary(expected))
+    assert ({p.goal.uuid_id for p in progress.aggregate_all_goals()}
+            == {g.uuid_id for g in goal_list})
+
+
+def test_storage_aggregation_loads_no_actions(test_db, monkeypatch):
+    """Only goals are loaded - action rows never leave SQLite"""
+    db, _ = test_db
+    actions = ActionStorageService(database=db)
+    goals = GoalStorageService(database=db)
+    progress = ActionGoalProgressStorageService(database=db)
+    goal = goals.store_single_instance(Goal(title='Run', measurement_target=10.0))
+    for n in range(3):
+        action = actions.store_single_instance(Action(f'Run {n}', log_time=datetime(2025, 10, 1 + n)))
+        progress.create_manual_match(action.uuid_id, goal.uuid_id, 4.0)
+
+    queried = []
+    original_query = db.query
+    monkeypatch.setattr(db, 'query', lambda table, *a, **k: queried.append(table) or original_query(table, *a, **k))
+
+    [result] = progress.aggregate_all_goals()
+
+    assert (result.total_progress, result.matching_actions_count, result.is_complete) == (12.0, 3, True)
+    assert 'actions' not in queried and 'action_goal_progress' not in queried
+
+
+def test_aggregate_rejects_unsafe_expressions(test_db):
+    """Aggregate functions and columns are validated before any SQL runs"""
+    db, _ = test_db
+
+    with pytest.raises(ValueError):
+        db.aggregate('action_goal_progress', {'x': ('DROP', 'contribution')})
+    with pytest.raises(ValueError):
+        db.aggregate('action_goal_progress', {'x': ('SUM', 'contribution); --')})
+    assert db.aggregate('action_goal_progress', {'n': ('COUNT', '*')}) == [{'n': 0}]
@@ -0,0 +1,120 @@
+"""
+Tests for entity serialization (rhetorica.serializers).
+"""
+
+import json
+import sqlite3
+import uuid
+from dataclasses import asdict
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from categoriae.actions import Action
+from categoriae.goals import SmartGoal
+from rhetorica.serializers import (
+    _decode_uuid, _get_deserialize_plan, deserialize, deserialize_many, serialize,
+)
+
+
+def test_deserialize_plan_compiled_once_per_class():
+    """The per-field plan is built on first use and reused afterwards"""
+    plan = _get_deserialize_plan(SmartGoal, True)
+    assert _get_deserialize_plan(SmartGoal, True) is plan
+    decoders = dict(plan)
+    assert decoders['target_date'] is not None   # Optional[datetime] → datetime decoder
+    assert decoders['title'] is None              # str kept as-is
+
+
+def test_action_roundtrip_through_plans():
+    """Optional[...] fields are unwrapped: UUID, datetime and JSON dicts are decoded"""
+    action = Action('Morning run')
+    action.measurement_units_by_amount = {'km': 5.0}
+    action.start_time = datetime(2025, 10, 1, 7, 30)
+
+    data = serialize(action, include_type=False, json_encode=True)
+    assert json.loads(data['measurement_units_by_amount']) == {'km': 5.0}
+    assert data['start_time'] == '2025-10-01T07:30:00'
+
+    restored = deserialize(data, Action, json_decode=True)
+    assert isinstance(restored.uuid_id, UUID)
+    assert restored.start_time == action.start_time
+    assert restored.measurement_units_by_amount == {'km': 5.0}
+
+
+def test_deserialize_keeps_invalid_json_and_skips_decoding_without_flag():
+    """Malformed JSON stays a string; json_decode=False leaves JSON text untouched"""
+    data = serialize(Action('Broken'), include_type=False, json_encode=True)
+    data['measurement_units_by_amount'] = '{not json'
+    assert deserialize(data, Action, json_decode=True).measurement_units_by_amount == '{not json'
+
+    data['measurement_units_by_amount'] = '{"km": 1.0}'
+    assert deserialize(data, Action).measurement_units_by_amount == '{"km": 1.0}'
+
+
+def _stored_action(title, units=None):
+    action = Action(title)
+    action.measurement_units_by_amount = units
+    return serialize(action, include_type=False, json_encode=True)
+
+
+def test_deserialize_many_matches_per_row_deserialize():
+    """Column-wise decoding gives the same entities, even when rows differ in shape"""
+    rows = [_stored_action('Run', {'km': 5.0}), _stored_action('Rest'), _stored_action('Broken')]
+    rows[2]['measurement_units_by_amount'] = '{not json'
+    del rows[1]['notes']          # missing column → dataclass default
+    rows[0]['unknown'] = 'ignored'
+
+    batch = deserialize_many(rows, Action, json_decode=True)
+    assert [asdict(a) for a in batch] == [asdict(deserialize(r, Action, json_decode=True)) for r in rows]
+    assert deserialize_many([], Action) == []
+
+
+def test_deserialize_many_shares_json_keys_and_reads_sqlite_rows():
+    """Decoded JSON objects share key strings; sqlite3.Row input works like dicts"""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE actions (uuid_id TEXT, title TEXT, log_time TEXT, measurement_units_by_amount TEXT)")
+    rows = [_stored_action(f'Run {n}', {'km': float(n)}) for n in range(3)]
+    conn.executemany("INSERT INTO actions VALUES (:uuid_id, :title, :log_time, :measurement_units_by_amount)", rows)
+
+    actions = deserialize_many(conn.execute("SELECT * FROM actions"), Action, json_decode=True)
+
+    assert [a.measurement_units_by_amount for a in actions] == [{'km': 0.0}, {'km': 1.0}, {'km': 2.0}]
+    assert len({id(key) for a in actions for key in a.measurement_units_by_amount}) == 1
+
+
+def test_fast_uuid_decoding_matches_uuid_constructor():
+    """The canonical-form fast path returns exactly what UUID() would, and errors the same way"""
+    for text in [str(uuid.uuid4()), str(uuid.uuid4()).upper(), '{12345678-1234-5678-1234-567812345678}']:
+        decoded = _decode_uuid(text)
+        assert decoded == UUID(text) and hash(decoded) == hash(UUID(text))
+        assert decoded.is_safe == UUID(text).is_safe
+    with pytest.raises(ValueError):
+        _decode_uuid('zzzzzzzz-zzzz-zzzz-zzzz-zzzzzzzzzzzz')
+
+
+def test_deserialize_many_memoizes_repeated_values():
+    """Repeated timestamps decode once and are shared; unique ones are still correct"""
+    rows = [_stored_action(f'Run {n}') for n in range(6)]
+    for n, row in enumerate(rows):
+        row['start_time'] = '2025-10-01T07:00:00' if n % 2 else '2025-10-02T07:00:00'
+
+    actions = deserialize_many(rows, Action, json_decode=True)
+
+    assert actions[1].start_time is actions[3].start_time
+    assert actions[0].start_time == datetime(2025, 10, 2, 7)
+    assert [str(a.uuid_id) for a in actions] == [r['uuid_id'] for r in rows]
+    assert [a.start_time for a in deserialize_many(rows, Action, memo_size=0)] == [a.start_time for a in actions]
+
+
+def test_uuid_as_str_keeps_ids_as_text():
+    """uuid_as_str skips UUID objects; serializing the entity gives the same record back"""
+    rows = [_stored_action('Run'), _stored_action('Walk')]
+
+    actions = deserialize_many(rows, Action, json_decode=True, uuid_as_str=True)
+
+    assert [a.uuid_id for a in actions] == [r['uuid_id'] for r in rows]
+    assert serialize(actions[0], include_type=False, json_encode=True) == rows[0]
+    assert deserialize(rows[0], Action, uuid_as_str=True).uuid_id == rows[0]['uuid_id']
@@ -0,0 +1,146 @@
+"""
+Tests for StorageSession: identity map and unit of work shared by storage services.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from categoriae.actions import Action
+from categoriae.goals import Goal
+from rhetorica.progress_storage import ActionGoalProgressStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService
+from rhetorica.storage_session import StorageSession, current_session
+
+
+def _count_queries(db, monkeypatch):
+    queried = []
+    original_query = db.query
+    monkeypatch.setattr(db, 'query', lambda table, *a, **k: queried.append(table) or original_query(table, *a, **k))
+    return queried
+
+
+def test_identity_map_dedupes_loads(test_db, monkeypatch):
+    """One instance per (table, uuid_id); loaded entities aren't queried again"""
+    db, _ = test_db
+    stored = ActionStorageService(database=db).store_many_instances(
+        [Action(f'Run {n}', log_time=datetime(2025, 10, 1 + n)) for n in range(3)])
+    session = StorageSession(db)
+    actions = ActionStorageService(session=session)
+    other = ActionStorageService(session=session)
+
+    everything = actions.get_all()
+    queried = _count_queries(db, monkeypatch)
+    first = other.get_by_uuid(stored[0].uuid_id)
+
+    assert first is next(a for a in everything if a.uuid_id == stored[0].uuid_id)
+    assert first is not stored[0]  # stored outside the session
+    assert set(map(id, other.get_by_uuids(str(a.uuid_id) for a in stored))) == set(map(id, everything))
+    assert queried == []
+    assert actions.get_all()[0] in everything  # re-query hands back mapped instances
+
+
+def test_relationships_share_session_entities(test_db, monkeypatch):
+    """get_relationships reuses entities the request already loaded"""
+    db, _ = test_db
+    goal = GoalStorageService(database=db).store_single_instance(Goal(title='Run', measurement_target=10.0))
+    runs = ActionStorageService(database=db).store_many_instances(
+        [Action(f'Run {n}', log_time=datetime(2025, 10, 1 + n)) for n in range(2)])
+    for run in runs:
+        ActionGoalProgressStorageService(database=db).create_manual_match(run.uuid_id, goal.uuid_id, 2.0)
+
+    with StorageSession(db) as session:
+        loaded_goal = GoalStorageService(database=db).get_by_uuid(goal.uuid_id)
+        progress = ActionGoalProgressStorageService(database=db)
+        queried = _count_queries(db, monkeypatch)
+        relationships = progress.get_relationships(goal_id=goal.uuid_id)
+
+        assert progress.goal_service.session is session
+        assert all(r.goal is loaded_goal for r in relationships)
+        assert queried.count('goals') == 0 and queried.count('actions') == 1
+    assert current_session() is None
+
+
+def test_commit_writes_pending_in_one_transaction(test_db, monkeypatch):
+    """Queued inserts, updates and deletes land together at commit()"""
+    db, _ = test_db
+    existing, doomed = ActionStorageService(database=db).store_many_instances(
+        [Action('Walk', log_time=datetime(2025, 10, 1)), Action('Swim', log_time=datetime(2025, 10, 2))])
+    session = StorageSession(db)
+    actions = ActionStorageService(session=session)
+
+    walk = actions.get_by_uuid(existing.uuid_id)
+    walk.title = 'Long walk'
+    session.add(walk)
+    session.add(Action('Bike', log_time=datetime(2025, 10, 3)))
+    session.delete(actions.get_by_uuid(doomed.uuid_id))
+    assert sorted(r['title'] for r in db.query('actions')) == ['Swim', 'Walk']
+
+    transactions = []
+    original_transaction = db.transaction
+    monkeypatch.setattr(db, 'transaction', lambda: transactions.append(1) or original_transaction())
+    assert session.commit() == 3
+
+    assert transactions == [1]
+    assert sorted(r['title'] for r in db.query('actions')) == ['Bike', 'Long walk']
+    assert actions.get_by_uuid(doomed.uuid_id) is None
+    assert not session.has_pending
+
+
+def test_rollback_and_failed_context(test_db):
+    """Nothing queued is written when the session rolls back or its block raises"""
+    db, _ = test_db
+    session = StorageSession(db)
+    actions = ActionStorageService(session=session)
+    session.add(Action('Run', log_time=datetime(2025, 10, 1)))
+    session.rollback()
+    assert session.commit() == 0
+
+    with pytest.raises(RuntimeError):
+        with StorageSession(db) as scoped:
+            assert ActionStorageService(database=db).session is scoped
+            scoped.add(Action('Row', log_time=datetime(2025, 10, 1)))
+            raise RuntimeError('request failed')
+
+    assert db.query('actions') == []
+    with pytest.raises(ValueError):
+        session.add(Goal(title='No goal service in this session'))
+    with pytest.raises(ValueError):
+        ActionStorageService(database=db, session=StorageSession(object()))
+
+
+def test_streaming_does_not_grow_identity_map(test_db):
+    """iter_all()/iter_in_period() reuse mapped instances but never map what they stream"""
+    db, _ = test_db
+    stored = ActionStorageService(database=db).store_many_instances(
+        [Action(f'Run {n}', log_time=datetime(2025, 10, 1, n)) for n in range(20)])
+
+    with StorageSession(db) as session:
+        actions = ActionStorageService(database=db)
+        loaded = actions.get_by_uuid(stored[0].uuid_id)
+
+        streamed = list(actions.iter_all(batch_size=3))
+        in_period = list(actions.iter_in_period(datetime(2025, 10, 1), batch_size=3))
+
+        assert len(streamed) == len(in_period) == 20
+        assert any(a is loaded for a in streamed)
+        assert len(session._identity) == 1
+
+
+def test_delete_defers_io_to_commit(test_db, monkeypatch):
+    """Queuing a delete runs no query; never-stored entities are dropped at commit()"""
+    db, _ = test_db
+    stored = ActionStorageService(database=db).store_single_instance(Action('Swim', log_time=datetime(2025, 10, 2)))
+    session = StorageSession(db)
+    actions = ActionStorageService(session=session)
+    doomed = actions.get_by_uuid(stored.uuid_id)
+    draft = session.add(Action('Draft', log_time=datetime(2025, 10, 3)))
+
+    queried = _count_queries(db, monkeypatch)
+    session.delete(draft)
+    session.delete(doomed)
+    assert queried == []
+
+    assert session.commit() == 1
+    assert db.query('actions') == []
+    assert session.get('actions', draft.uuid_id) is None